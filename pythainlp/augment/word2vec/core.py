@@ -5,11 +5,13 @@ from __future__ import annotations
 
 import itertools
 import logging
-from typing import TYPE_CHECKING, Callable, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 if TYPE_CHECKING:
     from gensim.models.keyedvectors import KeyedVectors
 
+    from pythainlp.word_vector import WordVectorIndex
+
 
 class _DuplicateWordFilter(logging.Filter):
     """Suppress gensim's 'duplicate word' warnings for word2vec files."""
@@ -22,16 +24,23 @@ class Word2VecAug:
     tokenizer: Callable[[str], list[str]]
     model: "KeyedVectors"
     dict_wv: list[str]
+    index: Optional["WordVectorIndex"]
 
     def __init__(
         self,
         model: Union[str, "KeyedVectors"],
         tokenize: Callable[[str], list[str]],
         type: str = "file",
+        index: Optional["WordVectorIndex"] = None,
     ) -> None:
         """:param Union[str, KeyedVectors] model: path of model or KeyedVectors instance
         :param Callable[[str], list[str]] tokenize: tokenize function
         :param str type: model type (file, binary, model)
+        :param WordVectorIndex index: approximate nearest-neighbor index of
+            the model (see :class:`pythainlp.word_vector.WordVectorIndex`),
+            to look up similar words of all tokens of a sentence at once.
+            If None (default), each token is compared with the whole
+            vocabulary.
         """
         import gensim.models.keyedvectors as word2vec
 
@@ -54,16 +63,25 @@ class Word2VecAug:
         else:
             self.model = model
         self.dict_wv: list[str] = list(self.model.key_to_index.keys())
+        self.index = index
 
     def modify_sent(self, sent: list[str], p: float = 0.7) -> list[list[str]]:
         """:param list[str] sent: list of tokens
         :param float p: probability
         :rtype: list[list[str]]
         """
+        key_to_index = self.model.key_to_index
+        if self.index is not None:
+            rows = [key_to_index[i] for i in sent if i in key_to_index]
+            similar = iter(self._similar_words(rows, p))
+
         list_sent_new = []
         for i in sent:
-            if i in self.dict_wv:
-                w = [j for j, v in self.model.most_similar(i) if v >= p]
+            if i in key_to_index:
+                if self.index is not None:
+                    w = next(similar)
+                else:
+                    w = [j for j, v in self.model.most_similar(i) if v >= p]
                 if w == []:
                     list_sent_new.append([i])
                 else:
@@ -72,6 +90,21 @@ class Word2VecAug:
                 list_sent_new.append([i])
         return list_sent_new
 
+    def _similar_words(self, rows: list[int], p: float) -> list[list[str]]:
+        """Top-10 similar words of words at ``rows``, from the index."""
+        if not rows or self.index is None:
+            return []
+        ids, scores = self.index.search_rows(rows, topn=10)
+        index_to_key = self.model.index_to_key
+        return [
+            [
+                index_to_key[j]
+                for j, v in zip(row_ids.tolist(), row_scores.tolist())
+                if j >= 0 and v >= p
+            ]
+            for row_ids, row_scores in zip(ids, scores)
+        ]
+
     def augment(
         self, sentence: str, n_sent: int = 1, p: float = 0.7
     ) -> list[tuple[str, ...]]:
@@ -5,14 +5,26 @@ from __future__ import annotations
 
 import re
 import sys
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypedDict, Union, overload
+import time
+import warnings
+from collections.abc import Iterable, Mapping
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    TypedDict,
+    Union,
+    cast,
+    overload,
+)
 
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
     from numpy.typing import NDArray
 
+from pythainlp.tools.core import _bounded_pool_map, _resolve_num_workers
+
 SEPARATOR: str = "|"
 
 # regex for removing one space surrounded by separators, i.e. | |
@@ -29,6 +41,15 @@ TAG_RX: re.Pattern[str] = re.compile(r"<\/?[A-Z]+>")
 # regex for removing trailing separators, i.e.  a|dog| -> a|dog
 TAILING_SEP_RX: re.Pattern[str] = re.compile(f"{re.escape(SEPARATOR)}$")
 
+# word_tokenize() engines timed by benchmark_speed() by default,
+# those that need no extra dependencies
+DEFAULT_SPEED_ENGINES: tuple[str, ...] = (
+    "newmm",
+    "newmm-safe",
+    "longest",
+    "mm",
+)
+
 
 class CharLevelStat(TypedDict):
     """Character-level confusion matrix statistics for tokenization."""
@@ -116,51 +137,246 @@ def _flatten_result(
     }
 
 
-def benchmark(ref_samples: list[str], samples: list[str]) -> "pd.DataFrame":
+def _benchmark_pair(
+    i: int, r: str, s: str
+) -> Union[dict[str, Union[int, str]], None]:
+    try:
+        r, s = preprocessing(r), preprocessing(s)
+        if not (r and s):
+            return None
+        stats = compute_stats(r, s)
+        flat_stats: dict[str, Union[int, str]] = _flatten_result(stats)
+        flat_stats["expected"] = r
+        flat_stats["actual"] = s
+        return flat_stats
+    except Exception as exc:
+        reason = """
+[Error]
+Reason: %s
+
+Pair (i=%d)
+--- label
+%s
+--- sample
+%s
+""" % (
+            sys.exc_info(),
+            i,
+            r,
+            s,
+        )
+        raise SystemExit(reason) from exc
+
+
+def _benchmark_chunk(
+    pairs: list[tuple[int, str, str]],
+) -> list[dict[str, Union[int, str]]]:
+    results = []
+    for i, r, s in pairs:
+        flat_stats = _benchmark_pair(i, r, s)
+        if flat_stats is not None:
+            results.append(flat_stats)
+    return results
+
+
+def benchmark(
+    ref_samples: list[str],
+    samples: list[str],
+    num_workers: Optional[int] = 1,
+    chunk_size: int = 256,
+) -> "pd.DataFrame":
     """Performance benchmarking for samples.
 
     See :func:`pythainlp.benchmarks.word_tokenization.compute_stats`
     for computed metrics.
 
+    Pairs of samples can be evaluated in parallel using a pool of
+    worker processes, sent to the workers in chunks of ``chunk_size``.
+    The result is the same as evaluating them in the current process.
+
     :param list[str] ref_samples: ground truth
     :param list[str] samples: samples to evaluate
+    :param int num_workers: number of worker processes.
+        1 (default) evaluates in the current process,
+        None uses the number of CPUs.
+    :param int chunk_size: number of pairs sent to a worker at a time
 
     :return: dataframe with shape ``len(samples) × len(metrics)``
     :rtype: pandas.DataFrame
     """
     import pandas as pd
 
-    results = []
-    for i, (r, s) in enumerate(zip(ref_samples, samples)):
-        try:
-            r, s = preprocessing(r), preprocessing(s)
-            if r and s:
-                stats = compute_stats(r, s)
-                flat_stats: dict[str, Union[int, str]] = _flatten_result(stats)
-                flat_stats["expected"] = r
-                flat_stats["actual"] = s
-                results.append(flat_stats)
-        except Exception as exc:
-            reason = """
-[Error]
-Reason: %s
+    num_workers = _resolve_num_workers(num_workers, chunk_size)
 
-Pair (i=%d)
---- label
-%s
---- sample
-%s
-""" % (
-                sys.exc_info(),
-                i,
-                r,
-                s,
-            )
-            raise SystemExit(reason) from exc
+    pairs = ((i, r, s) for i, (r, s) in enumerate(zip(ref_samples, samples)))
+    if num_workers == 1:
+        results = _benchmark_chunk(list(pairs))
+    else:
+        results = list(
+            _bounded_pool_map(_benchmark_chunk, pairs, num_workers, chunk_size)
+        )
 
     return pd.DataFrame(results)
 
 
+def _speed_run(
+    engine: str,
+    texts: list[str],
+    ref_samples: Optional[list[str]],
+) -> dict[str, float]:
+    import numpy as np
+
+    from pythainlp.tokenize import word_tokenize
+
+    # Load dictionaries and models before timing
+    word_tokenize(texts[0], engine=engine)
+
+    latencies = np.empty(len(texts), dtype=np.float64)
+    tokenized = []
+    for i, text in enumerate(texts):
+        start = time.perf_counter()
+        words = word_tokenize(text, engine=engine)
+        latencies[i] = time.perf_counter() - start
+        tokenized.append(words)
+
+    seconds = float(latencies.sum())
+    num_tokens = sum(len(words) for words in tokenized)
+    num_chars = sum(len(text) for text in texts)
+
+    result: dict[str, float] = {
+        "texts": len(texts),
+        "tokens": num_tokens,
+        "chars": num_chars,
+        "seconds": seconds,
+        "tokens_per_sec": num_tokens / seconds if seconds else 0.0,
+        "chars_per_sec": num_chars / seconds if seconds else 0.0,
+        "latency_p50_ms": float(np.percentile(latencies, 50)) * 1000,
+        "latency_p99_ms": float(np.percentile(latencies, 99)) * 1000,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+    if ref_samples is not None:
+        samples = [SEPARATOR.join(words) for words in tokenized]
+        df = benchmark(ref_samples, samples)
+        correct = float(df["word_level:correctly_tokenized_words"].sum())
+        precision = correct / float(
+            df["word_level:total_words_in_sample"].sum()
+        )
+        recall = correct / float(
+            df["word_level:total_words_in_ref_sample"].sum()
+        )
+        result["word_level:precision"] = precision
+        result["word_level:recall"] = recall
+        result["word_level:f1"] = _f1(precision, recall)
+
+    return result
+
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def benchmark_speed(
+    texts: list[str],
+    engines: Optional[Iterable[str]] = None,
+    ref_samples: Optional[list[str]] = None,
+    isolate: bool = True,
+) -> "pd.DataFrame":
+    """Speed benchmarking for word tokenization engines.
+
+    Times :func:`pythainlp.tokenize.word_tokenize` with each engine
+    on the same texts, one text at a time.
+    Dictionaries and models are loaded before timing starts.
+
+    The result has one row for each engine, with these columns:
+    ``texts``, ``tokens``, ``chars``, ``seconds`` (total time),
+    ``tokens_per_sec``, ``chars_per_sec``,
+    ``latency_p50_ms`` and ``latency_p99_ms`` (per text),
+    and ``peak_rss_mb`` (peak resident memory of the process,
+    not available on Windows).
+    If ``ref_samples`` is given, word-level ``word_level:precision``,
+    ``word_level:recall`` and ``word_level:f1`` columns are added,
+    so engines can be compared on both speed and quality.
+
+    Engines that cannot be imported are skipped with a warning.
+
+    :param list[str] texts: texts to be tokenized
+    :param Iterable[str] engines: names of the engines to be timed
+        (default: :data:`DEFAULT_SPEED_ENGINES`)
+    :param list[str] ref_samples: ground truth of ``texts``,
+        words separated by ``"|"`` (optional)
+    :param bool isolate: True (default) to run each engine in a new
+        process, so ``peak_rss_mb`` is measured for that engine only
+
+    :return: dataframe with one row for each engine
+    :rtype: pandas.DataFrame
+
+    :Example:
+
+        >>> from pythainlp.benchmarks.word_tokenization import (
+        ...     benchmark_speed,
+        ... )
+        >>> df = benchmark_speed(
+        ...     ["ฉันรักภาษาไทย", "สวัสดีครับ"],
+        ...     engines=["newmm", "longest"],
+        ...     ref_samples=["ฉัน|รัก|ภาษาไทย", "สวัสดี|ครับ"],
+        ... )  # doctest: +SKIP
+        >>> df.loc["newmm", "word_level:f1"]  # doctest: +SKIP
+        1.0
+    """
+    import pandas as pd
+
+    if not texts:
+        raise ValueError("texts must not be empty.")
+    if ref_samples is not None and len(ref_samples) != len(texts):
+        raise ValueError("texts and ref_samples must have the same length.")
+    if engines is None:
+        engines = DEFAULT_SPEED_ENGINES
+
+    results = {}
+    for engine in engines:
+        try:
+            if isolate:
+                results[engine] = _speed_run_isolated(
+                    engine, texts, ref_samples
+                )
+            else:
+                results[engine] = _speed_run(engine, texts, ref_samples)
+        except ImportError as exc:
+            warnings.warn(
+                f"Skipping engine {engine!r}: {exc}",
+                stacklevel=2,
+            )
+
+    df = pd.DataFrame.from_dict(results, orient="index")
+    df.index.name = "engine"
+    return df
+
+
+def _speed_run_isolated(
+    engine: str,
+    texts: list[str],
+    ref_samples: Optional[list[str]],
+) -> dict[str, float]:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # A spawned process does not inherit the memory of this one
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_speed_run, engine, texts, ref_samples).result()
+
+
 def preprocessing(txt: str, remove_space: bool = True) -> str:
     """Clean up text before performing evaluation.
 
@@ -170,18 +386,25 @@ def preprocessing(txt: str, remove_space: bool = True) -> str:
     :return: preprocessed text
     :rtype: str
     """
-    txt = re.sub(SURROUNDING_SEPS_RX, "", txt)
+    txt = SURROUNDING_SEPS_RX.sub("", txt)
 
     if remove_space:
-        txt = re.sub(r"\s+", "", txt)
+        # Same as removing r"\s+", without a regex pass
+        txt = "".join(txt.split())
 
-    txt = re.sub(MULTIPLE_SEPS_RX, SEPARATOR, txt)
+    if SEPARATOR * 2 in txt:
+        txt = MULTIPLE_SEPS_RX.sub(SEPARATOR, txt)
 
-    txt = re.sub(TAG_RX, "", txt)
+    if "<" in txt:
+        txt = TAG_RX.sub("", txt)
 
-    txt = re.sub(TAILING_SEP_RX, "", txt).strip()
+    if remove_space:
+        # No line breaks left for "$" to match before
+        if txt.endswith(SEPARATOR):
+            txt = txt[: -len(SEPARATOR)]
+        return txt
 
-    return txt
+    return TAILING_SEP_RX.sub("", txt).strip()
 
 
 def compute_stats(
@@ -210,36 +433,25 @@ def compute_stats(
     ref_sample_arr = _binary_representation(ref_sample)
     sample_arr = _binary_representation(raw_sample)
 
-    # Compute character-level statistics
-    c_pos_pred, c_neg_pred = (
-        np.argwhere(sample_arr == 1),
-        np.argwhere(sample_arr == 0),
-    )
-
-    c_pos_pred = c_pos_pred[c_pos_pred < ref_sample_arr.shape[0]]
-    c_neg_pred = c_neg_pred[c_neg_pred < ref_sample_arr.shape[0]]
+    # Compute character-level statistics,
+    # over the characters that are in both samples
+    n = min(ref_sample_arr.shape[0], sample_arr.shape[0])
+    ref_pos = ref_sample_arr[:n] == 1
+    pred_pos = sample_arr[:n] == 1
 
-    c_tp: int = int(np.sum(ref_sample_arr[c_pos_pred] == 1))
-    c_fp: int = int(np.sum(ref_sample_arr[c_pos_pred] == 0))
+    c_tp: int = int(np.count_nonzero(pred_pos & ref_pos))
+    c_fp: int = int(np.count_nonzero(pred_pos & ~ref_pos))
 
-    c_tn: int = int(np.sum(ref_sample_arr[c_neg_pred] == 0))
-    c_fn: int = int(np.sum(ref_sample_arr[c_neg_pred] == 1))
+    c_tn: int = int(np.count_nonzero(~pred_pos & ~ref_pos))
+    c_fn: int = int(np.count_nonzero(~pred_pos & ref_pos))
 
     # Compute word-level statistics
+    tokenization_indicators = _correctly_tokenized(ref_sample_arr, sample_arr)
 
-    # Find correctly tokenized words in the reference sample
-    word_boundaries = _find_word_boundaries(ref_sample_arr)
-
-    # Find correctly tokenized words in the sample
-    ss_boundaries = _find_word_boundaries(sample_arr)
-    tokenization_indicators = _find_words_correctly_tokenized(
-        word_boundaries, ss_boundaries
+    correctly_tokenized_words: int = int(
+        np.count_nonzero(tokenization_indicators)
     )
 
-    correctly_tokenized_words: int = int(np.sum(tokenization_indicators))
-
-    tokenization_indicators_str = list(map(str, tokenization_indicators))
-
     return {
         "char_level": CharLevelStat(
             tp=c_tp,
@@ -249,15 +461,59 @@ def compute_stats(
         ),
         "word_level": WordLevelStat(
             correctly_tokenized_words=correctly_tokenized_words,
-            total_words_in_sample=int(np.sum(sample_arr)),
-            total_words_in_ref_sample=int(np.sum(ref_sample_arr)),
+            total_words_in_sample=int(np.count_nonzero(sample_arr)),
+            total_words_in_ref_sample=int(np.count_nonzero(ref_sample_arr)),
         ),
         "global_": GlobalStat(
-            tokenization_indicators="".join(tokenization_indicators_str),
+            tokenization_indicators=(tokenization_indicators + ord("0"))
+            .tobytes()
+            .decode("ascii"),
         ),
     }
 
 
+def _correctly_tokenized(
+    ref_bin_reps: "NDArray[np.int8]", bin_reps: "NDArray[np.int8]"
+) -> "NDArray[np.uint8]":
+    """Find whether each word is correctly tokenized.
+
+    Same as :func:`_find_words_correctly_tokenized` on the word boundaries
+    of both binary representations, without building the boundaries.
+
+    :param numpy.typing.NDArray[numpy.int8] ref_bin_reps: binary
+        representation of the reference tokenization
+    :param numpy.typing.NDArray[numpy.int8] bin_reps: binary
+        representation of the predicted tokenization
+
+    :return: {0, 1} sequence; 1 means the word is tokenized correctly
+    :rtype: numpy.typing.NDArray[numpy.uint8]
+    """
+    import numpy as np
+
+    n = ref_bin_reps.shape[0]
+    start_idx = np.flatnonzero(bin_reps)
+    end_idx = np.append(start_idx[1:], bin_reps.shape[0])
+
+    # The end of the reference is also a word boundary
+    ref_bounds = np.append(ref_bin_reps != 0, True)
+    # Number of reference boundaries before each position
+    ref_counts = np.concatenate(([0], np.cumsum(ref_bounds)))
+
+    # A word is in the reference if it starts and ends at reference
+    # boundaries and has no reference boundary inside
+    in_ref = end_idx <= n
+    start_idx = np.where(in_ref, start_idx, 0)
+    end_idx = np.where(in_ref, end_idx, 0)
+    correct = (
+        in_ref
+        & ref_bounds[start_idx]
+        & ref_bounds[end_idx]
+        & (ref_counts[end_idx] - ref_counts[start_idx] == 1)
+    )
+
+    return cast("NDArray[np.uint8]", correct.astype(np.uint8))
+
+
 def _binary_representation(
     txt: str, verbose: bool = False
 ) -> "NDArray[np.int8]":
@@ -274,24 +530,18 @@ def _binary_representation(
     """
     import numpy as np
 
-    chars = np.array(list(txt))
-
-    boundary = np.argwhere(chars == SEPARATOR).reshape(-1)
-    boundary = boundary - np.array(range(boundary.shape[0]))
+    # One UTF-32 code unit for each character
+    codes = np.frombuffer(txt.encode("utf-32-le"), dtype="<u4")
+    boundary = np.flatnonzero(codes == ord(SEPARATOR))
+    # Position of each separator in the text without separators
+    boundary = boundary - np.arange(boundary.shape[0])
 
     bin_rept = np.zeros(len(txt) - boundary.shape[0], dtype=np.int8)
-    bin_rept[list(boundary) + [0]] = 1
-
-    sample_wo_seps = list(txt.replace(SEPARATOR, ""))
-
-    # sanity check
-    if len(sample_wo_seps) != len(bin_rept):
-        raise ValueError(
-            f"Length mismatch: sample_wo_seps={len(sample_wo_seps)}, "
-            f"bin_rept={len(bin_rept)}"
-        )
+    bin_rept[boundary] = 1
+    bin_rept[0] = 1
 
     if verbose:
+        sample_wo_seps = txt.replace(SEPARATOR, "")
         for c, m in zip(sample_wo_seps, bin_rept):
             print("%s -- %d" % (c, m))
 
@@ -3,13 +3,43 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import bz2
 import gzip
 import json
-from typing import TYPE_CHECKING, Any, Optional
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from functools import partial
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Optional, cast
+
+from pythainlp.tools.core import _bounded_pool_map, _resolve_num_workers
+from pythainlp.tools.path import _write_atomic
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from numpy.typing import NDArray
 
+_COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.compress,
+    "zlib": zlib.compress,
+    "bz2": bz2.compress,
+    "lzma": lzma.compress,
+}
+
+# Binary model file layout: header, then texts and labels of the
+# training data as UTF-8 text with int32 character offsets,
+# and the int32 compressed lengths of the texts.
+_MAGIC: bytes = b"PTGZ"
+_FORMAT_VERSION: int = 1
+_HEADER: struct.Struct = struct.Struct("<4sBBxxIII")
+_BYTEORDERS: tuple[str, str] = ("little", "big")
+
+# model used by worker processes of GzipModel.predict_batch()
+_worker_model: Optional[GzipModel] = None
+
 
 class GzipModel:
     """This class is a re-implementation of
@@ -20,18 +50,30 @@ class GzipModel:
         Default is None.
     :param str model_path: Path for loading model (if you saved the model).
         Default is empty string.
+    :param str compressor: compressor for the compression distance,
+        one of *gzip* (default), *zlib*, *bz2*, and *lzma*.
+        Ignored when loading a model, which keeps its own compressor.
     """
 
     cx2_list: list[int]
     training_data: "NDArray[Any]"
+    # Also the compressor of models pickled before it could be chosen
+    compressor: str = "gzip"
 
     def __init__(
         self,
         training_data: Optional[list[tuple[str, str]]] = None,
         model_path: str = "",
+        compressor: str = "gzip",
     ) -> None:
         import numpy as np
 
+        if compressor not in _COMPRESSORS:
+            raise ValueError(
+                f"Compressor '{compressor}' is not supported. "
+                f"Supported: {', '.join(_COMPRESSORS)}"
+            )
+        self.compressor = compressor
         if model_path:
             self.load(model_path)
         else:
@@ -39,12 +81,23 @@ class GzipModel:
             self.cx2_list = self.train()
 
     def train(self) -> list[int]:
-        temp_list = []
-        for i in range(len(self.training_data)):
-            temp_list.append(
-                len(gzip.compress(self.training_data[i][0].encode("utf-8")))
-            )
-        return temp_list
+        compress = _COMPRESSORS[self.compressor]
+        return [len(compress(x2)) for x2 in self._training_bytes()]
+
+    def _column(self, i: int) -> list[str]:
+        """Texts (0) or labels (1) of the training data."""
+        if not len(self.training_data):
+            return []
+        return cast("list[str]", self.training_data[:, i].tolist())
+
+    def _training_bytes(self) -> list[bytes]:
+        """Training texts encoded once, for all predictions."""
+        cached = getattr(self, "_encoded", None)
+        if cached is None or cached[0] is not self.training_data:
+            encoded = [x2.encode("utf-8") for x2 in self._column(0)]
+            cached = (self.training_data, encoded)
+            self._encoded = cached
+        return cached[1]
 
     def predict(self, x1: str, k: int = 1) -> str:
         """Predict the label for the given text.
@@ -75,47 +128,207 @@ class GzipModel:
         """
         import numpy as np
 
-        cx1 = len(gzip.compress(x1.encode("utf-8")))
-        disance_from_x1 = []
-        for i in range(len(self.cx2_list)):
-            x2 = self.training_data[i][0]
-            cx2 = self.cx2_list[i]
-            x1x2 = "".join([x1, x2])
-            cx1x2 = len(gzip.compress(x1x2.encode("utf-8")))
-            # normalized compression distance
-            ncd = (cx1x2 - min(cx1, cx2)) / max(cx1, cx2)
-            disance_from_x1.append(ncd)
-
-        sorted_idx = np.argsort(np.array(disance_from_x1))
+        compress = _COMPRESSORS[self.compressor]
+        x1_bytes = x1.encode("utf-8")
+        cx1 = len(compress(x1_bytes))
+        cx1x2 = np.array(
+            [len(compress(x1_bytes + x2)) for x2 in self._training_bytes()],
+            dtype=np.float64,
+        )
+        cx2 = np.array(self.cx2_list, dtype=np.float64)
+        # normalized compression distance
+        distance_from_x1 = (cx1x2 - np.minimum(cx1, cx2)) / np.maximum(
+            cx1, cx2
+        )
+
+        sorted_idx = np.argsort(distance_from_x1)
         top_k_class = self.training_data[sorted_idx[:k], 1]
         _, counts = np.unique(top_k_class, return_counts=True)
         predict_class = str(top_k_class[counts.argmax()])
 
         return predict_class
 
-    def save(self, path: str) -> None:
+    def predict_batch(
+        self,
+        texts: Iterable[str],
+        k: int = 1,
+        num_workers: Optional[int] = 1,
+        chunk_size: int = 16,
+    ) -> list[str]:
+        """Predict the labels for many texts.
+
+        Gives the same labels as :meth:`predict` for each text.
+        Texts can be spread across a pool of worker processes,
+        each with its own copy of the model.
+
+        :param Iterable[str] texts: texts that we want to predict labels for
+        :param int k: number of nearest neighbors to consider (default: 1)
+        :param int num_workers: number of worker processes.
+            1 (default) predicts in the current process,
+            None uses the number of CPUs.
+        :param int chunk_size: number of texts sent to a worker at a time
+        :return: predicted labels, one for each text
+        :rtype: list[str]
+
+        :Example:
+
+            >>> from pythainlp.classify import GzipModel  # doctest: +SKIP
+            >>> model = GzipModel(
+            ...     [("ดีนะครับ", "Positive"), ("ขับรถแย่มาก", "Negative")]
+            ... )  # doctest: +SKIP
+            >>> model.predict_batch(
+            ...     ["ดีใจ", "แย่"], num_workers=2
+            ... )  # doctest: +SKIP
+            ['Positive', 'Negative']
+        """
+        num_workers = _resolve_num_workers(num_workers, chunk_size)
+
+        if num_workers == 1:
+            return [self.predict(text, k=k) for text in texts]
+        return list(
+            _bounded_pool_map(
+                partial(_predict_chunk, k=k),
+                texts,
+                num_workers,
+                chunk_size,
+                initializer=_init_predict_worker,
+                initargs=(self,),
+            )
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_encoded", None)  # rebuilt on first prediction
+        return state
+
+    def save(self, path: str, binary: bool = False) -> None:
         """Save model to file.
 
         :param str path: path to save model
+        :param bool binary: save in a compact binary format instead of
+            JSON. :meth:`load` reads either format.
         """
+        if binary:
+            self._save_binary(path, self.compressor)
+            return
+
+        data: dict[str, Any] = {
+            "training_data": self.training_data.tolist(),
+            "cx2_list": self.cx2_list,
+        }
+        if self.compressor != "gzip":
+            data["compressor"] = self.compressor
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "training_data": self.training_data.tolist(),
-                    "cx2_list": self.cx2_list,
-                },
-                f,
-                ensure_ascii=False,
-            )
+            json.dump(data, f, ensure_ascii=False)
+
+    def _save_binary(self, path: str, compressor: str) -> None:
+        texts = self._column(0)
+        labels = self._column(1)
+        text_offsets = _offsets(texts)
+        label_offsets = _offsets(labels)
+        text_bytes = "".join(texts).encode("utf-8")
+        label_bytes = "".join(labels).encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            _BYTEORDERS.index(sys.byteorder),
+            len(texts),
+            len(text_bytes),
+            len(label_bytes),
+        )
+        compressor_bytes = compressor.encode("ascii")
+
+        def write(f: BinaryIO) -> None:
+            f.write(header)
+            f.write(bytes([len(compressor_bytes)]))
+            f.write(compressor_bytes)
+            f.write(text_offsets.tobytes())
+            f.write(label_offsets.tobytes())
+            f.write(array("i", self.cx2_list).tobytes())
+            f.write(text_bytes)
+            f.write(label_bytes)
+
+        _write_atomic(path, write)
 
     def load(self, path: str) -> None:
         """Load model from file.
 
-        :param str path: path to load model from
+        :param str path: path to load model from,
+            saved by :meth:`save` in either format
         """
         import numpy as np
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.cx2_list = data["cx2_list"]
-            self.training_data = np.array(data["training_data"])
+        with open(path, "rb") as f:
+            raw = f.read()
+        if raw[: len(_MAGIC)] == _MAGIC:
+            self._load_binary(raw, path)
+            return
+
+        data = json.loads(raw.decode("utf-8"))
+        self.cx2_list = data["cx2_list"]
+        self.training_data = np.array(data["training_data"])
+        self.compressor = data.get("compressor", "gzip")
+
+    def _load_binary(self, raw: bytes, path: str) -> None:
+        import numpy as np
+
+        if len(raw) < _HEADER.size + 1:
+            raise ValueError(f"{path} is truncated or corrupted.")
+        magic, version, byteorder, n, text_size, label_size = (
+            _HEADER.unpack_from(raw)
+        )
+        if version != _FORMAT_VERSION or byteorder > 1:
+            raise ValueError(
+                f"{path} has unsupported model file version {version}."
+            )
+        pos = _HEADER.size
+        name_size = raw[pos]
+        compressor = raw[pos + 1 : pos + 1 + name_size].decode("ascii")
+        pos += 1 + name_size
+        if compressor not in _COMPRESSORS:
+            raise ValueError(f"{path} uses unknown compressor {compressor}.")
+        if len(raw) != pos + 4 * (3 * n + 2) + text_size + label_size:
+            raise ValueError(f"{path} is truncated or corrupted.")
+
+        ints = array("i", raw[pos : pos + 4 * (3 * n + 2)])
+        if _BYTEORDERS[byteorder] != sys.byteorder:
+            ints.byteswap()
+        pos += 4 * (3 * n + 2)
+        text = raw[pos : pos + text_size].decode("utf-8")
+        label = raw[pos + text_size :].decode("utf-8")
+        text_offsets = ints[: n + 1].tolist()
+        label_offsets = ints[n + 1 : 2 * n + 2].tolist()
+
+        self.compressor = compressor
+        self.cx2_list = ints[2 * n + 2 :].tolist()
+        self.training_data = np.array(
+            [
+                (
+                    text[text_offsets[i] : text_offsets[i + 1]],
+                    label[label_offsets[i] : label_offsets[i + 1]],
+                )
+                for i in range(n)
+            ]
+        )
+
+
+def _offsets(strings: list[str]) -> array[int]:
+    """Character offsets of strings joined together."""
+    offsets = array("i", [0])
+    total = 0
+    for s in strings:
+        total += len(s)
+        offsets.append(total)
+    return offsets
+
+
+def _init_predict_worker(model: GzipModel) -> None:
+    global _worker_model
+    _worker_model = model
+
+
+def _predict_chunk(texts: list[str], k: int) -> list[str]:
+    model = _worker_model
+    if model is None:
+        raise RuntimeError("Worker model not initialized")
+    return [model.predict(text, k=k) for text in texts]
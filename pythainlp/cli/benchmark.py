@@ -77,11 +77,43 @@ class WordTokenizationBenchmark:
             ),
         )
 
+        parser.add_argument(
+            "--num-workers",
+            type=int,
+            default=1,
+            help="Number of worker processes for the comparison",
+        )
+
+        parser.add_argument(
+            "--speed",
+            default=False,
+            action="store_true",
+            help=(
+                "Also time word tokenization engines on the text of"
+                " the test file and report their speed and accuracy"
+            ),
+        )
+
+        parser.add_argument(
+            "--engines",
+            action="store",
+            help=(
+                "Comma-separated word tokenization engines to be timed"
+                " with --speed (default: newmm,newmm-safe,longest,mm)"
+            ),
+        )
+
         args = parser.parse_args(argv)
 
-        actual = _read_file(args.input_file)
         expected = _read_file(args.test_file)
 
+        if args.speed:
+            self._benchmark_speed(args, expected)
+            if not args.input_file:
+                return
+
+        actual = _read_file(args.input_file)
+
         if len(actual) != len(expected):
             raise ValueError(
                 "Input and test files do not have the same number of samples"
@@ -102,7 +134,9 @@ class WordTokenizationBenchmark:
                 " Install them with: pip install pythainlp[benchmarks]"
             ) from e
 
-        df_raw = word_tokenization.benchmark(expected, actual)
+        df_raw = word_tokenization.benchmark(
+            expected, actual, num_workers=args.num_workers
+        )
 
         columns = [
             "char_level:tp",
@@ -187,3 +221,50 @@ class WordTokenizationBenchmark:
                 details = {"metrics": statistics, "samples": samples}
 
                 json.dump(details, f, ensure_ascii=False)
+
+    @staticmethod
+    def _benchmark_speed(
+        args: argparse.Namespace, expected: list[str]
+    ) -> None:
+        try:
+            from pythainlp.benchmarks import word_tokenization
+        except ImportError as e:
+            raise ImportError(
+                "The 'benchmarks' extra dependencies are required for this command."
+                " Install them with: pip install pythainlp[benchmarks]"
+            ) from e
+
+        engines = None
+        if args.engines:
+            engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+
+        # Raw text of the test file, without separators and tags
+        texts = [
+            word_tokenization.TAG_RX.sub("", r).replace(
+                word_tokenization.SEPARATOR, ""
+            )
+            for r in expected
+        ]
+
+        safe_print(
+            "Timing word tokenization engines on %s with %d samples in total"
+            % (args.test_file, len(texts))
+        )
+
+        df_speed = word_tokenization.benchmark_speed(
+            texts, engines=engines, ref_samples=expected
+        )
+
+        safe_print("=============== Speed Result ===============")
+
+        for engine, r in df_speed.iterrows():
+            safe_print(f"{engine}")
+            for c in [
+                "tokens_per_sec",
+                "chars_per_sec",
+                "latency_p50_ms",
+                "latency_p99_ms",
+                "peak_rss_mb",
+                "word_level:f1",
+            ]:
+                safe_print(f"{c:>40s} {r[c]:.4f}")
@@ -7,12 +7,14 @@ Has three systems to choose from: Udom83 (default), LK82, and MetaSound
 """
 
 __all__: list[str] = [
+    "PhoneticIndex",
     "complete_soundex",
     "complete_soundex_similarity",
     "lk82",
     "metasound",
     "prayut_and_somchaip",
     "soundex",
+    "soundex_batch",
     "udom83",
 ]
 
@@ -27,4 +29,5 @@ from pythainlp.soundex.udom83 import udom83
 
 DEFAULT_SOUNDEX_ENGINE: str = "udom83"
 
-from pythainlp.soundex.core import soundex
+from pythainlp.soundex.core import soundex, soundex_batch
+from pythainlp.soundex.phonetic_index import PhoneticIndex
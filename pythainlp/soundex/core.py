@@ -9,12 +9,19 @@ Complete Soundex, and Prayut & Somchaip
 
 from __future__ import annotations
 
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Optional
+
 from pythainlp.soundex import DEFAULT_SOUNDEX_ENGINE
 from pythainlp.soundex.complete_soundex import complete_soundex
 from pythainlp.soundex.lk82 import lk82
 from pythainlp.soundex.metasound import metasound
 from pythainlp.soundex.prayut_and_somchaip import prayut_and_somchaip
 from pythainlp.soundex.udom83 import udom83
+from pythainlp.tools.core import _bounded_pool_map, _resolve_num_workers
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 # Other Thai soundex systems (not implemented yet): Arun91, KSS97
 # [KSS97] https://linux.thai.net/~thep/soundex/soundex.html
@@ -86,14 +93,78 @@ def soundex(
         >>> soundex("ทราย", engine="complete_soundex")
         'ซซ1Bย0-'
     """
+    return _soundex_function(engine, length)(text)
+
+
+def _soundex_function(engine: str, length: int) -> Callable[[str], str]:
     if engine == "lk82":
-        _soundex = lk82(text)
+        return lk82
     elif engine == "prayut_and_somchaip":
-        _soundex = prayut_and_somchaip(text, length=length)
+        return partial(prayut_and_somchaip, length=length)
     elif engine == "metasound":
-        _soundex = metasound(text, length=length)
+        return partial(metasound, length=length)
     elif engine == "complete_soundex":
-        _soundex = complete_soundex(text)
+        return complete_soundex
     else:  # default, use "udom83"
-        _soundex = udom83(text)
-    return _soundex
+        return udom83
+
+
+def _soundex_chunk(texts: list[str], engine: str, length: int) -> list[str]:
+    encode = _soundex_function(engine, length)
+    codes: dict[str, str] = {}
+    result = []
+    for text in texts:
+        code = codes.get(text)
+        if code is None:
+            code = codes[text] = encode(text)
+        result.append(code)
+    return result
+
+
+def soundex_batch(
+    texts: Iterable[str],
+    engine: str = DEFAULT_SOUNDEX_ENGINE,
+    length: int = 4,
+    num_workers: Optional[int] = 1,
+    chunk_size: int = 1024,
+) -> list[str]:
+    """Converts many Thai texts into phonetic codes.
+
+    Gives the same code as :func:`soundex` for each text.
+    The engine is looked up once for all texts,
+    and a repeated text is encoded only once
+    (once per chunk when using worker processes).
+    Texts can be spread across a pool of worker processes.
+
+    :param Iterable[str] texts: words
+    :param str engine: soundex engine, see :func:`soundex`
+    :param int length: preferred length of the Soundex code (default is 4)\
+        for metasound and prayut_and_somchaip only
+    :param int num_workers: number of worker processes.
+        1 (default) encodes in the current process,
+        None uses the number of CPUs.
+    :param int chunk_size: number of texts sent to a worker at a time
+    :return: Soundex codes, one for each text
+    :rtype: list[str]
+
+    :Example:
+
+        >>> from pythainlp.soundex import soundex_batch
+        >>> soundex_batch(["รัก", "ลัก", "บูรณการ"])
+        ['ร100000', 'ร100000', 'บ931900']
+        >>> soundex_batch(["รัก", "ลัก"], engine="metasound")
+        ['ร100', 'ล100']
+    """
+    num_workers = _resolve_num_workers(num_workers, chunk_size)
+
+    if num_workers == 1:
+        return _soundex_chunk(list(texts), engine, length)
+
+    return list(
+        _bounded_pool_map(
+            partial(_soundex_chunk, engine=engine, length=length),
+            texts,
+            num_workers,
+            chunk_size,
+        )
+    )
@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2016-2026 PyThaiNLP Project
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+"""Index of words by soundex code, for looking up words by sound."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from pythainlp.soundex import DEFAULT_SOUNDEX_ENGINE
+from pythainlp.soundex.complete_soundex import (
+    complete_soundex,
+    complete_soundex_similarity,
+)
+from pythainlp.soundex.core import _soundex_function, soundex_batch
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class PhoneticIndex:
+    """Index of words bucketed by their soundex code.
+
+    Words that sound alike share a code, so looking up a query
+    returns the words in its bucket with one dictionary lookup,
+    without comparing the query against every word.
+    Candidates can be ranked by
+    :func:`pythainlp.soundex.complete_soundex_similarity`,
+    which tells apart words that share a coarser code.
+
+    Words without a code (e.g. empty strings) are not indexed.
+
+    :param Iterable[str] words: words to be indexed (optional)
+    :param str engine: soundex engine, see :func:`pythainlp.soundex.soundex`
+    :param int length: preferred length of the Soundex code (default is 4)\
+        for metasound and prayut_and_somchaip only
+
+    :Example:
+
+        >>> from pythainlp.soundex import PhoneticIndex
+        >>> index = PhoneticIndex(["สมชาย", "สมชัย", "สมศรี", "มานี"])
+        >>> index.candidates("ซมชาย")
+        ['สมชาย', 'สมชัย']
+        >>> index.search("สมชาย")  # doctest: +SKIP
+        [('สมชาย', 1.0), ('สมชัย', 0.95...)]
+    """
+
+    def __init__(
+        self,
+        words: Optional[Iterable[str]] = None,
+        engine: str = DEFAULT_SOUNDEX_ENGINE,
+        length: int = 4,
+    ) -> None:
+        self.engine: str = engine
+        self.length: int = length
+        self._encode = _soundex_function(engine, length)
+        # code -> words with that code, in the order they were added
+        self._buckets: dict[str, list[str]] = {}
+        # word -> its code
+        self._codes: dict[str, str] = {}
+        # word -> its complete soundex code, filled in by search()
+        self._complete_codes: dict[str, str] = {}
+        if words is not None:
+            self.update(words)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._codes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codes)
+
+    def __getstate__(self) -> dict[str, object]:
+        state = self.__dict__.copy()
+        del state["_encode"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._encode = _soundex_function(self.engine, self.length)
+
+    def add(self, word: str) -> None:
+        """Add a word to the index.
+
+        :param str word: word to be indexed
+        """
+        if word not in self._codes:
+            self._insert(word, self._encode(word))
+
+    def update(self, words: Iterable[str]) -> None:
+        """Add many words to the index.
+
+        :param Iterable[str] words: words to be indexed
+        """
+        new_words = [w for w in dict.fromkeys(words) if w not in self._codes]
+        codes = soundex_batch(
+            new_words, engine=self.engine, length=self.length
+        )
+        for word, code in zip(new_words, codes):
+            self._insert(word, code)
+
+    def _insert(self, word: str, code: str) -> None:
+        if not code:
+            return
+        self._codes[word] = code
+        bucket = self._buckets.get(code)
+        if bucket is None:
+            self._buckets[code] = [word]
+        else:
+            bucket.append(word)
+
+    def code(self, word: str) -> str:
+        """Get the soundex code of a word, as used by this index.
+
+        :param str word: word
+        :return: Soundex code
+        :rtype: str
+        """
+        code = self._codes.get(word)
+        if code is None:
+            code = self._encode(word)
+        return code
+
+    def candidates(self, query: str) -> list[str]:
+        """Find indexed words with the same code as the query.
+
+        :param str query: word to be looked up
+        :return: words that sound like the query, in the order they
+            were added
+        :rtype: list[str]
+        """
+        code = self.code(query)
+        if not code:
+            return []
+        return list(self._buckets.get(code, ()))
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        min_similarity: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        """Find and rank indexed words that sound like the query.
+
+        Candidates from :meth:`candidates` are ranked by the similarity
+        of their Complete Soundex codes to that of the query,
+        most similar first.
+
+        :param str query: word to be looked up
+        :param int limit: maximum number of words to return (optional)
+        :param float min_similarity: minimum similarity of a returned word,
+            between 0.0 and 1.0 (default: 0.0)
+        :return: pairs of word and similarity
+        :rtype: list[tuple[str, float]]
+        """
+        words = self.candidates(query)
+        if not words:
+            return []
+
+        query_code = complete_soundex(query)
+        complete_codes = self._complete_codes
+        ranked = []
+        for word in words:
+            code = complete_codes.get(word)
+            if code is None:
+                code = complete_codes[word] = complete_soundex(word)
+            similarity = complete_soundex_similarity(query_code, code)
+            if similarity >= min_similarity:
+                ranked.append((word, similarity))
+
+        # Stable sort keeps the order words were added among equals
+        ranked.sort(key=lambda x: x[1], reverse=True)
+        if limit is not None:
+            del ranked[limit:]
+        return ranked
@@ -3,17 +3,31 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-from typing import cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union, cast
 
+import numpy as np
 import panphon
 import panphon.distance
 
 from pythainlp.tokenize import word_tokenize
 from pythainlp.transliterate import pronunciate, transliterate
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 _ft: panphon.FeatureTable = panphon.FeatureTable()
 _dst: panphon.distance.Distance = panphon.distance.Distance()
 
+# feature weights of the weighted feature edit distance,
+# only the weighted features are compared
+_WEIGHTS: NDArray[np.float64] = np.array(_dst.fm.weights, dtype=np.float64)
+# cost of deleting or inserting a segment
+_INDEL_COST: float = sum(_dst.fm.weights)
+
+# maximum number of words whose IPA word2audio() keeps
+_WORD2AUDIO_CACHE_SIZE: int = 10000
+
 
 def _clean_ipa(ipa: str) -> str:
     """Clean IPA by removing tones and space between phonetic codes
@@ -34,9 +48,12 @@ def _clean_ipa(ipa: str) -> str:
     )
 
 
+@lru_cache(maxsize=_WORD2AUDIO_CACHE_SIZE)
 def word2audio(word: str) -> str:
     """Convert word to IPA
 
+    Results of the most recently used words are cached.
+
     :param str word: Thai word
     :return: IPA with tones removed from the text
     :rtype: str
@@ -74,11 +91,110 @@ def audio_vector(word: str) -> list[list[int]]:
     )
 
 
-def word_approximation(word: str, list_word: list[str]) -> list[float]:
+def _feature_array(ipa: str) -> NDArray[np.float64]:
+    """Weighted panphon features of each segment of an IPA text."""
+    vectors = _dst.fm.word_to_vector_list(ipa, numeric=True)
+    if not vectors:
+        return np.zeros((0, _WEIGHTS.shape[0]), dtype=np.float64)
+    return np.array(vectors, dtype=np.float64)[:, : _WEIGHTS.shape[0]]
+
+
+def _weighted_edit_distances(
+    source: NDArray[np.float64],
+    targets: NDArray[np.float64],
+    lengths: NDArray[np.intp],
+) -> NDArray[np.float64]:
+    """Weighted feature edit distance from one source to many targets.
+
+    Same as panphon's ``Distance.weighted_feature_edit_distance``,
+    with the dynamic programming table of all targets filled in
+    one row at a time.
+
+    :param source: features of the source, shape ``(n, features)``
+    :param targets: features of the targets, zero-padded to
+        shape ``(targets, max length, features)``
+    :param lengths: number of segments of each target
+    :return: distance to each target
+    """
+    num_targets, max_len = targets.shape[:2]
+    # Cost of inserting the first j target segments
+    insert_costs = np.arange(max_len + 1) * _INDEL_COST
+    prev = np.tile(insert_costs, (num_targets, 1))
+    cur = np.empty_like(prev)
+    for i in range(source.shape[0]):
+        substitution = np.abs(targets - source[i]) @ _WEIGHTS
+        cur[:, 0] = prev[:, 0] + _INDEL_COST
+        np.minimum(
+            prev[:, 1:] + _INDEL_COST, prev[:, :-1] + substitution, cur[:, 1:]
+        )
+        # Insertions within a row: cur[j] = min(cur[k] + (j - k) * cost)
+        np.minimum.accumulate(cur - insert_costs, axis=1, out=cur)
+        cur += insert_costs
+        prev, cur = cur, prev
+    return prev[np.arange(num_targets), lengths]
+
+
+class AudioCandidates:
+    """Fixed list of candidate words for :func:`word_approximation`.
+
+    Converts each candidate to IPA and panphon features once,
+    so that a query can be compared with all candidates at once.
+
+    :param list[str] list_word: Thai words
+
+    :Example:
+
+        >>> from pythainlp.soundex.sound import (
+        ...     AudioCandidates,
+        ...     word_approximation,
+        ... )
+        >>> candidates = AudioCandidates(
+        ...     ["รด", "รส", "รม", "น้ำ"]
+        ... )  # doctest: +SKIP
+        >>> word_approximation("รถ", candidates)  # doctest: +SKIP
+        [0.0, 0.0, 3.875, 8.375]
+    """
+
+    def __init__(self, list_word: list[str]) -> None:
+        self.words: list[str] = list(list_word)
+        features = [_feature_array(word2audio(w)) for w in self.words]
+        self.lengths: NDArray[np.intp] = np.array(
+            [f.shape[0] for f in features], dtype=np.intp
+        )
+        max_len = int(self.lengths.max()) if features else 0
+        self.features: NDArray[np.float64] = np.zeros(
+            (len(features), max_len, _WEIGHTS.shape[0]), dtype=np.float64
+        )
+        for i, f in enumerate(features):
+            self.features[i, : f.shape[0]] = f
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def distances(self, word: str) -> NDArray[np.float64]:
+        """Weighted feature edit distance from a word to each candidate.
+
+        :param str word: Thai word
+        :return: distance to each candidate (the smaller, the closer)
+        :rtype: numpy.typing.NDArray[numpy.float64]
+        """
+        return _weighted_edit_distances(
+            _feature_array(word2audio(word)), self.features, self.lengths
+        )
+
+
+def word_approximation(
+    word: str, list_word: Union[list[str], AudioCandidates]
+) -> list[float]:
     """Thai Word Approximation
 
+    To compare many words with the same list of words,
+    pass an :class:`AudioCandidates` made from that list,
+    so the list is only converted once.
+
     :param str word: Thai word
-    :param str list_word: Thai word
+    :param list_word: Thai words, or :class:`AudioCandidates`
+    :type list_word: list[str] or AudioCandidates
     :return: List of approximation of words (The smaller the value, the closer)
     :rtype: list[float]
 
@@ -88,9 +204,6 @@ def word_approximation(word: str, list_word: list[str]) -> list[float]:
         >>> word_approximation("รถ", ["รด", "รส", "รม", "น้ำ"])  # doctest: +SKIP
         [0.0, 0.0, 3.875, 8.375]
     """
-    _word = word2audio(word)
-    _list_word = [word2audio(w) for w in list_word]
-    _distance = [
-        _dst.weighted_feature_edit_distance(_word, w) for w in _list_word
-    ]
-    return _distance
+    if not isinstance(list_word, AudioCandidates):
+        list_word = AudioCandidates(list_word)
+    return cast("list[float]", list_word.distances(word).tolist())
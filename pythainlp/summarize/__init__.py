@@ -4,7 +4,9 @@
 """Text summarization"""
 
 __all__: list[str] = [
+    "DocumentFrequency",
     "extract_keywords",
+    "extract_keywords_batch",
     "summarize",
 ]
 
@@ -13,4 +15,9 @@ CPE_KMUTT_THAI_SENTENCE_SUM: str = "mt5-cpe-kmutt-thai-sentence-sum"
 DEFAULT_KEYWORD_EXTRACTION_ENGINE: str = "keybert"
 
 # these imports are placed here to avoid circular imports
-from pythainlp.summarize.core import extract_keywords, summarize
+from pythainlp.summarize.core import (
+    extract_keywords,
+    extract_keywords_batch,
+    summarize,
+)
+from pythainlp.summarize.freq import DocumentFrequency
@@ -5,18 +5,19 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, Optional, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 from pythainlp.summarize import (
     CPE_KMUTT_THAI_SENTENCE_SUM,
     DEFAULT_KEYWORD_EXTRACTION_ENGINE,
     DEFAULT_SUMMARIZE_ENGINE,
 )
-from pythainlp.summarize.freq import FrequencySummarizer
-from pythainlp.tokenize import sent_tokenize
+from pythainlp.summarize.freq import DocumentFrequency, FrequencySummarizer
+from pythainlp.tokenize import sent_tokenize, word_tokenize_batch
 
 
 def summarize(
@@ -266,3 +267,142 @@ def extract_keywords(
         )
 
     return keywords
+
+
+def extract_keywords_batch(
+    texts: Iterable[str],
+    keyphrase_ngram_range: tuple[int, int] = (1, 2),
+    max_keywords: int = 5,
+    min_df: int = 1,
+    engine: str = DEFAULT_KEYWORD_EXTRACTION_ENGINE,
+    tokenizer: str = "newmm",
+    stop_words: Optional[Iterable[str]] = None,
+    doc_freq: Optional[DocumentFrequency] = None,
+    num_workers: Optional[int] = 1,
+    chunk_size: int = 256,
+) -> Iterator[list[str]]:
+    """Return the most relevant keywords of each of many documents.
+
+    Like :func:`extract_keywords` for each text, with the model or
+    the statistics set up once for all texts.
+    Keywords are yielded in the same order as ``texts``,
+    as soon as they are ready.
+
+    With the *frequency* engine, the count of each word in a document
+    is multiplied by its inverse document frequency
+    (see :class:`pythainlp.summarize.DocumentFrequency`), so words that
+    are common in every document rank lower than words that are specific
+    to one. Document frequencies are updated with each document before
+    its keywords are extracted, in one pass over ``texts``.
+    Texts are tokenized with :func:`pythainlp.tokenize.word_tokenize_batch`,
+    optionally in worker processes.
+    With the *keybert* engine, see
+    :meth:`pythainlp.summarize.keybert.KeyBERT.extract_keywords_batch`.
+
+    :param Iterable[str] texts: texts to extract keywords from
+    :param tuple[int, int] keyphrase_ngram_range: token range for
+        keywords, see :func:`extract_keywords` (*keybert* engine only)
+    :param int max_keywords: maximum number of keywords to return for
+        each text. Default: 5.
+    :param int min_df: minimum term frequency to qualify as keyword.
+        Default: 1.
+    :param str engine: keyword extraction algorithm, *keybert* (default)
+        or *frequency*, see :func:`extract_keywords`
+    :param str tokenizer: tokenizer engine name.
+        See :func:`pythainlp.tokenize.word_tokenize` for options.
+        Default: ``'newmm'``.
+    :param stop_words: words to ignore. If ``None``,
+        :func:`pythainlp.corpus.thai_stopwords` is used. Default: ``None``.
+    :type stop_words: collections.abc.Iterable[str] or None
+    :param pythainlp.summarize.DocumentFrequency doc_freq: document
+        frequencies to use and update (*frequency* engine only).
+        If ``None``, a new one is made for ``texts``. Pass the same
+        object to later calls to share statistics across calls.
+    :param int num_workers: number of worker processes for tokenization
+        (*frequency* engine only). 1 (default) tokenizes in the current
+        process, None uses the number of CPUs.
+    :param int chunk_size: number of texts sent to a worker at a time
+        (*frequency* engine), or whose keyword candidates are embedded
+        and scored together (*keybert* engine)
+
+    :return: an iterator of lists of keywords, one list for each text
+    :rtype: Iterator[list[str]]
+
+    :Example:
+
+        >>> from pythainlp.summarize import extract_keywords_batch
+
+        >>> texts = [
+        ...     "ฝนตกหนัก น้ำท่วมถนน รถติด",
+        ...     "รถติด ถนนปิด",
+        ...     "ฝนตกหนัก",
+        ... ]
+        >>> for keywords in extract_keywords_batch(
+        ...     texts, engine="frequency", max_keywords=2
+        ... ):  # doctest: +SKIP
+        ...     print(keywords)
+        ['ฝน', 'ตก']
+        ['รถ', 'ติด']
+        ['ฝน', 'ตก']
+    """
+    engines = ["keybert", "frequency"]
+
+    if engine == "keybert":
+        from .keybert import KeyBERT
+
+        return cast(
+            "Iterator[list[str]]",
+            KeyBERT().extract_keywords_batch(
+                texts,
+                keyphrase_ngram_range=keyphrase_ngram_range,
+                max_keywords=max_keywords,
+                min_df=min_df,
+                tokenizer=tokenizer,
+                return_similarity=False,
+                stop_words=stop_words,
+                chunk_size=chunk_size,
+            ),
+        )
+    elif engine == "frequency":
+        from pythainlp.util.keywords import _STOPWORDS
+
+        return _rank_batch_by_frequency(
+            word_tokenize_batch(
+                texts,
+                engine=tokenizer,
+                keep_whitespace=False,
+                num_workers=num_workers,
+                chunk_size=chunk_size,
+            ),
+            max_keywords,
+            min_df,
+            _STOPWORDS if stop_words is None else frozenset(stop_words),
+            DocumentFrequency() if doc_freq is None else doc_freq,
+        )
+
+    # currently not supported
+    raise ValueError(
+        f"Keyword extractor {repr(engine)} is currently not supported. "
+        f"Use one of {engines}."
+    )
+
+
+def _rank_batch_by_frequency(
+    tokenized: Iterator[list[str]],
+    max_keywords: int,
+    min_df: int,
+    stop_words: frozenset[str],
+    doc_freq: DocumentFrequency,
+) -> Iterator[list[str]]:
+    for tokens in tokenized:
+        counts = Counter(token for token in tokens if token not in stop_words)
+        doc_freq.add(counts)
+        idf = doc_freq.idf
+        # sorted() keeps the order of first occurrence for equal scores,
+        # like Counter.most_common()
+        ranked = sorted(
+            counts.items(),
+            key=lambda item: item[1] * idf(item[0]),
+            reverse=True,
+        )
+        yield [kw for kw, cnt in ranked[:max_keywords] if cnt >= min_df]
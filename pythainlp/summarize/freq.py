@@ -5,27 +5,91 @@
 
 from __future__ import annotations
 
+import math
 from collections import Counter
 from heapq import nlargest
+from itertools import chain, islice, tee
 from string import punctuation
-from typing import cast
+from typing import TYPE_CHECKING, Optional, cast
 
 from pythainlp.corpus import thai_stopwords
-from pythainlp.tokenize import sent_tokenize, word_tokenize
+from pythainlp.tokenize import (
+    sent_tokenize,
+    word_tokenize,
+    word_tokenize_batch,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 _STOPWORDS: frozenset[str] = thai_stopwords()
+_SUMMARY_STOPWORDS: frozenset[str] = _STOPWORDS.union(punctuation)
+
+
+class DocumentFrequency:
+    """Number of documents that contain each word, over a stream of
+    documents.
+
+    Documents are added one at a time, so statistics can be shared by
+    all documents of a stream and kept up to date as it goes.
+    The inverse document frequency of a word is
+    ``log((1 + num_docs) / (1 + df)) + 1``, where ``df`` is the number of
+    documents that contain the word. It is 1 for a word that is in every
+    document, and higher for rarer words.
+
+    :Example:
+
+        >>> from pythainlp.summarize import DocumentFrequency
+        >>> doc_freq = DocumentFrequency()
+        >>> doc_freq.add(["ข่าว", "ฝน", "ตก"])
+        >>> doc_freq.add(["ข่าว", "รถ", "ติด"])
+        >>> doc_freq.num_docs, doc_freq["ข่าว"], doc_freq["ฝน"]
+        (2, 2, 1)
+        >>> doc_freq.idf("ข่าว") < doc_freq.idf("ฝน")
+        True
+    """
+
+    def __init__(self) -> None:
+        self.num_docs: int = 0
+        self._counts: Counter[str] = Counter()
+
+    def add(self, words: Iterable[str]) -> None:
+        """Add a document.
+
+        :param Iterable[str] words: words of the document,
+            each distinct word is counted once
+        """
+        self._counts.update(set(words))
+        self.num_docs += 1
+
+    def __getitem__(self, word: str) -> int:
+        return self._counts[word]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def idf(self, word: str) -> float:
+        """Inverse document frequency of a word.
+
+        :param str word: a word
+        :return: inverse document frequency, at least 1
+        :rtype: float
+        """
+        return math.log((1 + self.num_docs) / (1 + self._counts[word])) + 1.0
 
 
 class FrequencySummarizer:
     __min_cut: float
     __max_cut: float
-    __stopwords: set[str]
+    __stopwords: frozenset[str]
     __freq: dict[str, float]
+    doc_freq: DocumentFrequency
 
     def __init__(self, min_cut: float = 0.1, max_cut: float = 0.9) -> None:
         self.__min_cut: float = min_cut
         self.__max_cut: float = max_cut
-        self.__stopwords: set[str] = set(punctuation).union(_STOPWORDS)
+        self.__stopwords: frozenset[str] = _SUMMARY_STOPWORDS
+        self.doc_freq: DocumentFrequency = DocumentFrequency()
 
     def __compute_frequencies(
         self, word_tokenized_sents: list[list[str]]
@@ -47,6 +111,24 @@ class FrequencySummarizer:
             if self.__min_cut < f < self.__max_cut
         }
 
+    def __pick_sentences(
+        self,
+        sents: list[str],
+        word_tokenized_sents: list[list[str]],
+        n: int,
+        doc_freq: Optional[DocumentFrequency] = None,
+    ) -> list[str]:
+        self.__freq = self.__compute_frequencies(word_tokenized_sents)
+        if doc_freq is not None:
+            self.__freq = {
+                w: f * doc_freq.idf(w) for w, f in self.__freq.items()
+            }
+        scores = [0.0] * len(word_tokenized_sents)
+        for i, sent in enumerate(word_tokenized_sents):
+            scores[i] = sum(self.__freq.get(w, 0.0) for w in sent)
+        summaries_idx = nlargest(n, range(len(scores)), key=scores.__getitem__)
+        return [sents[j] for j in summaries_idx]
+
     def summarize(
         self, text: str, n: int, tokenizer: str = "newmm"
     ) -> list[str]:
@@ -57,9 +139,75 @@ class FrequencySummarizer:
         word_tokenized_sents = [
             word_tokenize(sent, engine=tokenizer) for sent in sents
         ]
-        self.__freq = self.__compute_frequencies(word_tokenized_sents)
-        scores = [0.0] * len(word_tokenized_sents)
-        for i, sent in enumerate(word_tokenized_sents):
-            scores[i] = sum(self.__freq.get(w, 0.0) for w in sent)
-        summaries_idx = nlargest(n, range(len(scores)), key=scores.__getitem__)
-        return [sents[j] for j in summaries_idx]
+        return self.__pick_sentences(sents, word_tokenized_sents, n)
+
+    def summarize_batch(
+        self,
+        texts: Iterable[str],
+        n: int,
+        tokenizer: str = "newmm",
+        num_workers: Optional[int] = 1,
+        chunk_size: int = 256,
+    ) -> Iterator[list[str]]:
+        """Summarize many documents, weighting words by TF-IDF.
+
+        Like :meth:`summarize`, but the frequency of each word in
+        a document is multiplied by its inverse document frequency
+        (see :class:`DocumentFrequency`), so words that are common in
+        every document count less than words that are specific to one.
+        Document frequencies are kept in :attr:`doc_freq` and updated with
+        each document before it is summarized, in one pass over
+        ``texts``. They carry over to later calls, so the first
+        documents of a stream can be summarized against the documents of
+        an earlier stream.
+
+        Sentences are tokenized with
+        :func:`pythainlp.tokenize.word_tokenize_batch`, optionally in
+        worker processes. Summaries are yielded in the same order as
+        ``texts``, as soon as they are ready.
+
+        :param Iterable[str] texts: documents to be summarized
+        :param int n: number of sentences of each summary
+        :param str tokenizer: word tokenizer engine name
+        :param int num_workers: number of worker processes for
+            tokenization. 1 (default) tokenizes in the current process,
+            None uses the number of CPUs.
+        :param int chunk_size: number of sentences sent to a worker at
+            a time
+        :return: an iterator of lists of selected sentences, one list for
+            each document
+        :rtype: Iterator[list[str]]
+        """
+        # Sentences of each document, and all sentences in one stream
+        doc_sents, all_sents = tee(
+            cast(
+                "list[str]",
+                sent_tokenize(text, engine="whitespace+newline"),
+            )
+            for text in texts
+        )
+        word_sents = word_tokenize_batch(
+            chain.from_iterable(all_sents),
+            engine=tokenizer,
+            num_workers=num_workers,
+            chunk_size=chunk_size,
+        )
+        return self.__summarize_docs(doc_sents, word_sents, n)
+
+    def __summarize_docs(
+        self,
+        doc_sents: Iterator[list[str]],
+        word_sents: Iterator[list[str]],
+        n: int,
+    ) -> Iterator[list[str]]:
+        for sents in doc_sents:
+            word_tokenized_sents = list(islice(word_sents, len(sents)))
+            self.doc_freq.add(
+                w
+                for sent in word_tokenized_sents
+                for w in sent
+                if w not in self.__stopwords
+            )
+            yield self.__pick_sentences(
+                sents, word_tokenized_sents, n, self.doc_freq
+            )
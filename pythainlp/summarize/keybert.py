@@ -12,14 +12,15 @@ https://github.com/MaartenGr/KeyBERT
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, OrderedDict
+from itertools import islice
 from typing import TYPE_CHECKING, Optional, Union, cast
 
 from pythainlp.corpus import thai_stopwords
 from pythainlp.tokenize import word_tokenize
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     import numpy as np
     from numpy.typing import NDArray
@@ -27,19 +28,35 @@ if TYPE_CHECKING:
 
 
 class KeyBERT:
+    """KeyBERT keyword extraction.
+
+    :param str model_name: name of a Hugging Face model for
+        feature extraction
+    :param int cache_size: maximum number of texts (documents and
+        keyword candidates) whose embeddings are kept by
+        :meth:`extract_keywords_batch`, defaults to 10000
+    """
+
     ft_pipeline: "Pipeline"
+    cache_size: int
 
     def __init__(
-        self, model_name: str = "airesearch/wangchanberta-base-att-spm-uncased"
+        self,
+        model_name: str = "airesearch/wangchanberta-base-att-spm-uncased",
+        cache_size: int = 10000,
     ) -> None:
         from transformers import pipeline
 
+        if cache_size < 0:
+            raise ValueError("cache_size must not be negative.")
         self.ft_pipeline: "Pipeline" = pipeline(
             "feature-extraction",
             tokenizer=model_name,
             model=model_name,
             revision="main",
         )
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, NDArray[np.float32]] = OrderedDict()
 
     def extract_keywords(
         self,
@@ -165,14 +182,238 @@ class KeyBERT:
 
         return cast("NDArray[np.float32]", emb_mean)
 
+    def extract_keywords_batch(
+        self,
+        texts: Iterable[str],
+        keyphrase_ngram_range: tuple[int, int] = (1, 2),
+        max_keywords: int = 5,
+        min_df: int = 1,
+        tokenizer: str = "newmm",
+        return_similarity: bool = False,
+        stop_words: Optional[Iterable[str]] = None,
+        batch_size: int = 32,
+        chunk_size: int = 64,
+    ) -> Iterator[Union[list[str], list[tuple[str, float]]]]:
+        """Extract keywords and/or keyphrases from many texts.
+
+        Gives the same keywords as :meth:`extract_keywords` for each text,
+        with less work. Texts are processed ``chunk_size`` at a time.
+        The candidates of all texts in a chunk are deduplicated, and
+        the texts and the candidates that are not in the cache are
+        embedded with :meth:`embed_batch`. The embeddings are kept in
+        a least-recently-used cache of ``cache_size`` texts, so
+        candidates that recur across texts and calls are embedded once.
+        All candidates of a chunk are then scored against all of its
+        texts with a single matrix product.
+
+        :param Iterable[str] texts: texts to extract keywords from
+        :param Tuple[int, int] keyphrase_ngram_range: Number of token units
+            to be defined as keyword, see :meth:`extract_keywords`
+            (default: (1, 2))
+        :param int max_keywords: Number of maximum keywords to be returned
+            for each text. (default: 5)
+        :param int min_df: Minimum frequency required to be a keyword.
+            (default: 1)
+        :param str tokenizer: Name of tokenizer engine to use.
+            (default: 'newmm')
+        :param bool return_similarity: If `True`, return keyword scores.
+            (default: False)
+        :param Optional[Iterable[str]] stop_words: A list of stop words.
+            If not specified, :func:`pythainlp.corpus.thai_stopwords`
+            is used. (default: None)
+        :param int batch_size: Number of texts run through the model at
+            a time. (default: 32)
+        :param int chunk_size: Number of texts whose candidates are
+            deduplicated and scored together. (default: 64)
+
+        :return: an iterator of lists of keywords (with score), one list
+            for each text
 
-def _generate_ngrams(
-    doc: str,
-    keyphrase_ngram_range: tuple[int, int],
-    min_df: int,
-    tokenizer_engine: str,
-    stop_words: Iterable[str],
-) -> list[str]:
+        :Example:
+
+            >>> from pythainlp.summarize.keybert import KeyBERT  # doctest: +SKIP
+
+            >>> kb = KeyBERT()  # doctest: +SKIP
+            >>> texts = [  # doctest: +SKIP
+            ...     "อาหารจะต้องไม่มีพิษและไม่เกิดโทษต่อร่างกาย",
+            ...     "ช่วยทำให้อวัยวะต่างๆ ทำงานได้อย่างปกติ",
+            ... ]
+            >>> for keywords in kb.extract_keywords_batch(  # doctest: +SKIP
+            ...     texts, max_keywords=2
+            ... ):
+            ...     print(keywords)
+        """
+        _check_ngram_range(keyphrase_ngram_range)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        stop_words_ = frozenset(stop_words) if stop_words else thai_stopwords()
+        return self._extract_keywords_chunks(
+            iter(texts),
+            keyphrase_ngram_range,
+            max_keywords,
+            min_df,
+            tokenizer,
+            return_similarity,
+            stop_words_,
+            batch_size,
+            chunk_size,
+        )
+
+    def _extract_keywords_chunks(
+        self,
+        texts: Iterator[str],
+        keyphrase_ngram_range: tuple[int, int],
+        max_keywords: int,
+        min_df: int,
+        tokenizer: str,
+        return_similarity: bool,
+        stop_words: frozenset[str],
+        batch_size: int,
+        chunk_size: int,
+    ) -> Iterator[Union[list[str], list[tuple[str, float]]]]:
+        import numpy as np
+
+        while True:
+            chunk = list(islice(texts, chunk_size))
+            if not chunk:
+                return
+
+            docs = []
+            candidates = []
+            for text in chunk:
+                if not isinstance(text, str):
+                    raise AttributeError(
+                        f"Unable to process data of type {type(text)}. "
+                        f"Please provide input of string type."
+                    )
+                text = text.strip()
+                docs.append(text)
+                candidates.append(
+                    _generate_ngrams(
+                        text,
+                        keyphrase_ngram_range,
+                        min_df,
+                        tokenizer,
+                        stop_words,
+                    )
+                    if text
+                    else []
+                )
+
+            # Each distinct candidate once, in order of first occurrence
+            phrases = list(
+                dict.fromkeys(kw for kws in candidates for kw in kws)
+            )
+            phrase_ids = {kw: i for i, kw in enumerate(phrases)}
+            nonempty = [i for i, kws in enumerate(candidates) if kws]
+            if not phrases:
+                yield from ([] for _ in chunk)
+                continue
+
+            doc_vectors = _l2_norm(
+                self._embed_cached([docs[i] for i in nonempty], batch_size)
+            )
+            phrase_vectors = _l2_norm(self._embed_cached(phrases, batch_size))
+            # Similarity of every candidate to every document at once
+            sims = doc_vectors @ phrase_vectors.T
+
+            rows = dict(zip(nonempty, sims))
+            for i, kws in enumerate(candidates):
+                if not kws:
+                    yield []
+                    continue
+                cosine_sims = rows[i][[phrase_ids[kw] for kw in kws]]
+                ranking_desc = np.argsort(-cosine_sims)
+                top_indices = ranking_desc[:max_keywords].tolist()
+                if return_similarity:
+                    yield [
+                        (kws[idx], float(cosine_sims[idx]))
+                        for idx in top_indices
+                    ]
+                else:
+                    yield [kws[idx] for idx in top_indices]
+
+    def embed_batch(
+        self, docs: list[str], batch_size: int = 32
+    ) -> "NDArray[np.float32]":
+        """Create embeddings by averaging vectors from the last hidden layer,
+        running the model on padded batches of texts.
+
+        Texts of similar length are put in the same batch, so little
+        padding is needed. Padding is left out of the average, so the
+        embedding of a text is the same as with :meth:`embed`, up to
+        floating point rounding.
+
+        :param list[str] docs: input documents
+        :param int batch_size: number of texts run through the model at
+            a time
+        :return: embeddings as a float32 array with one row per input
+            document
+        :rtype: numpy.typing.NDArray[numpy.float32]
+        """
+        import numpy as np
+        import torch
+
+        tokenizer = self.ft_pipeline.tokenizer
+        model = self.ft_pipeline.model
+        embs = np.empty((len(docs), model.config.hidden_size), np.float32)
+        order = sorted(range(len(docs)), key=lambda i: len(docs[i]))
+        for start in range(0, len(order), batch_size):
+            idx = order[start : start + batch_size]
+            inputs = tokenizer(
+                [docs[i] for i in idx], padding=True, return_tensors="pt"
+            ).to(model.device)
+            with torch.no_grad():
+                hidden = model(**inputs)[0]
+            mask = inputs["attention_mask"].cpu().numpy()
+            embs[idx] = _mean_pool(hidden.float().cpu().numpy(), mask)
+        return embs
+
+    def _embed_cached(
+        self, docs: list[str], batch_size: int
+    ) -> "NDArray[np.float32]":
+        """:meth:`embed_batch`, with the embeddings of recent texts kept."""
+        import numpy as np
+
+        cache = self._cache
+        missing = list(dict.fromkeys(d for d in docs if d not in cache))
+        new_embs = dict(
+            zip(missing, self.embed_batch(missing, batch_size))
+            if missing
+            else ()
+        )
+        embs = np.stack(
+            [new_embs[d] if d in new_embs else cache[d] for d in docs]
+        )
+
+        for d in docs:
+            if d in cache:
+                cache.move_to_end(d)
+            elif self.cache_size:
+                cache[d] = new_embs[d]
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return embs
+
+
+def _mean_pool(
+    hidden: "NDArray[np.float32]", mask: "NDArray[np.integer]"
+) -> "NDArray[np.float32]":
+    """Mean of the token vectors of each text, leaving out padding.
+
+    :param hidden: token vectors, shape ``(texts, tokens, hidden size)``
+    :param mask: 1 for tokens and 0 for padding, shape ``(texts, tokens)``
+    """
+    import numpy as np
+
+    weights = mask.astype(np.float32)[:, :, np.newaxis]
+    sums = (hidden * weights).sum(axis=1, dtype=np.float32)
+    return cast("NDArray[np.float32]", sums / weights.sum(axis=1))
+
+
+def _check_ngram_range(keyphrase_ngram_range: tuple[int, int]) -> None:
     if keyphrase_ngram_range[0] < 1:
         raise ValueError(
             f"`keyphrase_ngram_range` must start from 1. "
@@ -185,6 +426,16 @@ def _generate_ngrams(
             f"current value={keyphrase_ngram_range}."
         )
 
+
+def _generate_ngrams(
+    doc: str,
+    keyphrase_ngram_range: tuple[int, int],
+    min_df: int,
+    tokenizer_engine: str,
+    stop_words: Iterable[str],
+) -> list[str]:
+    _check_ngram_range(keyphrase_ngram_range)
+
     def _join_ngram(ngrams: list[tuple[str, ...]]) -> list[str]:
         ngrams_joined = []
         for ng in ngrams:
@@ -216,6 +467,20 @@ def _generate_ngrams(
     return all_grams
 
 
+def _l2_norm(v: "NDArray[np.float32]") -> "NDArray[np.float32]":
+    import numpy as np
+
+    vec_size = v.shape[1]
+    result = np.divide(
+        v,
+        np.linalg.norm(v, axis=1).reshape(-1, 1).repeat(vec_size, axis=1),
+        dtype=np.float32,
+    )
+    if not np.isclose(np.linalg.norm(result, axis=1), 1).all():
+        raise ValueError("Cannot normalize a vector to unit vector.")
+    return cast("NDArray[np.float32]", result)
+
+
 def _rank_keywords(
     doc_vector: "NDArray[np.float32]",
     word_vectors: "NDArray[np.float32]",
@@ -224,17 +489,6 @@ def _rank_keywords(
 ) -> list[tuple[str, float]]:
     import numpy as np
 
-    def l2_norm(v: "NDArray[np.float32]") -> "NDArray[np.float32]":
-        vec_size = v.shape[1]
-        result = np.divide(
-            v,
-            np.linalg.norm(v, axis=1).reshape(-1, 1).repeat(vec_size, axis=1),
-            dtype=np.float32,
-        )
-        if not np.isclose(np.linalg.norm(result, axis=1), 1).all():
-            raise ValueError("Cannot normalize a vector to unit vector.")
-        return cast("NDArray[np.float32]", result)
-
     def cosine_sim(
         a: "NDArray[np.float32]", b: "NDArray[np.float32]"
     ) -> "NDArray[np.float32]":
@@ -242,8 +496,8 @@ def _rank_keywords(
         scores = np.matmul(a, b.T).reshape(-1)
         return cast("NDArray[np.float32]", scores.astype(np.float32, copy=False))
 
-    doc_vector = l2_norm(doc_vector)
-    word_vectors = l2_norm(word_vectors)
+    doc_vector = _l2_norm(doc_vector)
+    word_vectors = _l2_norm(word_vectors)
     cosine_sims = cosine_sim(doc_vector, word_vectors)
     ranking_desc = np.argsort(-cosine_sims)
 
@@ -18,6 +18,7 @@ __all__: list[str] = [
     "NNER",
     "PerceptronTagger",
     "chunk_parse",
+    "convert_tagger_model",
     "pos_tag",
     "pos_tag_sents",
     "pos_tag_transformers",
@@ -25,6 +26,7 @@ __all__: list[str] = [
 ]
 
 from pythainlp.tag._tag_perceptron import PerceptronTagger
+from pythainlp.tag.binary_model import convert_tagger_model
 from pythainlp.tag.chunk import chunk_parse
 from pythainlp.tag.locations import tag_provinces
 from pythainlp.tag.named_entity import NER, NNER, EntitySpan
@@ -21,11 +21,25 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
+
+from pythainlp.tag.binary_model import (
+    _BinaryWeights,
+    is_binary_model,
+    load_perceptron_model,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from numpy.typing import NDArray
+
+# sentences scored together by PerceptronTagger.tag_sents()
+_TAG_SENTS_CHUNK_SIZE: int = 512
+
+# scores closer than this are a tie, left to AveragedPerceptron.predict()
+_SCORE_TIE_TOLERANCE: float = 1e-6
+
 
 class AveragedPerceptron:
     """An averaged perceptron, as implemented by Matthew Honnibal.
@@ -34,7 +48,7 @@ class AveragedPerceptron:
         https://honnibal.wordpress.com/2013/09/11/a-good-part-of-speechpos-tagger-in-about-200-lines-of-python/
     """
 
-    weights: dict[str, dict[str, float]]
+    weights: Union[dict[str, dict[str, float]], _BinaryWeights]
     classes: set[str]
     _totals: dict[tuple[str, str], float]
     _tstamps: dict[tuple[str, str], int]
@@ -43,8 +57,8 @@ class AveragedPerceptron:
     def __init__(self) -> None:
         # Each feature gets its own weight vector,
         # so weights is a dict-of-dicts
-        self.weights: dict[str, dict[str, float]] = {}
-        self.classes: set[str] = set()
+        self.weights = {}
+        self.classes = set()
         # The accumulated values, for the averaging. These will be keyed by
         # feature/class tuples
         self._totals: dict[tuple[str, str], float] = defaultdict(float)
@@ -59,38 +73,53 @@ class AveragedPerceptron:
         """Dot-product the features and current weights and return the best
         label.
         """
-        scores: dict[str, float] = defaultdict(float)
-        for feat, value in features.items():
-            if feat not in self.weights or value == 0:
-                continue
-            weights = self.weights[feat]
-            for label, weight in weights.items():
-                scores[label] += value * weight
+        if isinstance(self.weights, _BinaryWeights):
+            scores = self.weights.scores(features)
+        else:
+            scores = defaultdict(float)
+            for feat, value in features.items():
+                if feat not in self.weights or value == 0:
+                    continue
+                weights = self.weights[feat]
+                for label, weight in weights.items():
+                    scores[label] += value * weight
         # Do a secondary alphabetic sort, for stability
-        return max(self.classes, key=lambda label: (scores[label], label))
+        return max(
+            self.classes, key=lambda label: (scores.get(label, 0.0), label)
+        )
+
+    def _trainable_weights(self) -> dict[str, dict[str, float]]:
+        """Weights as dictionaries that can be updated by training."""
+        if isinstance(self.weights, _BinaryWeights):
+            # Weights of a binary model are read-only, train on a copy
+            self.weights = dict(self.weights)
+        return self.weights
 
     def update(
         self, truth: str, guess: str, features: dict[str, float]
     ) -> None:
         """Update the feature weights."""
 
+        all_weights = self._trainable_weights()
+
         def upd_feat(c: str, f: str, w: float, v: float) -> None:
             param = (f, c)
             self._totals[param] += (self.i - self._tstamps[param]) * w
             self._tstamps[param] = self.i
-            self.weights[f][c] = w + v
+            all_weights[f][c] = w + v
 
         self.i += 1
         if truth == guess:
             return
         for f in features:
-            weights = self.weights.setdefault(f, {})
+            weights = all_weights.setdefault(f, {})
             upd_feat(truth, f, weights.get(truth, 0.0), 1.0)
             upd_feat(guess, f, weights.get(guess, 0.0), -1.0)
 
     def average_weights(self) -> None:
         """Average weights from all iterations."""
-        for feat, weights in self.weights.items():
+        all_weights = self._trainable_weights()
+        for feat, weights in all_weights.items():
             new_feat_weights = {}
             for clas, weight in weights.items():
                 param = (feat, clas)
@@ -99,7 +128,107 @@ class AveragedPerceptron:
                 averaged = round(total / float(self.i), 3)
                 if averaged:
                     new_feat_weights[clas] = averaged
-            self.weights[feat] = new_feat_weights
+            all_weights[feat] = new_feat_weights
+
+
+class _CompiledPerceptron:
+    """Weights of a :class:`PerceptronTagger` as a dense NumPy matrix.
+
+    Every feature gets a row id from a hash table and every class a
+    column, so a word is scored by gathering and summing rows.
+    Features of the previous two tags are summed ahead of time for each
+    pair of tags. Feature names must match
+    :meth:`PerceptronTagger._get_features`.
+    """
+
+    labels: list[str]
+    tag_ids: dict[str, int]
+    feature_ids: dict[str, int]
+    weights: "NDArray[Any]"
+    tag_pair_scores: "NDArray[Any]"
+    tag_word_rows: dict[str, dict[int, int]]
+
+    def __init__(self, tagger: PerceptronTagger) -> None:
+        import numpy as np
+
+        self.labels = sorted(tagger.model.classes)
+        label_ids = {label: i for i, label in enumerate(self.labels)}
+        # tags that can be the previous tag: start markers, classes,
+        # and tags from the tag dictionary
+        tags = list(tagger.START) + self.labels
+        tags += sorted(set(tagger.tagdict.values()).difference(tags))
+        self.tag_ids = {tag: i for i, tag in enumerate(tags)}
+
+        # row 0 is all zeros, for features without weights
+        self.feature_ids = {}
+        self.weights = np.zeros(
+            (len(tagger.model.weights) + 1, len(self.labels))
+        )
+        model_weights = tagger.model.weights
+        if isinstance(model_weights, _BinaryWeights):
+            # scatter the sparse rows of a binary model at once
+            self.feature_ids = {
+                feat: row + 1
+                for feat, row in model_weights.feature_ids.items()
+            }
+            label_cols = np.array(
+                [label_ids.get(label, -1) for label in model_weights.labels],
+                dtype=np.intp,
+            )
+            row_ptr = np.asarray(model_weights.row_ptr)
+            rows = np.repeat(np.arange(1, len(row_ptr)), np.diff(row_ptr))
+            cols = label_cols[np.asarray(model_weights.cols)]
+            known = cols >= 0
+            self.weights[rows[known], cols[known]] = np.asarray(
+                model_weights.vals
+            )[known]
+        else:
+            for row, (feat, feat_weights) in enumerate(
+                model_weights.items(), 1
+            ):
+                self.feature_ids[feat] = row
+                for label, weight in feat_weights.items():
+                    col = label_ids.get(label)
+                    if col is not None:
+                        self.weights[row, col] = weight
+
+        get = self.feature_ids.get
+        prev_rows = [get(f"i-1 tag {tag}", 0) for tag in tags]
+        prev2_rows = [get(f"i-2 tag {tag}", 0) for tag in tags]
+        pair_rows = [
+            [get(f"i tag+i-2 tag {prev} {prev2}", 0) for prev2 in tags]
+            for prev in tags
+        ]
+        self.tag_pair_scores = (
+            self.weights[prev_rows][:, None, :]
+            + self.weights[prev2_rows][None, :, :]
+            + self.weights[pair_rows]
+        )
+
+        prefix = "i-1 tag+i word "
+        self.tag_word_rows = {}
+        for feat, row in self.feature_ids.items():
+            if feat.startswith(prefix):
+                tag, _, word = feat[len(prefix) :].partition(" ")
+                tag_id = self.tag_ids.get(tag)
+                if tag_id is not None:
+                    self.tag_word_rows.setdefault(word, {})[tag_id] = row
+
+    def static_rows(self, i: int, word: str, context: list[str]) -> list[int]:
+        """Row ids of the features that do not depend on previous tags."""
+        get = self.feature_ids.get
+        return [
+            get("bias", 0),
+            get("i suffix " + word[-3:], 0),
+            get("i pref1 " + word[0], 0),
+            get("i word " + context[i], 0),
+            get("i-1 word " + context[i - 1], 0),
+            get("i-1 suffix " + context[i - 1][-3:], 0),
+            get("i-2 word " + context[i - 2], 0),
+            get("i+1 word " + context[i + 1], 0),
+            get("i+1 suffix " + context[i + 1][-3:], 0),
+            get("i+2 word " + context[i + 2], 0),
+        ]
 
 
 class PerceptronTagger:
@@ -130,18 +259,42 @@ class PerceptronTagger:
     model: "AveragedPerceptron"
     tagdict: dict[str, str]
     classes: set[str]
+    _compiled: Optional[_CompiledPerceptron]
 
     def __init__(self, path: str = "") -> None:
         """:param str path: model path"""
         self.model: "AveragedPerceptron" = AveragedPerceptron()
         self.tagdict: dict[str, str] = {}
         self.classes: set[str] = set()
+        self._compiled: Optional[_CompiledPerceptron] = None
         if path != "":
             self.AP_MODEL_LOC: str = path
             self.load(self.AP_MODEL_LOC)
 
+    def compile(self) -> None:
+        """Convert the model weights for vectorized inference with NumPy.
+
+        After this, :meth:`tag` and :meth:`tag_sents` score each word with
+        array lookups instead of loops over the weight dictionaries.
+        Tags are the same as without compiling.
+        Training or loading a model drops the compiled weights.
+
+        :Example:
+
+            >>> from pythainlp.tag import PerceptronTagger
+            >>> tagger = PerceptronTagger()
+            >>> tagger.train([[("คน", "N"), ("เดิน", "V")]])
+            >>> tagger.compile()  # doctest: +SKIP
+            >>> tagger.tag(["คน", "เดิน"])
+            [('คน', 'N'), ('เดิน', 'V')]
+        """
+        self._compiled = _CompiledPerceptron(self)
+
     def tag(self, tokens: Iterable[str]) -> list[tuple[str, str]]:
         """Tags a string `tokens`."""
+        if self._compiled is not None:
+            return self.tag_sents([list(tokens)])[0]
+
         prev, prev2 = self.START
         output = []
 
@@ -156,6 +309,152 @@ class PerceptronTagger:
             prev = tag
         return output
 
+    def tag_sents(
+        self, sentences: Iterable[list[str]]
+    ) -> list[list[tuple[str, str]]]:
+        """Tags many lists of tokens.
+
+        The model is compiled with :meth:`compile` if it is not yet.
+        Words at the same position in up to 512 sentences are scored
+        together, so this is much faster than calling :meth:`tag`
+        for each sentence. Without NumPy, each sentence is tagged
+        with :meth:`tag`.
+
+        :param sentences: lists of tokens
+        :return: a list of (word, tag) tuples for each list of tokens
+        :rtype: list[list[tuple[str, str]]]
+
+        :Example:
+
+            >>> from pythainlp.tag import PerceptronTagger
+            >>> tagger = PerceptronTagger()
+            >>> tagger.train([[("คน", "N"), ("เดิน", "V")]])
+            >>> tagger.tag_sents([["คน", "เดิน"], ["คน"]])  # doctest: +SKIP
+            [[('คน', 'N'), ('เดิน', 'V')], [('คน', 'N')]]
+        """
+        if self._compiled is None:
+            try:
+                self.compile()
+            except ImportError:
+                return [self.tag(sent) for sent in sentences]
+
+        sentences = list(sentences)
+        output: list[list[tuple[str, str]]] = []
+        for i in range(0, len(sentences), _TAG_SENTS_CHUNK_SIZE):
+            output.extend(
+                self._tag_sents_chunk(sentences[i : i + _TAG_SENTS_CHUNK_SIZE])
+            )
+        return output
+
+    def _tag_sents_chunk(
+        self, sentences: list[list[str]]
+    ) -> list[list[tuple[str, str]]]:
+        import numpy as np
+
+        compiled = cast(_CompiledPerceptron, self._compiled)
+        tag_ids = compiled.tag_ids
+        tags = list(tag_ids)
+        labels = compiled.labels
+        start, start2 = (tag_ids[tag] for tag in self.START)
+
+        # longest sentences first, so the ones still being tagged
+        # at a position are always the first ones
+        order = sorted(
+            range(len(sentences)),
+            key=lambda j: len(sentences[j]),
+            reverse=True,
+        )
+        sents = [sentences[j] for j in order]
+        normalized: dict[str, str] = {}
+        for sent in sents:
+            for word in sent:
+                if word not in normalized:
+                    normalized[word] = self._normalize(word)
+        contexts = [
+            self.START + [normalized[w] for w in sent] + self.END
+            for sent in sents
+        ]
+
+        # scores of features that do not depend on previous tags,
+        # for every word not in the tag dictionary
+        static_index: list[list[int]] = []
+        static_rows: list[list[int]] = []
+        for sent, context in zip(sents, contexts):
+            index = []
+            for i, word in enumerate(sent):
+                if self.tagdict.get(word):
+                    index.append(-1)
+                else:
+                    index.append(len(static_rows))
+                    static_rows.append(
+                        compiled.static_rows(
+                            i + len(self.START), word, context
+                        )
+                    )
+            static_index.append(index)
+        rows = np.array(static_rows, dtype=np.intp).reshape(-1, 10)
+        static_scores = compiled.weights[rows[:, 0]]
+        for k in range(1, rows.shape[1]):
+            static_scores += compiled.weights[rows[:, k]]
+
+        n_sents = len(sents)
+        prev = [start] * n_sents
+        prev2 = [start2] * n_sents
+        output: list[list[tuple[str, str]]] = [[] for _ in sents]
+        n_active = n_sents
+        for i in range(len(sents[0]) if sents else 0):
+            while len(sents[n_active - 1]) <= i:
+                n_active -= 1
+
+            guess_js = []
+            for j in range(n_active):
+                tag = self.tagdict.get(sents[j][i])
+                if tag:
+                    output[j].append((sents[j][i], tag))
+                    prev2[j] = prev[j]
+                    prev[j] = tag_ids[tag]
+                else:
+                    guess_js.append(j)
+            if not guess_js:
+                continue
+
+            prevs = [prev[j] for j in guess_js]
+            prev2s = [prev2[j] for j in guess_js]
+            tag_word_rows = [
+                compiled.tag_word_rows.get(
+                    contexts[j][i + len(self.START)], {}
+                ).get(prev[j], 0)
+                for j in guess_js
+            ]
+            scores = static_scores[[static_index[j][i] for j in guess_js]]
+            scores += compiled.tag_pair_scores[prevs, prev2s]
+            scores += compiled.weights[tag_word_rows]
+            best = scores.argmax(axis=1)
+            n_best = (
+                scores
+                >= scores.max(axis=1, keepdims=True) - _SCORE_TIE_TOLERANCE
+            ).sum(axis=1)
+
+            for j, label_id, n in zip(
+                guess_js, best.tolist(), n_best.tolist()
+            ):
+                word = sents[j][i]
+                if n == 1:
+                    tag = labels[label_id]
+                else:  # a tie is broken the same way as predict()
+                    features = self._get_features(
+                        i, word, contexts[j], tags[prev[j]], tags[prev2[j]]
+                    )
+                    tag = self.model.predict(features)
+                output[j].append((word, tag))
+                prev2[j] = prev[j]
+                prev[j] = tag_ids[tag]
+
+        tagged: list[list[tuple[str, str]]] = [[] for _ in sents]
+        for j, words_tags in zip(order, output):
+            tagged[j] = words_tags
+        return tagged
+
     def train(
         self,
         sentences: Iterable[Iterable[tuple[str, str]]],
@@ -172,6 +471,7 @@ class PerceptronTagger:
         """
         import random
 
+        self._compiled = None
         self._make_tagdict(sentences)
         self.model.classes = self.classes
         for _ in range(nr_iter):
@@ -210,19 +510,31 @@ class PerceptronTagger:
                 json.dump(data, f, ensure_ascii=False)
 
     def load(self, loc: str) -> None:
-        """Load a saved model from a JSON file.
+        """Load a saved model from a JSON file or a binary model file.
+
+        Binary models are made with
+        :func:`pythainlp.tag.convert_tagger_model`.
+        Their weights are memory-mapped instead of read into dictionaries.
+
         :param str loc: model path
         """
         try:
-            with open(loc, encoding="utf-8-sig") as f:
-                w_td_c = json.load(f)
+            if is_binary_model(loc):
+                weights, tagdict, classes = load_perceptron_model(loc)
+            else:
+                with open(loc, encoding="utf-8-sig") as f:
+                    w_td_c = json.load(f)
+                weights = w_td_c["weights"]
+                tagdict = w_td_c["tagdict"]
+                classes = w_td_c["classes"]
         except OSError as ex:
             msg = "Missing trontagger.json file."
             raise OSError(msg) from ex
-        self.model.weights = w_td_c["weights"]
-        self.tagdict: dict[str, list[str]] = w_td_c["tagdict"]
-        self.classes: list[str] = w_td_c["classes"]
-        self.model.classes = set(self.classes)
+        self._compiled = None
+        self.model.weights = weights
+        self.tagdict = tagdict
+        self.classes = set(classes)
+        self.model.classes = self.classes
 
     def _normalize(self, word: str) -> str:
         """Normalization used in pre-processing.
@@ -0,0 +1,582 @@
+# SPDX-FileCopyrightText: 2016-2026 PyThaiNLP Project
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+"""Binary format for perceptron and unigram tagger models.
+
+Tagger models are distributed as JSON files, which are slow to parse
+and become large nested dictionaries once loaded.
+A binary model keeps each distinct string once, in a string table,
+and the perceptron weights in flat numeric arrays (a sparse
+row-per-feature matrix). The arrays are memory-mapped, so loading
+is fast and processes using the same model share its memory pages.
+The words of a unigram model are sorted and stay in the mapped file,
+where they are looked up by binary search.
+
+:func:`convert_tagger_model` converts a JSON model. By default, the
+binary model is written to the PyThaiNLP data directory, where the
+perceptron and unigram taggers look for it before reading the JSON
+file. A binary model remembers the hash of its JSON file and is
+ignored once that file changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Optional, Union, cast
+
+from pythainlp.tools import get_pythainlp_data_path, is_read_only_mode
+from pythainlp.tools.path import _write_atomic
+
+# File layout: header, one uint64 length per section, and the sections,
+# each padded to 8 bytes so numeric arrays are aligned.
+# The header holds the SHA-256 hash, size and modification time of the
+# JSON file it was made from. The file is only hashed again when its size
+# or modification time has changed.
+_MAGIC: bytes = b"PTTM"
+_FORMAT_VERSION: int = 3
+_HEADER: struct.Struct = struct.Struct("<4sBBBx32sI4xQq")
+_BYTEORDERS: tuple[str, str] = ("little", "big")
+
+_KIND_PERCEPTRON: int = 1
+_KIND_UNIGRAM: int = 2
+
+_MODEL_DIRNAME: str = "tag"
+_MODEL_EXT: str = ".bin"
+
+if TYPE_CHECKING:
+    _Array = Union[array[Any], memoryview[Any]]
+
+
+class _BinaryWeights(Mapping[str, dict[str, float]]):
+    """Read-only perceptron weights backed by a sparse matrix.
+
+    Looks like the ``{feature: {label: weight}}`` dictionary of
+    :class:`pythainlp.tag._tag_perceptron.AveragedPerceptron`,
+    but the weights of a feature are only turned into a dictionary
+    when the feature is looked up.
+    """
+
+    labels: list[str]
+    feature_ids: dict[str, int]
+    row_ptr: _Array
+    cols: _Array
+    vals: _Array
+
+    def __init__(
+        self,
+        labels: list[str],
+        features: list[str],
+        row_ptr: _Array,
+        cols: _Array,
+        vals: _Array,
+    ) -> None:
+        self.labels = labels
+        self.feature_ids = {feat: i for i, feat in enumerate(features)}
+        self.row_ptr = row_ptr
+        self.cols = cols
+        self.vals = vals
+
+    def scores(self, features: Mapping[str, float]) -> dict[str, float]:
+        """Dot-product the features and the weights of each label.
+
+        Same as summing the weights of :meth:`__getitem__` for each
+        feature, without making a dictionary per feature.
+        """
+        feature_ids = self.feature_ids
+        row_ptr = self.row_ptr
+        cols = self.cols
+        vals = self.vals
+        totals = [0.0] * len(self.labels)
+        for feat, value in features.items():
+            row = feature_ids.get(feat)
+            if row is None or value == 0:
+                continue
+            start = row_ptr[row]
+            end = row_ptr[row + 1]
+            for col, weight in zip(cols[start:end], vals[start:end]):
+                totals[col] += value * weight
+        return dict(zip(self.labels, totals))
+
+    def __getitem__(self, feat: str) -> dict[str, float]:
+        row = self.feature_ids[feat]
+        start = self.row_ptr[row]
+        end = self.row_ptr[row + 1]
+        labels = self.labels
+        return {
+            labels[col]: val
+            for col, val in zip(
+                self.cols[start:end].tolist(), self.vals[start:end].tolist()
+            )
+        }
+
+    def __contains__(self, feat: object) -> bool:
+        return feat in self.feature_ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.feature_ids)
+
+    def __len__(self) -> int:
+        return len(self.feature_ids)
+
+    def __getstate__(self) -> tuple[list[str], list[str], bytes, bytes, bytes]:
+        # Pickle copies of the arrays, not the memory map they point into
+        return (
+            self.labels,
+            list(self.feature_ids),
+            memoryview(self.row_ptr).cast("B").tobytes(),
+            memoryview(self.cols).cast("B").tobytes(),
+            memoryview(self.vals).cast("B").tobytes(),
+        )
+
+    def __setstate__(
+        self, state: tuple[list[str], list[str], bytes, bytes, bytes]
+    ) -> None:
+        labels, features, row_ptr, cols, vals = state
+        self.labels = labels
+        self.feature_ids = {feat: i for i, feat in enumerate(features)}
+        self.row_ptr = array("i", row_ptr)
+        self.cols = array("i", cols)
+        self.vals = array("d", vals)
+
+
+class _BinaryTagDict(Mapping[str, str]):
+    """Read-only unigram model backed by a sorted word table.
+
+    Looks like the ``{word: tag}`` dictionary of a JSON unigram model,
+    but the words are not copied out of the model file. They are kept
+    as UTF-8 in code point order and found by binary search.
+    """
+
+    labels: list[str]
+    offsets: _Array
+    text: Union[memoryview, bytes]
+    tag_ids: _Array
+
+    def __init__(
+        self,
+        labels: list[str],
+        offsets: _Array,
+        text: Union[memoryview, bytes],
+        tag_ids: _Array,
+    ) -> None:
+        self.labels = labels
+        self.offsets = offsets
+        self.text = text
+        self.tag_ids = tag_ids
+
+    def _index(self, word: object) -> int:
+        """Position of a word in the word table, or -1."""
+        if not isinstance(word, str):
+            return -1
+        # UTF-8 byte order is code point order
+        key = word.encode("utf-8", "surrogatepass")
+        offsets = self.offsets
+        text = self.text
+        lo = 0
+        hi = len(self.tag_ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if bytes(text[offsets[mid] : offsets[mid + 1]]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if (
+            lo < len(self.tag_ids)
+            and bytes(text[offsets[lo] : offsets[lo + 1]]) == key
+        ):
+            return lo
+        return -1
+
+    def __getitem__(self, word: str) -> str:
+        i = self._index(word)
+        if i < 0:
+            raise KeyError(word)
+        return self.labels[self.tag_ids[i]]
+
+    def __contains__(self, word: object) -> bool:
+        return self._index(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        offsets = self.offsets
+        text = self.text
+        for i in range(len(self.tag_ids)):
+            yield str(text[offsets[i] : offsets[i + 1]], "utf-8")
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+    def __getstate__(self) -> tuple[list[str], bytes, bytes, bytes]:
+        # Pickle copies of the arrays, not the memory map they point into
+        return (
+            self.labels,
+            memoryview(self.offsets).cast("B").tobytes(),
+            bytes(self.text),
+            memoryview(self.tag_ids).cast("B").tobytes(),
+        )
+
+    def __setstate__(
+        self, state: tuple[list[str], bytes, bytes, bytes]
+    ) -> None:
+        labels, offsets, text, tag_ids = state
+        self.labels = labels
+        self.offsets = array("i", offsets)
+        self.text = text
+        self.tag_ids = array("i", tag_ids)
+
+
+def _string_table(strings: list[str]) -> list[bytes]:
+    """Encode strings as character offsets and one UTF-8 text."""
+    offsets = array("i", [0])
+    total = 0
+    for s in strings:
+        total += len(s)
+        offsets.append(total)
+    return [offsets.tobytes(), "".join(strings).encode("utf-8")]
+
+
+def _read_string_table(offsets: _Array, text: memoryview) -> list[str]:
+    joined = str(text, "utf-8")
+    bounds = offsets.tolist()
+    return [joined[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def _write_model(
+    path: str,
+    kind: int,
+    source_hash: bytes,
+    source_stat: os.stat_result,
+    sections: list[bytes],
+) -> None:
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT_VERSION,
+        kind,
+        _BYTEORDERS.index(sys.byteorder),
+        source_hash,
+        len(sections),
+        source_stat.st_size,
+        source_stat.st_mtime_ns,
+    )
+    lengths = struct.pack(f"<{len(sections)}Q", *map(len, sections))
+
+    def write(f: BinaryIO) -> None:
+        f.write(header)
+        f.write(lengths)
+        for section in sections:
+            f.write(section)
+            f.write(bytes(-len(section) % 8))
+
+    _write_atomic(path, write)
+
+
+def _read_header(
+    path: str,
+) -> Optional[tuple[int, int, int, bytes, int, int, int]]:
+    """Read the header of a binary model, or ``None`` if it is not one."""
+    with open(path, "rb") as f:
+        data = f.read(_HEADER.size)
+    if len(data) < _HEADER.size:
+        return None
+    (
+        magic,
+        version,
+        kind,
+        byteorder,
+        source_hash,
+        count,
+        size,
+        mtime_ns,
+    ) = _HEADER.unpack(data)
+    if magic != _MAGIC or byteorder > 1:
+        return None
+    return version, kind, byteorder, source_hash, count, size, mtime_ns
+
+
+def _read_model(path: str, kind: int) -> tuple[list[memoryview], bool]:
+    """Memory-map a binary model and split it into its sections.
+
+    :return: the sections, and whether arrays must be byte-swapped
+    :raises ValueError: if the file is not a binary model of this kind
+    """
+    header = _read_header(path)
+    if header is None or header[1] != kind:
+        raise ValueError(f"{path} is not a binary tagger model.")
+    version, _, byteorder, _, count, _, _ = header
+    if version != _FORMAT_VERSION:
+        raise ValueError(
+            f"{path} has unsupported tagger model version {version}."
+        )
+
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(buf)
+    pos = _HEADER.size + 8 * count
+    if len(view) < pos:
+        raise ValueError(f"{path} is truncated or corrupted.")
+    sections = []
+    for length in struct.unpack_from(f"<{count}Q", view, _HEADER.size):
+        sections.append(view[pos : pos + length])
+        pos += length + (-length % 8)
+    if len(view) != pos:
+        raise ValueError(f"{path} is truncated or corrupted.")
+    return sections, _BYTEORDERS[byteorder] != sys.byteorder
+
+
+def _cast(
+    section: memoryview, typecode: Literal["i", "d"], swap: bool
+) -> _Array:
+    if not swap:
+        return section.cast(typecode)
+    # Byte-swapped copies cannot share the mapped pages
+    arr = array(typecode, section.tobytes())
+    arr.byteswap()
+    return arr
+
+
+def _file_hash(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def is_binary_model(path: str) -> bool:
+    """Tell whether a file is a binary tagger model.
+
+    :param str path: path of a model file
+    :return: ``True`` if the file starts like a binary tagger model
+    :rtype: bool
+    """
+    return _read_header(path) is not None
+
+
+def binary_model_path(json_path: str) -> str:
+    """Default location of the binary model converted from a JSON model.
+
+    This is where :func:`convert_tagger_model` writes the binary model
+    if no output path is given, and where the taggers look for it.
+
+    :param str json_path: path of a JSON tagger model
+    :return: path in ``tag`` of the PyThaiNLP data directory
+    :rtype: str
+    """
+    abs_path = os.path.abspath(json_path)
+    stem = os.path.splitext(os.path.basename(abs_path))[0]
+    source_id = hashlib.sha256(abs_path.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(
+        get_pythainlp_data_path(),
+        _MODEL_DIRNAME,
+        f"{stem}-{source_id}{_MODEL_EXT}",
+    )
+
+
+def resolve_model_path(json_path: str) -> str:
+    """Path of the model to load for a JSON model.
+
+    :param str json_path: path of a JSON tagger model
+    :return: path of its binary model, if there is one made from the
+        current content of the JSON file, otherwise ``json_path``
+    :rtype: str
+    """
+    bin_path = binary_model_path(json_path)
+    if not os.path.isfile(bin_path):
+        return json_path
+    header = _read_header(bin_path)
+    if header is None or header[0] != _FORMAT_VERSION:
+        return json_path
+    try:
+        stat = os.stat(json_path)
+        if (stat.st_size, stat.st_mtime_ns) != header[5:] and (
+            header[3] != _file_hash(json_path)
+        ):
+            return json_path
+    except OSError:
+        return json_path
+    return bin_path
+
+
+def convert_tagger_model(
+    json_path: str, bin_path: Optional[str] = None
+) -> str:
+    """Convert a JSON tagger model to the binary model format.
+
+    Both perceptron models (as saved by
+    :meth:`pythainlp.tag.PerceptronTagger.train`) and unigram models
+    (a JSON object of words and their tags) can be converted.
+    The perceptron and unigram taggers of :func:`pythainlp.tag.pos_tag`
+    load the binary model instead of their JSON model once it has
+    been converted to the default location.
+    Tags are the same with either model.
+
+    :param str json_path: path of a JSON tagger model
+    :param str bin_path: path of the binary model to be written,
+        defaults to :func:`binary_model_path` of ``json_path``
+    :return: path of the binary model
+    :rtype: str
+    :raises PermissionError: if ``bin_path`` is not given and
+        PyThaiNLP is in read-only mode
+
+    :Example:
+
+        >>> from pythainlp.tag.perceptron import _PUD_PATH
+        >>> from pythainlp.tag import convert_tagger_model  # doctest: +SKIP
+        >>> convert_tagger_model(_PUD_PATH)  # doctest: +SKIP
+        '/root/pythainlp-data/tag/pos_ud_perceptron-v0.2-1a2b3c4d.bin'
+    """
+    with open(json_path, "rb") as f:
+        # Taken before reading, so a later change is never missed
+        source_stat = os.fstat(f.fileno())
+        data = f.read()
+    source_hash = hashlib.sha256(data).digest()
+    model = json.loads(data.decode("utf-8-sig"))
+
+    if bin_path is None:
+        if is_read_only_mode():
+            raise PermissionError(
+                "PyThaiNLP is in read-only mode. "
+                "It cannot write to the data directory."
+            )
+        bin_path = binary_model_path(json_path)
+        os.makedirs(os.path.dirname(bin_path), exist_ok=True)
+
+    if isinstance(model, dict) and {"weights", "tagdict", "classes"} <= set(
+        model
+    ):
+        kind = _KIND_PERCEPTRON
+        sections = _perceptron_sections(
+            model["weights"], model["tagdict"], model["classes"]
+        )
+    elif isinstance(model, dict) and all(
+        isinstance(tag, str) for tag in model.values()
+    ):
+        kind = _KIND_UNIGRAM
+        sections = _unigram_sections(model)
+    else:
+        raise ValueError(f"{json_path} is not a tagger model.")
+
+    _write_model(bin_path, kind, source_hash, source_stat, sections)
+    return bin_path
+
+
+def _perceptron_sections(
+    weights: dict[str, dict[str, float]],
+    tagdict: dict[str, str],
+    classes: list[str],
+) -> list[bytes]:
+    labels: dict[str, int] = {}
+    for label in classes:
+        labels.setdefault(label, len(labels))
+    for tag in tagdict.values():
+        labels.setdefault(tag, len(labels))
+
+    row_ptr = array("i", [0])
+    cols = array("i")
+    vals = array("d")
+    for feat_weights in weights.values():
+        for label, weight in feat_weights.items():
+            cols.append(labels.setdefault(label, len(labels)))
+            vals.append(weight)
+        row_ptr.append(len(cols))
+
+    return [
+        *_string_table(list(labels)),
+        array("i", [labels[label] for label in classes]).tobytes(),
+        *_string_table(list(weights)),
+        row_ptr.tobytes(),
+        cols.tobytes(),
+        vals.tobytes(),
+        *_string_table(list(tagdict)),
+        array("i", [labels[tag] for tag in tagdict.values()]).tobytes(),
+    ]
+
+
+def _unigram_sections(model: dict[str, str]) -> list[bytes]:
+    # Words are sorted and indexed by byte offset, for _BinaryTagDict
+    words = sorted(model)
+    labels: dict[str, int] = {}
+    tag_ids = array(
+        "i", [labels.setdefault(model[word], len(labels)) for word in words]
+    )
+    encoded = [word.encode("utf-8") for word in words]
+    offsets = array("i", [0])
+    total = 0
+    for word_bytes in encoded:
+        total += len(word_bytes)
+        offsets.append(total)
+    return [
+        *_string_table(list(labels)),
+        offsets.tobytes(),
+        b"".join(encoded),
+        tag_ids.tobytes(),
+    ]
+
+
+def load_perceptron_model(
+    path: str,
+) -> tuple[_BinaryWeights, dict[str, str], list[str]]:
+    """Load a binary perceptron model.
+
+    :param str path: path of a binary perceptron model
+    :return: weights, tag dictionary, and classes of the model
+    :raises ValueError: if the file is not a binary perceptron model
+    """
+    sections, swap = _read_model(path, _KIND_PERCEPTRON)
+    (
+        label_offsets,
+        label_text,
+        class_ids,
+        feat_offsets,
+        feat_text,
+        row_ptr,
+        cols,
+        vals,
+        word_offsets,
+        word_text,
+        tag_ids,
+    ) = sections
+    labels = _read_string_table(_cast(label_offsets, "i", swap), label_text)
+    weights = _BinaryWeights(
+        labels,
+        _read_string_table(_cast(feat_offsets, "i", swap), feat_text),
+        _cast(row_ptr, "i", swap),
+        _cast(cols, "i", swap),
+        _cast(vals, "d", swap),
+    )
+    words = _read_string_table(_cast(word_offsets, "i", swap), word_text)
+    tagdict = dict(
+        zip(words, map(labels.__getitem__, _cast(tag_ids, "i", swap)))
+    )
+    classes = [labels[i] for i in _cast(class_ids, "i", swap)]
+    return weights, tagdict, classes
+
+
+def load_unigram_model(path: str) -> Mapping[str, str]:
+    """Load a unigram model, from either a binary or a JSON file.
+
+    A binary model is not loaded into a dictionary. Its words are
+    looked up in the memory-mapped file, so processes using the same
+    model share its memory pages.
+
+    :param str path: path of a binary or JSON unigram model
+    :return: a read-only mapping of words to their tags
+        (a dictionary for a JSON model)
+    :rtype: Mapping[str, str]
+    """
+    if not is_binary_model(path):
+        with open(path, encoding="utf-8-sig") as fh:
+            return cast("dict[str, str]", json.load(fh))
+
+    sections, swap = _read_model(path, _KIND_UNIGRAM)
+    label_offsets, label_text, word_offsets, word_text, tag_ids = sections
+    labels = _read_string_table(_cast(label_offsets, "i", swap), label_text)
+    return _BinaryTagDict(
+        labels,
+        _cast(word_offsets, "i", swap),
+        word_text,
+        _cast(tag_ids, "i", swap),
+    )
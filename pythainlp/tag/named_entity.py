@@ -5,9 +5,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Optional, TypedDict, Union
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from types import ModuleType
 
     from pythainlp.phayathaibert.core import NamedEntityTagger
@@ -150,6 +151,41 @@ class NER:
             raise RuntimeError("Engine not initialized")
         return self.engine.get_ner(text, tag=tag, pos=pos)
 
+    def tag_batch(
+        self, texts: Iterable[str], pos: bool = False, tag: bool = False
+    ) -> list[Union[list[tuple[str, str]], list[tuple[str, str, str]], str]]:
+        """Tag named entities in many texts in IOB format.
+
+        Gives the same results as :meth:`tag` for each text.
+        The *thainer* engine tags all texts together with
+        :meth:`pythainlp.tag.thainer.ThaiNameTagger.get_ner_batch`;
+        other engines tag one text at a time.
+
+        :param Iterable[str] texts: texts in Thai to be tagged
+        :param bool pos: output with part-of-speech tags.\
+            (wangchanberta is not supported)
+        :param bool tag: output HTML-like tags.
+        :return: a list with the result of :meth:`tag` for each text
+        :rtype: list[Union[list[tuple[str, str]], \
+            list[tuple[str, str, str]], str]]
+        :Example:
+
+            >>> from pythainlp.tag import NER
+            >>>
+            >>> ner = NER("thainer")  # doctest: +SKIP
+            >>> ner.tag_batch(["รหัสไปรษณีย์ 19130", "example@gmail.com"],
+            ...               tag=True)  # doctest: +SKIP
+            ['รหัสไปรษณีย์ <ZIP>19130</ZIP>', '<EMAIL>example@gmail.com</EMAIL>']
+        """
+        if self.engine is None:
+            raise RuntimeError("Engine not initialized")
+        get_ner_batch: Optional[Callable[..., list[Any]]] = getattr(
+            self.engine, "get_ner_batch", None
+        )
+        if get_ner_batch is not None:
+            return get_ner_batch(texts, pos=pos, tag=tag)
+        return [self.engine.get_ner(text, tag=tag, pos=pos) for text in texts]
+
 
 class NNER:
     """Nested Named Entity Recognition
@@ -9,6 +9,7 @@ from typing import Optional
 
 from pythainlp.corpus import corpus_path, get_corpus_path
 from pythainlp.tag import PerceptronTagger, blackboard, orchid
+from pythainlp.tag.binary_model import resolve_model_path
 from pythainlp.tools.path import safe_path_join
 
 _BLACKBOARD_NAME: str = "blackboard_pt_tagger"
@@ -35,14 +36,16 @@ _TUD_TAGGER: Optional[PerceptronTagger] = None
 def _orchid_tagger() -> PerceptronTagger:
     global _ORCHID_TAGGER
     if not _ORCHID_TAGGER:
-        _ORCHID_TAGGER = PerceptronTagger(path=_ORCHID_PATH)
+        _ORCHID_TAGGER = PerceptronTagger(
+            path=resolve_model_path(_ORCHID_PATH)
+        )
     return _ORCHID_TAGGER
 
 
 def _pud_tagger() -> PerceptronTagger:
     global _PUD_TAGGER
     if not _PUD_TAGGER:
-        _PUD_TAGGER = PerceptronTagger(path=_PUD_PATH)
+        _PUD_TAGGER = PerceptronTagger(path=resolve_model_path(_PUD_PATH))
     return _PUD_TAGGER
 
 
@@ -57,21 +60,21 @@ def _blackboard_tagger() -> PerceptronTagger:
                 f"    Python: pythainlp.corpus.download('{_BLACKBOARD_NAME}')\n"
                 f"    CLI:    thainlp data get {_BLACKBOARD_NAME}"
             )
-        _BLACKBOARD_TAGGER = PerceptronTagger(path=path)
+        _BLACKBOARD_TAGGER = PerceptronTagger(path=resolve_model_path(path))
     return _BLACKBOARD_TAGGER
 
 
 def _tdtb() -> PerceptronTagger:
     global _TDTB_TAGGER
     if not _TDTB_TAGGER:
-        _TDTB_TAGGER = PerceptronTagger(path=_TDTB_PATH)
+        _TDTB_TAGGER = PerceptronTagger(path=resolve_model_path(_TDTB_PATH))
     return _TDTB_TAGGER
 
 
 def _tud_tagger() -> PerceptronTagger:
     global _TUD_TAGGER
     if not _TUD_TAGGER:
-        _TUD_TAGGER = PerceptronTagger(path=_TUD_PATH)
+        _TUD_TAGGER = PerceptronTagger(path=resolve_model_path(_TUD_PATH))
     return _TUD_TAGGER
 
 
@@ -107,3 +110,43 @@ def tag(words: list[str], corpus: str = "pud") -> list[tuple[str, str]]:
         word_tags = tagger.tag(words)
 
     return word_tags
+
+
+def tag_sents(
+    sentences: list[list[str]], corpus: str = "pud"
+) -> list[list[tuple[str, str]]]:
+    """Tag many lists of words with the tagger of one corpus.
+
+    The tagger is looked up once, and the sentences are tagged together
+    with :meth:`pythainlp.tag.PerceptronTagger.tag_sents`.
+
+    :param list sentences: a list of lists of tokenized words
+    :param str corpus: corpus name (orchid, pud)
+    :return: a list of lists of tuples (word, POS tag)
+    :rtype: list[list[tuple[str, str]]]
+    """
+    to_ud = False
+    if corpus[-3:] == "_ud":
+        to_ud = True
+
+    if corpus in ("orchid", "orchid_ud"):
+        sentences = [orchid.pre_process(words) for words in sentences]
+        sents_tags = _orchid_tagger().tag_sents(sentences)
+        sents_tags = [
+            orchid.post_process(word_tags, to_ud) for word_tags in sents_tags
+        ]
+    elif corpus in ("blackboard", "blackboard_ud"):
+        sentences = [blackboard.pre_process(words) for words in sentences]
+        sents_tags = _blackboard_tagger().tag_sents(sentences)
+        sents_tags = [
+            blackboard.post_process(word_tags, to_ud)
+            for word_tags in sents_tags
+        ]
+    elif corpus in ("tdtb"):
+        sents_tags = _tdtb().tag_sents(sentences)
+    elif corpus in ("tud"):
+        sents_tags = _tud_tagger().tag_sents(sentences)
+    else:  # by default, use "pud" for corpus
+        sents_tags = _pud_tagger().tag_sents(sentences)
+
+    return sents_tags
@@ -3,8 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional
 
+from pythainlp.tools.core import _bounded_pool_map, _resolve_num_workers
+
 
 def pos_tag(
     words: list[str], engine: str = "perceptron", corpus: str = "orchid"
@@ -119,13 +122,27 @@ def pos_tag(
     return word_tags
 
 
+def _tltk_tag_sents(
+    sentences: list[list[str]], corpus: str = "tnc"
+) -> list[list[tuple[str, str]]]:
+    from pythainlp.tag.tltk import pos_tag as tltk_pos_tag
+
+    return [tltk_pos_tag(words, corpus=corpus) for words in sentences]
+
+
 def pos_tag_sents(
     sentences: list[list[str]],
     engine: str = "perceptron",
     corpus: str = "orchid",
+    num_workers: Optional[int] = 1,
+    chunk_size: int = 1024,
 ) -> list[list[tuple[str, str]]]:
     """Marks sentences with part-of-speech (POS) tags.
 
+    The engine and its model are loaded once for all sentences,
+    which are then tagged together. For very large batches,
+    sentences can also be tagged in parallel using worker processes.
+
     :param list sentences: a list of lists of tokenized words
     :param str engine:
         * *perceptron* - perceptron tagger (default)
@@ -144,6 +161,10 @@ def pos_tag_sents(
             <https://github.com/UniversalDependencies/UD_Thai-PUD>`_ \
             treebanks, natively use Universal POS tags
         * *tnc* - Thai National Corpus (support tltk engine only)
+    :param int num_workers: number of worker processes.
+        1 (default) tags in the current process,
+        None uses the number of CPUs.
+    :param int chunk_size: number of sentences sent to a worker at a time
     :return: a list of lists of tuples (word, POS tag)
     :rtype: list[list[tuple[str, str]]]
 
@@ -160,10 +181,47 @@ def pos_tag_sents(
           ('ขา', 'NOUN')], [('นก', 'NOUN'), ('บิน', 'VERB'),
           ('กลับ', 'VERB'), ('รัง', 'NOUN')]]
     """
+    num_workers = _resolve_num_workers(num_workers, chunk_size)
+
     if not sentences:
         return []
 
-    return [pos_tag(sent, engine=engine, corpus=corpus) for sent in sentences]
+    _support_corpus = [
+        "blackboard",
+        "blackboard_ud",
+        "orchid",
+        "orchid_ud",
+        "pud",
+        "tdtb",
+        "tud",
+    ]
+
+    if engine == "perceptron" and corpus in _support_corpus:
+        from pythainlp.tag.perceptron import tag_sents as tag_sents_
+    elif engine == "tltk":
+        tag_sents_ = _tltk_tag_sents
+        corpus = "tnc"
+    elif engine == "unigram" and corpus in _support_corpus:
+        from pythainlp.tag.unigram import tag_sents as tag_sents_
+    else:
+        raise ValueError(
+            f"pos_tag not support {engine} engine or {corpus} corpus."
+        )
+
+    if num_workers == 1 or len(sentences) <= chunk_size:
+        return tag_sents_(sentences, corpus)
+
+    # Load the model before the pool starts, so forked workers inherit it
+    sents_tags = tag_sents_(sentences[:chunk_size], corpus)
+    sents_tags.extend(
+        _bounded_pool_map(
+            partial(tag_sents_, corpus=corpus),
+            sentences[chunk_size:],
+            num_workers,
+            chunk_size,
+        )
+    )
+    return sents_tags
 
 
 def pos_tag_transformers(
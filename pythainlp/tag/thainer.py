@@ -8,14 +8,16 @@ from __future__ import annotations
 __all__: list[str] = ["ThaiNameTagger"]
 
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from pythainlp.corpus import get_corpus_path, thai_stopwords
-from pythainlp.tag.pos_tag import pos_tag
+from pythainlp.tag.pos_tag import pos_tag, pos_tag_sents
 from pythainlp.tokenize import word_tokenize
 from pythainlp.util import is_thai
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pycrfsuite import (
         Tagger as CRFTagger,  # pyright: ignore[reportAttributeAccessIssue]  # pyrefly: ignore[missing-module-attribute]
     )
@@ -23,62 +25,85 @@ if TYPE_CHECKING:
 _TOKENIZER_ENGINE: str = "mm"
 
 
-def _is_stopword(word: str) -> bool:  # เช็คว่าเป็นคำฟุ่มเฟือย
-    return word in thai_stopwords()
+def _token_flags(
+    word: str,
+    stopwords: frozenset[str],
+    cache: dict[str, tuple[bool, bool, bool, bool]],
+) -> tuple[bool, bool, bool, bool]:
+    """Stopword, Thai, space, and digit flags of a word, memoized in cache."""
+    flags = cache.get(word)
+    if flags is None:
+        flags = (
+            word in stopwords,  # เช็คว่าเป็นคำฟุ่มเฟือย
+            is_thai(word),
+            word.isspace(),
+            word.isdigit(),
+        )
+        cache[word] = flags
+    return flags
 
 
 def _doc2features(
-    doc: list[tuple[str, str]], i: int
-) -> dict[str, Union[str, bool]]:
-    features: dict[str, Union[str, bool]]
-    word = doc[i][0]
-    postag = doc[i][1]
-
-    # Features from current word
-    features = {
-        "word.word": word,
-        "word.stopword": _is_stopword(word),
-        "word.isthai": is_thai(word),
-        "word.isspace": word.isspace(),
-        "postag": postag,
-        "word.isdigit": word.isdigit(),
-    }
-    if word.isdigit() and len(word) == 5:
-        features["word.islen5"] = True
-
-    # Features from previous word
-    if i > 0:
-        prevword = doc[i - 1][0]
-        prevpostag = doc[i - 1][1]
-        prev_features: dict[str, Union[str, bool]] = {
-            "word.prevword": prevword,
-            "word.previsspace": prevword.isspace(),
-            "word.previsthai": is_thai(prevword),
-            "word.prevstopword": _is_stopword(prevword),
-            "word.prevpostag": prevpostag,
-            "word.prevwordisdigit": prevword.isdigit(),
-        }
-        features.update(prev_features)
-    else:
-        features["BOS"] = True  # Special "Beginning of Sequence" tag
-
-    # Features from next word
-    if i < len(doc) - 1:
-        nextword = doc[i + 1][0]
-        nextpostag = doc[i + 1][1]
-        next_features: dict[str, Union[str, bool]] = {
-            "word.nextword": nextword,
-            "word.nextisspace": nextword.isspace(),
-            "word.nextpostag": nextpostag,
-            "word.nextisthai": is_thai(nextword),
-            "word.nextstopword": _is_stopword(nextword),
-            "word.nextwordisdigit": nextword.isdigit(),
+    doc: list[tuple[str, str]],
+    cache: Optional[dict[str, tuple[bool, bool, bool, bool]]] = None,
+) -> list[dict[str, Union[str, bool]]]:
+    """Features of every token in doc.
+
+    Flags of each token are computed once and shared by the features of
+    the token and its neighbours. ``cache`` keeps the flags of words
+    across documents.
+    """
+    if cache is None:
+        cache = {}
+    stopwords = thai_stopwords()
+    flags = [_token_flags(word, stopwords, cache) for word, _ in doc]
+
+    doc_features = []
+    last = len(doc) - 1
+    for i, (word, postag) in enumerate(doc):
+        stopword, isthai, isspace, isdigit = flags[i]
+
+        # Features from current word
+        features: dict[str, Union[str, bool]] = {
+            "word.word": word,
+            "word.stopword": stopword,
+            "word.isthai": isthai,
+            "word.isspace": isspace,
+            "postag": postag,
+            "word.isdigit": isdigit,
         }
-        features.update(next_features)
-    else:
-        features["EOS"] = True  # Special "End of Sequence" tag
-
-    return features
+        if isdigit and len(word) == 5:
+            features["word.islen5"] = True
+
+        # Features from previous word
+        if i > 0:
+            prevword, prevpostag = doc[i - 1]
+            stopword, isthai, isspace, isdigit = flags[i - 1]
+            features["word.prevword"] = prevword
+            features["word.previsspace"] = isspace
+            features["word.previsthai"] = isthai
+            features["word.prevstopword"] = stopword
+            features["word.prevpostag"] = prevpostag
+            features["word.prevwordisdigit"] = isdigit
+        else:
+            features["BOS"] = True  # Special "Beginning of Sequence" tag
+
+        # Features from next word
+        if i < last:
+            nextword, nextpostag = doc[i + 1]
+            stopword, isthai, isspace, isdigit = flags[i + 1]
+            features["word.nextword"] = nextword
+            features["word.nextisspace"] = isspace
+            features["word.nextpostag"] = nextpostag
+            features["word.nextisthai"] = isthai
+            features["word.nextstopword"] = stopword
+            features["word.nextwordisdigit"] = isdigit
+        else:
+            features["EOS"] = True  # Special "End of Sequence" tag
+
+        doc_features.append(features)
+
+    return doc_features
 
 
 class ThaiNameTagger:
@@ -194,7 +219,59 @@ class ThaiNameTagger:
         )
         x_test = ThaiNameTagger._extract_features(pos_tags)
         y = self.crf.tag(x_test)
+        return ThaiNameTagger._format_ner(pos_tags, y, pos, tag)
+
+    def get_ner_batch(
+        self, texts: Iterable[str], pos: bool = True, tag: bool = False
+    ) -> list[Union[list[tuple[str, str]], list[tuple[str, str, str]], str]]:
+        """Tag named-entities in many texts in IOB format.
+
+        Gives the same results as :meth:`get_ner` for each text.
+        All texts are POS tagged together with
+        :func:`pythainlp.tag.pos_tag_sents`, and the flags of each
+        distinct word (stopword, Thai, space, digit) are computed once
+        for all texts.
+
+        :param Iterable[str] texts: texts in Thai to be tagged
+        :param bool pos: To include POS tags in the results (`True`) or
+                            exclude (`False`). The default value is `True`
+        :param bool tag: output HTML-like tags.
+        :return: a list with the result of :meth:`get_ner` for each text
+        :rtype: list[Union[list[tuple[str, str]], \
+            list[tuple[str, str, str]], str]]
+
+        :Example:
+
+            >>> from pythainlp.tag.thainer import ThaiNameTagger
+            >>>
+            >>> ner = ThaiNameTagger()  # doctest: +SKIP
+            >>> ner.get_ner_batch(["รหัสไปรษณีย์ 19130", "example@gmail.com"],
+            ...                   tag=True)  # doctest: +SKIP
+            ['รหัสไปรษณีย์ <ZIP>19130</ZIP>', '<EMAIL>example@gmail.com</EMAIL>']
+        """
+        sents = [
+            word_tokenize(text, engine=_TOKENIZER_ENGINE) for text in texts
+        ]
+        sents_pos_tags = pos_tag_sents(
+            sents, engine="perceptron", corpus=self.pos_tag_name
+        )
+        cache: dict[str, tuple[bool, bool, bool, bool]] = {}
+        return [
+            ThaiNameTagger._format_ner(
+                pos_tags,
+                self.crf.tag(
+                    ThaiNameTagger._extract_features(pos_tags, cache)
+                ),
+                pos,
+                tag,
+            )
+            for pos_tags in sents_pos_tags
+        ]
 
+    @staticmethod
+    def _format_ner(
+        pos_tags: list[tuple[str, str]], y: list[str], pos: bool, tag: bool
+    ) -> Union[list[tuple[str, str]], list[tuple[str, str, str]], str]:
         sent_ner = [(pos_tags[i][0], data) for i, data in enumerate(y)]
 
         if tag:
@@ -229,5 +306,6 @@ class ThaiNameTagger:
     @staticmethod
     def _extract_features(
         doc: list[tuple[str, str]],
+        cache: Optional[dict[str, tuple[bool, bool, bool, bool]]] = None,
     ) -> list[dict[str, Union[str, bool]]]:
-        return [_doc2features(doc, i) for i in range(len(doc))]
+        return _doc2features(doc, cache)
@@ -5,11 +5,12 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Mapping
 from typing import Optional
 
 from pythainlp.corpus import corpus_path, get_corpus_path
 from pythainlp.tag import blackboard, orchid
+from pythainlp.tag.binary_model import load_unigram_model, resolve_model_path
 from pythainlp.tools.path import safe_path_join
 
 _ORCHID_FILENAME: str = "pos_orchid_unigram.json"
@@ -26,30 +27,28 @@ _BLACKBOARD_NAME: str = "blackboard_unigram_tagger"
 _TUD_FILENAME: str = "pos_tud_unigram.json"
 _TUD_PATH: str = safe_path_join(corpus_path(), _TUD_FILENAME)
 
-_ORCHID_TAGGER: Optional[dict[str, str]] = None
-_PUD_TAGGER: Optional[dict[str, str]] = None
-_BLACKBOARD_TAGGER: Optional[dict[str, str]] = None
-_TDTB_TAGGER: Optional[dict[str, str]] = None
-_TUD_TAGGER: Optional[dict[str, str]] = None
+_ORCHID_TAGGER: Optional[Mapping[str, str]] = None
+_PUD_TAGGER: Optional[Mapping[str, str]] = None
+_BLACKBOARD_TAGGER: Optional[Mapping[str, str]] = None
+_TDTB_TAGGER: Optional[Mapping[str, str]] = None
+_TUD_TAGGER: Optional[Mapping[str, str]] = None
 
 
-def _orchid_tagger() -> dict[str, str]:
+def _orchid_tagger() -> Mapping[str, str]:
     global _ORCHID_TAGGER
     if not _ORCHID_TAGGER:
-        with open(_ORCHID_PATH, encoding="utf-8-sig") as fh:
-            _ORCHID_TAGGER = json.load(fh)
+        _ORCHID_TAGGER = load_unigram_model(resolve_model_path(_ORCHID_PATH))
     return _ORCHID_TAGGER
 
 
-def _pud_tagger() -> dict[str, str]:
+def _pud_tagger() -> Mapping[str, str]:
     global _PUD_TAGGER
     if not _PUD_TAGGER:
-        with open(_PUD_PATH, encoding="utf-8-sig") as fh:
-            _PUD_TAGGER = json.load(fh)
+        _PUD_TAGGER = load_unigram_model(resolve_model_path(_PUD_PATH))
     return _PUD_TAGGER
 
 
-def _blackboard_tagger() -> dict[str, str]:
+def _blackboard_tagger() -> Mapping[str, str]:
     global _BLACKBOARD_TAGGER
     if not _BLACKBOARD_TAGGER:
         path = get_corpus_path(_BLACKBOARD_NAME)
@@ -60,35 +59,28 @@ def _blackboard_tagger() -> dict[str, str]:
                 f"    Python: pythainlp.corpus.download('{_BLACKBOARD_NAME}')\n"
                 f"    CLI:    thainlp data get {_BLACKBOARD_NAME}"
             )
-        with open(path, encoding="utf-8-sig") as fh:
-            _BLACKBOARD_TAGGER = json.load(fh)
+        _BLACKBOARD_TAGGER = load_unigram_model(resolve_model_path(path))
     return _BLACKBOARD_TAGGER
 
 
-def _thai_tdtb() -> dict[str, str]:
+def _thai_tdtb() -> Mapping[str, str]:
     global _TDTB_TAGGER
     if not _TDTB_TAGGER:
-        with open(_TDTB_PATH, encoding="utf-8-sig") as fh:
-            _TDTB_TAGGER = json.load(fh)
+        _TDTB_TAGGER = load_unigram_model(resolve_model_path(_TDTB_PATH))
     return _TDTB_TAGGER
 
 
-def _tud_tagger() -> dict[str, str]:
+def _tud_tagger() -> Mapping[str, str]:
     global _TUD_TAGGER
     if not _TUD_TAGGER:
-        with open(_TUD_PATH, encoding="utf-8-sig") as fh:
-            _TUD_TAGGER = json.load(fh)
+        _TUD_TAGGER = load_unigram_model(resolve_model_path(_TUD_PATH))
     return _TUD_TAGGER
 
 
 def _find_tag(
-    words: list[str], dictdata: dict[str, str], default_tag: str = ""
+    words: list[str], dictdata: Mapping[str, str], default_tag: str = ""
 ) -> list[tuple[str, str]]:
-    keys = list(dictdata.keys())
-    return [
-        (word, dictdata[word]) if word in keys else (word, default_tag)
-        for word in words
-    ]
+    return [(word, dictdata.get(word, default_tag)) for word in words]
 
 
 def tag(words: list[str], corpus: str = "pud") -> list[tuple[str, str]]:
@@ -121,3 +113,43 @@ def tag(words: list[str], corpus: str = "pud") -> list[tuple[str, str]]:
         word_tags = _find_tag(words, _pud_tagger())
 
     return word_tags
+
+
+def tag_sents(
+    sentences: list[list[str]], corpus: str = "pud"
+) -> list[list[tuple[str, str]]]:
+    """Tag many lists of words with the tagger of one corpus.
+
+    :param list sentences: a list of lists of tokenized words
+    :param str corpus: corpus name (orchid or pud)
+    :return: a list of lists of tuples (word, POS tag)
+    :rtype: list[list[tuple[str, str]]]
+    """
+    to_ud = False
+    if corpus[-3:] == "_ud":
+        to_ud = True
+
+    if corpus in ("orchid", "orchid_ud"):
+        dictdata = _orchid_tagger()
+        return [
+            orchid.post_process(
+                _find_tag(orchid.pre_process(words), dictdata), to_ud
+            )
+            for words in sentences
+        ]
+    elif corpus in ("blackboard", "blackboard_ud"):
+        dictdata = _blackboard_tagger()
+        return [
+            blackboard.post_process(
+                _find_tag(blackboard.pre_process(words), dictdata), to_ud
+            )
+            for words in sentences
+        ]
+    elif corpus in ("tdtb"):
+        dictdata = _thai_tdtb()
+    elif corpus in ("tud"):
+        dictdata = _tud_tagger()
+    else:  # by default, use "pud" for corpus
+        dictdata = _pud_tagger()
+
+    return [_find_tag(words, dictdata) for words in sentences]
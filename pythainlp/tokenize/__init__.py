@@ -9,18 +9,28 @@ __all__: list[str] = [
     "thai2fit_tokenizer",
     "Tokenizer",
     "Trie",
+    "WordTokenizeCache",
     "paragraph_tokenize",
     "sent_tokenize",
     "subword_tokenize",
     "syllable_tokenize",
     "word_detokenize",
     "word_tokenize",
+    "word_tokenize_batch",
+    "word_tokenize_spans",
+    "word_tokenize_stream",
     "display_cell_tokenize",
 ]
 
+import os
 from functools import lru_cache
+from typing import Union
 
-from pythainlp.corpus import thai_syllables, thai_words
+from pythainlp.corpus import corpus_path, thai_syllables, thai_words
+from pythainlp.util.double_array_trie import (
+    DoubleArrayTrie,
+    dict_trie_snapshot,
+)
 from pythainlp.util.trie import Trie
 
 DEFAULT_WORD_TOKENIZE_ENGINE: str = "newmm"
@@ -29,20 +39,52 @@ DEFAULT_SUBWORD_TOKENIZE_ENGINE: str = "tcc"
 DEFAULT_SYLLABLE_TOKENIZE_ENGINE: str = "han_solo"
 
 
+def _use_dict_snapshot() -> bool:
+    val = os.getenv("PYTHAINLP_DICT_SNAPSHOT", "")
+    return val.strip().lower() in ("1", "true", "yes", "on")
+
+
 @lru_cache
-def word_dict_trie() -> Trie:
-    """Lazy load default word dict trie with cache"""
+def word_dict_trie() -> Union[Trie, DoubleArrayTrie]:
+    """Lazy load default word dict trie with cache
+
+    If the ``PYTHAINLP_DICT_SNAPSHOT`` environment variable is set to
+    a truthy value (e.g. ``"1"``) when this is first called, returns
+    :func:`word_dict_trie_snapshot` instead of building a :class:`Trie`.
+    The snapshot cannot be changed with ``add()`` or ``remove()``.
+    """
+    if _use_dict_snapshot():
+        return word_dict_trie_snapshot()
     return Trie(thai_words())
 
 
 @lru_cache
-def syllable_dict_trie() -> Trie:
-    """Lazy load default syllable dict trie with cache"""
+def syllable_dict_trie() -> Union[Trie, DoubleArrayTrie]:
+    """Lazy load default syllable dict trie with cache
+
+    Returns :func:`syllable_dict_trie_snapshot` instead if
+    ``PYTHAINLP_DICT_SNAPSHOT`` is set, see :func:`word_dict_trie`.
+    """
+    if _use_dict_snapshot():
+        return syllable_dict_trie_snapshot()
     return Trie(thai_syllables())
 
 
+@lru_cache
+def word_dict_trie_snapshot() -> DoubleArrayTrie:
+    """Lazy load default word dict as a memory-mapped double-array trie"""
+    return dict_trie_snapshot(os.path.join(corpus_path(), "words_th.txt"))
+
+
+@lru_cache
+def syllable_dict_trie_snapshot() -> DoubleArrayTrie:
+    """Lazy load default syllable dict as a memory-mapped double-array trie"""
+    return dict_trie_snapshot(os.path.join(corpus_path(), "syllables_th.txt"))
+
+
 from pythainlp.tokenize.core import (
     Tokenizer,
+    WordTokenizeCache,
     display_cell_tokenize,
     paragraph_tokenize,
     sent_tokenize,
@@ -50,5 +92,8 @@ from pythainlp.tokenize.core import (
     syllable_tokenize,
     word_detokenize,
     word_tokenize,
+    word_tokenize_batch,
+    word_tokenize_spans,
+    word_tokenize_stream,
 )
 from pythainlp.tokenize.thai2fit import thai2fit_tokenizer
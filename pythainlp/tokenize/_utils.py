@@ -6,10 +6,11 @@
 from __future__ import annotations
 
 import re
+from array import array
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
 _DIGITS_WITH_SEPARATOR: re.Pattern[str] = re.compile(r"(\d+[\.\,:])+\d+")
 
@@ -88,3 +89,125 @@ def strip_whitespace(segments: list[str]) -> list[str]:
     """
     segments = [token.strip(" ") for token in segments if token.strip(" ")]
     return segments
+
+
+def segments_to_spans(text: str, segments: list[str]) -> array[int]:
+    """Character offsets of tokens in the text they were tokenized from.
+
+    :param str text: original text
+    :param list[str] segments: result from word tokenizer
+    :return: flat array of (start, end) pairs, end is exclusive
+    :rtype: array[int]
+
+    :Example:
+
+        >>> from pythainlp.tokenize._utils import segments_to_spans
+        >>> segments_to_spans("วันนี้ ฝนตก", ["วันนี้", " ", "ฝน", "ตก"]).tolist()
+        [0, 6, 6, 7, 7, 9, 9, 11]
+    """
+    spans = array("i")
+    pos = 0
+    for token in segments:
+        if not text.startswith(token, pos):
+            # the engine changed the text, find the token further on
+            found = text.find(token, pos)
+            if found >= 0:
+                pos = found
+        end = min(pos + len(token), len(text))
+        spans.append(pos)
+        spans.append(end)
+        pos = end
+
+    return spans
+
+
+def ends_to_spans(ends: Iterable[int]) -> array[int]:
+    """Character offsets of contiguous tokens, from their end offsets.
+
+    :param Iterable[int] ends: end offset of each token, in order;
+        the first token starts at 0 and each other token starts
+        where the previous one ends
+    :return: flat array of (start, end) pairs, end is exclusive
+    :rtype: array[int]
+
+    :Example:
+
+        >>> from pythainlp.tokenize._utils import ends_to_spans
+        >>> ends_to_spans([6, 7, 9, 11]).tolist()
+        [0, 6, 6, 7, 7, 9, 9, 11]
+    """
+    spans = array("i")
+    start = 0
+    for end in ends:
+        spans.append(start)
+        spans.append(end)
+        start = end
+
+    return spans
+
+
+def rejoin_formatted_num_spans(text: str, spans: array[int]) -> array[int]:
+    """Same as :func:`rejoin_formatted_num` but on token offsets.
+
+    :param str text: original text
+    :param array[int] spans: flat array of (start, end) pairs
+    :return: flat array of (start, end) pairs of fixed tokens
+    :rtype: array[int]
+
+    :Example:
+
+        >>> from pythainlp.tokenize._utils import rejoin_formatted_num_spans
+        >>> from array import array
+        >>> spans = array("i", [0, 4, 4, 5, 5, 7, 7, 8, 8, 11])
+        >>> rejoin_formatted_num_spans("เวลา12:00น", spans).tolist()
+        [0, 4, 4, 11]
+    """
+    spans_joined = array("i")
+    n = len(spans)
+    i = 0
+    for match in _DIGITS_WITH_SEPARATOR.finditer(text):
+        while i < n and spans[i] < match.start():
+            spans_joined.append(spans[i])
+            spans_joined.append(spans[i + 1])
+            i += 2
+        if i >= n:
+            break
+        start = end = spans[i]
+        while i < n and spans[i] < match.end():
+            end = spans[i + 1]
+            i += 2
+        if end > start:
+            spans_joined.append(start)
+            spans_joined.append(end)
+    spans_joined.extend(spans[i:])
+    return spans_joined
+
+
+def strip_whitespace_spans(text: str, spans: array[int]) -> array[int]:
+    """Same as :func:`strip_whitespace` but on token offsets.
+
+    :param str text: original text
+    :param array[int] spans: flat array of (start, end) pairs
+    :return: flat array of (start, end) pairs of tokens
+    :rtype: array[int]
+
+    :Example:
+
+        >>> from pythainlp.tokenize._utils import strip_whitespace_spans
+        >>> from array import array
+        >>> spans = array("i", [0, 1, 1, 8, 8, 13])
+        >>> strip_whitespace_spans(" วันนี้ เวลา ", spans).tolist()
+        [1, 7, 8, 12]
+    """
+    spans_stripped = array("i")
+    for i in range(0, len(spans), 2):
+        start = spans[i]
+        end = spans[i + 1]
+        while start < end and text[start] == " ":
+            start += 1
+        while end > start and text[end - 1] == " ":
+            end -= 1
+        if start < end:
+            spans_stripped.append(start)
+            spans_stripped.append(end)
+    return spans_stripped
@@ -5,12 +5,16 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import re
-from collections import deque
-from typing import TYPE_CHECKING, Optional, Union, cast
+import threading
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Optional, TextIO, Union, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 from pythainlp.tokenize import (
     DEFAULT_SENT_TOKENIZE_ENGINE,
@@ -23,13 +27,30 @@ from pythainlp.tokenize import (
 from pythainlp.tokenize._utils import (
     apply_postprocessors,
     rejoin_formatted_num,
+    rejoin_formatted_num_spans,
+    segments_to_spans,
     strip_whitespace,
+    strip_whitespace_spans,
 )
+from pythainlp.tools.core import _bounded_pool_map, _resolve_num_workers
+from pythainlp.util.double_array_trie import DoubleArrayTrie
 from pythainlp.util.trie import Trie, dict_trie
 
 _RE_WHITESPACE: re.Pattern[str] = re.compile(r"\s")
 _RE_WORD_CHAR: re.Pattern[str] = re.compile(r"\w")
 
+# engines that use word_dict_trie() when no custom_dict is given
+_DICT_WORD_TOKENIZE_ENGINES: frozenset[str] = frozenset(
+    ["longest", "mm", "multi_cut", "newmm", "newmm-safe", "onecut"]
+)
+
+# word_tokenize() keyword arguments of a batch worker process
+_batch_worker_kwargs: dict[str, Any] = {}
+
+# longest dictionary word expected to cross a cut point in a stream,
+# also how much text to hold back when a stream has to be cut anywhere
+_STREAM_LOOKBACK: int = 100
+
 
 def word_detokenize(
     segments: Union[list[list[str]], list[str]], output: str = "str"
@@ -102,12 +123,112 @@ def word_detokenize(
     return " ".join(text)
 
 
+class WordTokenizeCache:
+    """Least-recently-used cache of :func:`word_tokenize` results.
+
+    Results are keyed on the text, the engine, the dictionary,
+    *keep_whitespace* and *join_broken_num*. A dictionary is identified
+    by the object itself, so results made with another trie are not
+    reused, and adding or removing words from a :class:`Trie`
+    makes its earlier results unreachable. This also holds for the
+    default dictionary of the dictionary-based engines
+    (see :func:`pythainlp.tokenize.word_dict_trie`).
+    The cache does not keep dictionaries alive.
+    Unreachable results are dropped as newer ones are added.
+
+    Tokens are stored as tuples and each call gets a new list,
+    so changing a returned list does not change the cache.
+    A cache can be shared by :func:`word_tokenize` and any number of
+    :class:`Tokenizer` objects, also across threads.
+
+    :param int maxsize: maximum number of texts to keep, defaults to 4096
+
+    :Example:
+
+        >>> from pythainlp.tokenize import WordTokenizeCache, word_tokenize
+        >>> cache = WordTokenizeCache(maxsize=1000)
+        >>> word_tokenize("สวัสดีครับ", cache=cache)
+        ['สวัสดี', 'ครับ']
+        >>> word_tokenize("สวัสดีครับ", cache=cache)
+        ['สวัสดี', 'ครับ']
+        >>> cache.hits, cache.misses
+        (1, 1)
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        self.__maxsize: int = maxsize
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__data: OrderedDict[
+            tuple[Any, ...],
+            tuple[Optional[weakref.ref[Any]], tuple[str, ...]],
+        ] = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of texts to keep."""
+        return self.__maxsize
+
+    @property
+    def hits(self) -> int:
+        """Number of calls answered from the cache."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of calls that had to tokenize the text."""
+        return self.__misses
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def clear(self) -> None:
+        """Remove all results and reset the hit and miss counters."""
+        with self.__lock:
+            self.__data.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def _get(
+        self, key: tuple[Any, ...], custom_dict: Optional[object]
+    ) -> Optional[list[str]]:
+        with self.__lock:
+            entry = self.__data.get(key)
+            # The key holds the id() of the dictionary, which can be
+            # reused by a new object once the dictionary is gone
+            if entry is None or (
+                entry[0] is not None and entry[0]() is not custom_dict
+            ):
+                self.__misses += 1
+                return None
+            self.__data.move_to_end(key)
+            self.__hits += 1
+        return list(entry[1])
+
+    def _put(
+        self,
+        key: tuple[Any, ...],
+        custom_dict: Optional[object],
+        tokens: list[str],
+    ) -> None:
+        ref = None if custom_dict is None else weakref.ref(custom_dict)
+        with self.__lock:
+            self.__data[key] = (ref, tuple(tokens))
+            self.__data.move_to_end(key)
+            if len(self.__data) > self.__maxsize:
+                self.__data.popitem(last=False)
+
+
 def word_tokenize(
     text: str,
-    custom_dict: Optional[Trie] = None,
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None,
     engine: str = DEFAULT_WORD_TOKENIZE_ENGINE,
     keep_whitespace: bool = True,
     join_broken_num: bool = True,
+    cache: Optional[WordTokenizeCache] = None,
 ) -> list[str]:
     """Word tokenizer.
 
@@ -115,7 +236,8 @@ def word_tokenize(
 
     :param str text: text to be tokenized
     :param str engine: name of the tokenizer to be used
-    :param pythainlp.util.Trie custom_dict: dictionary trie
+    :param pythainlp.util.Trie custom_dict: dictionary trie,
+        or an immutable :class:`pythainlp.util.DoubleArrayTrie`
         (some engines may not support this)
     :param bool keep_whitespace: True to keep whitespace, a common
         marker for end of phrase in Thai.
@@ -123,6 +245,9 @@ def word_tokenize(
     :param bool join_broken_num: True to rejoin formatted numerics
         that could be wrongly separated (e.g., time, IP addresses).
         Otherwise, formatted numerics could be wrongly separated.
+    :param WordTokenizeCache cache: cache to look up and store results,
+        useful when the same texts are tokenized many times,
+        defaults to None (no caching)
 
     :return: list of words
     :rtype: list[str]
@@ -176,6 +301,8 @@ def word_tokenize(
           tokenization is in progress. The Trie data structure is not \
           thread-safe for concurrent modifications. Create your dictionary \
           before starting threads and only read from it during tokenization.
+          A :class:`pythainlp.util.DoubleArrayTrie` is immutable and \
+          can be shared between threads without this concern.
     :Example:
 
     Tokenize text with different tokenizers:
@@ -220,6 +347,23 @@ def word_tokenize(
     if not text or not isinstance(text, str):
         return []
 
+    if cache is not None:
+        # an empty dictionary means the engine's default dictionary
+        key_dict: Optional[Union[Trie, DoubleArrayTrie]] = custom_dict or None
+        if key_dict is None and engine in _DICT_WORD_TOKENIZE_ENGINES:
+            key_dict = word_dict_trie()
+        cache_key = (
+            text,
+            engine,
+            id(key_dict),
+            getattr(key_dict, "_version", 0),
+            keep_whitespace,
+            join_broken_num,
+        )
+        cached = cache._get(cache_key, key_dict)
+        if cached is not None:
+            return cached
+
     segments = []
 
     if custom_dict is None:
@@ -318,9 +462,340 @@ def word_tokenize(
 
     segments = apply_postprocessors(segments, postprocessors)
 
+    if cache is not None:
+        cache._put(cache_key, key_dict, segments)
+
     return segments
 
 
+def word_tokenize_spans(
+    text: str,
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None,
+    engine: str = DEFAULT_WORD_TOKENIZE_ENGINE,
+    keep_whitespace: bool = True,
+    join_broken_num: bool = True,
+) -> array[int]:
+    """Word tokenizer returning character offsets.
+
+    Tokenizes text like :func:`word_tokenize` but returns where each word
+    is in the text, as a flat array of ``(start, end)`` pairs:
+    ``text[spans[2 * i] : spans[2 * i + 1]]`` is the *i*-th word.
+    The *newmm*, *newmm-safe*, *longest* and *mm* engines give the
+    offsets straight from their dictionary search, without building
+    the words. For other engines, the offsets are found by matching
+    the words against the text.
+    Either way, there is no need for :func:`indices_words` afterwards.
+
+    :param str text: text to be tokenized
+    :param pythainlp.util.Trie custom_dict: dictionary trie,
+        or an immutable :class:`pythainlp.util.DoubleArrayTrie`
+        (some engines may not support this)
+    :param str engine: name of the tokenizer to be used,
+        see :func:`word_tokenize`
+    :param bool keep_whitespace: True to keep whitespace
+    :param bool join_broken_num: True to rejoin formatted numerics
+    :return: flat array of start and end (exclusive) offsets of words
+    :rtype: array[int]
+
+    :Example:
+
+        >>> from pythainlp.tokenize import word_tokenize_spans
+        >>> text = "ราคา 1,234.5 บาท"
+        >>> spans = word_tokenize_spans(text, keep_whitespace=False)
+        >>> spans.tolist()
+        [0, 4, 5, 12, 13, 16]
+        >>> [text[s:e] for s, e in zip(spans[::2], spans[1::2])]
+        ['ราคา', '1,234.5', 'บาท']
+    """
+    if not text or not isinstance(text, str):
+        return array("i")
+
+    if engine in ("newmm", "onecut", "newmm-safe"):
+        from pythainlp.tokenize.newmm import segment_spans
+
+        spans = segment_spans(
+            text, custom_dict, safe_mode=engine == "newmm-safe"
+        )
+    elif engine == "longest":
+        from pythainlp.tokenize.longest import (
+            segment_spans as longest_segment_spans,
+        )
+
+        spans = longest_segment_spans(text, custom_dict)
+    elif engine in ("mm", "multi_cut"):
+        from pythainlp.tokenize.multi_cut import (
+            segment_spans as multi_cut_segment_spans,
+        )
+
+        spans = multi_cut_segment_spans(text, custom_dict)
+    else:
+        # the engine may change the text, find its tokens in the text
+        segments = word_tokenize(
+            text,
+            custom_dict=custom_dict,
+            engine=engine,
+            keep_whitespace=True,
+            join_broken_num=False,
+        )
+        spans = segments_to_spans(text, segments)
+    if join_broken_num:
+        spans = rejoin_formatted_num_spans(text, spans)
+    if not keep_whitespace:
+        spans = strip_whitespace_spans(text, spans)
+
+    return spans
+
+
+def _init_batch_worker(kwargs: dict[str, Any]) -> None:
+    global _batch_worker_kwargs
+    _batch_worker_kwargs = kwargs
+
+
+def _word_tokenize_chunk(texts: list[str]) -> list[list[str]]:
+    return [word_tokenize(text, **_batch_worker_kwargs) for text in texts]
+
+
+def word_tokenize_batch(
+    texts: Iterable[str],
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None,
+    engine: str = DEFAULT_WORD_TOKENIZE_ENGINE,
+    keep_whitespace: bool = True,
+    join_broken_num: bool = True,
+    num_workers: Optional[int] = 1,
+    chunk_size: int = 256,
+) -> Iterator[list[str]]:
+    """Word tokenizer for many texts.
+
+    Tokenizes each text in ``texts`` like :func:`word_tokenize`,
+    optionally in parallel using a pool of worker processes.
+    Results are yielded in the same order as ``texts``,
+    as soon as they are ready, so ``texts`` can be a large or
+    endless stream.
+
+    Texts are sent to the workers in chunks of ``chunk_size``,
+    to reduce inter-process communication overhead.
+    The workers are started with the default start method of
+    :mod:`multiprocessing`.
+    With *fork* (the default on Linux before Python 3.14),
+    the workers share the dictionary trie with the parent process
+    instead of building or copying their own.
+    With *spawn* (the default on Windows and macOS) or *forkserver*
+    (the default on Linux since Python 3.14), each worker starts
+    a new interpreter: ``custom_dict`` is pickled and copied to
+    every worker, and the default dictionary is loaded again by each
+    worker, so the pool takes longer to start.
+    Set the ``PYTHAINLP_DICT_SNAPSHOT`` environment variable to ``1``
+    to have the workers map the default dictionary from a snapshot file
+    instead (see :func:`pythainlp.tokenize.word_dict_trie`).
+
+    :param Iterable[str] texts: texts to be tokenized
+    :param pythainlp.util.Trie custom_dict: dictionary trie,
+        or an immutable :class:`pythainlp.util.DoubleArrayTrie`
+        (some engines may not support this)
+    :param str engine: name of the tokenizer to be used,
+        see :func:`word_tokenize`
+    :param bool keep_whitespace: True to keep whitespace
+    :param bool join_broken_num: True to rejoin formatted numerics
+    :param int num_workers: number of worker processes.
+        1 (default) tokenizes in the current process,
+        None uses the number of CPUs.
+    :param int chunk_size: number of texts sent to a worker at a time
+    :return: an iterator of lists of words, one list for each text
+    :rtype: Iterator[list[str]]
+
+    :Example:
+
+        >>> from pythainlp.tokenize import word_tokenize_batch
+        >>> texts = ["ฉันรักภาษาไทย", "สวัสดีครับ"]
+        >>> list(word_tokenize_batch(texts))
+        [['ฉัน', 'รัก', 'ภาษาไทย'], ['สวัสดี', 'ครับ']]
+        >>> list(word_tokenize_batch(texts, num_workers=2))  # doctest: +SKIP
+        [['ฉัน', 'รัก', 'ภาษาไทย'], ['สวัสดี', 'ครับ']]
+    """
+    num_workers = _resolve_num_workers(num_workers, chunk_size)
+
+    kwargs: dict[str, Any] = {
+        "custom_dict": custom_dict,
+        "engine": engine,
+        "keep_whitespace": keep_whitespace,
+        "join_broken_num": join_broken_num,
+    }
+
+    if num_workers == 1:
+        return (word_tokenize(text, **kwargs) for text in texts)
+
+    if (
+        not custom_dict
+        and engine in _DICT_WORD_TOKENIZE_ENGINES
+        and multiprocessing.get_start_method() == "fork"
+    ):
+        # Build the default trie before the pool starts,
+        # so forked workers inherit it
+        word_dict_trie()
+
+    return _bounded_pool_map(
+        _word_tokenize_chunk,
+        texts,
+        num_workers,
+        chunk_size,
+        initializer=_init_batch_worker,
+        initargs=(kwargs,),
+    )
+
+
+def _find_stream_cut(
+    text: str,
+    begin: int,
+    end: int,
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]],
+) -> int:
+    """Find the last position in text[begin:end] where text can be split
+    without changing the tokenization, or 0 if there is none.
+
+    A safe position follows a newline, or follows a space or tab that is
+    not part of any dictionary word, and is followed by a non-space.
+    Text must extend _STREAM_LOOKBACK characters past end, so that
+    dictionary words crossing a position can be seen.
+    """
+    for cut in range(min(end, len(text) - 1), begin, -1):
+        if text[cut - 1] not in " \t\n" or text[cut].isspace():
+            continue
+        if text[cut - 1] == "\n" or custom_dict is None:
+            return cut
+        if not any(
+            end_pos > cut
+            for begin_pos in range(max(begin, cut - _STREAM_LOOKBACK), cut)
+            for end_pos in custom_dict.prefix_ends(text, begin_pos)
+        ):
+            return cut
+    return 0
+
+
+def word_tokenize_stream(
+    stream: Union[TextIO, Iterable[str]],
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None,
+    engine: str = DEFAULT_WORD_TOKENIZE_ENGINE,
+    keep_whitespace: bool = True,
+    join_broken_num: bool = True,
+    buffer_size: int = 65536,
+) -> Iterator[str]:
+    """Word tokenizer for text streams.
+
+    Tokenizes text from a file object or an iterable of text chunks
+    (e.g. lines) and yields tokens one by one, keeping only about
+    ``buffer_size`` characters in memory.
+
+    The text is buffered and tokenized piece by piece.
+    A piece ends at the last safe cut point in the buffer:
+    after a newline, or after a space or tab that is not part of
+    any dictionary word. Chunk boundaries do not matter.
+    For *newmm* and *mm*, the tokens are the same as
+    :func:`word_tokenize` on the whole text.
+
+    If a buffer has no safe cut point, such as a very long run of
+    Thai text without spaces, it is tokenized as a whole and only
+    its last few tokens are held back to be tokenized again with the
+    following text. Tokens at such a point may differ from
+    :func:`word_tokenize` on the whole text.
+
+    :param stream: a text file object, or an iterable of strings
+    :type stream: Union[TextIO, Iterable[str]]
+    :param pythainlp.util.Trie custom_dict: dictionary trie,
+        or an immutable :class:`pythainlp.util.DoubleArrayTrie`
+        (some engines may not support this)
+    :param str engine: name of the tokenizer to be used,
+        see :func:`word_tokenize`
+    :param bool keep_whitespace: True to keep whitespace
+    :param bool join_broken_num: True to rejoin formatted numerics
+    :param int buffer_size: number of characters to buffer before
+        tokenizing, also the size of each read from a file object
+    :return: an iterator of words
+    :rtype: Iterator[str]
+
+    :Example:
+
+        >>> from pythainlp.tokenize import word_tokenize_stream
+        >>> lines = ["ฉันรักภาษาไทย\\n", "สวัสดีครับ"]
+        >>> list(word_tokenize_stream(lines))
+        ['ฉัน', 'รัก', 'ภาษาไทย', '\\n', 'สวัสดี', 'ครับ']
+        >>> with open("corpus.txt", encoding="utf-8") as f:  # doctest: +SKIP
+        ...     for token in word_tokenize_stream(f):
+        ...         print(token)
+    """
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be at least 1.")
+
+    # Whitespace is stripped after cutting, so token lengths
+    # always match positions in the buffer
+    kwargs: dict[str, Any] = {
+        "custom_dict": custom_dict,
+        "engine": engine,
+        "keep_whitespace": True,
+        "join_broken_num": join_broken_num,
+    }
+    if custom_dict:
+        cut_dict: Optional[Union[Trie, DoubleArrayTrie]] = custom_dict
+    elif engine in _DICT_WORD_TOKENIZE_ENGINES:
+        cut_dict = word_dict_trie()
+    else:
+        cut_dict = None
+
+    if hasattr(stream, "read"):
+        read = cast("TextIO", stream).read
+        chunks: Iterable[str] = iter(lambda: read(buffer_size), "")
+    else:
+        chunks = stream
+
+    tokens = _word_tokenize_stream(chunks, kwargs, cut_dict, buffer_size)
+    if not keep_whitespace:
+        return (token.strip(" ") for token in tokens if token.strip(" "))
+    return tokens
+
+
+def _word_tokenize_stream(
+    chunks: Iterable[str],
+    kwargs: dict[str, Any],
+    cut_dict: Optional[Union[Trie, DoubleArrayTrie]],
+    buffer_size: int,
+) -> Iterator[str]:
+    buffer = ""
+    begin = 0  # start of the text not yet tokenized
+    # Small chunks, like lines, are joined only once there are enough
+    pending: list[str] = []
+    pending_size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if len(buffer) - begin + pending_size < buffer_size + _STREAM_LOOKBACK:
+            continue
+        buffer = buffer[begin:] + "".join(pending)
+        begin = 0
+        pending.clear()
+        pending_size = 0
+        while len(buffer) - begin >= buffer_size + _STREAM_LOOKBACK:
+            end = begin + buffer_size
+            cut = _find_stream_cut(buffer, begin, end, cut_dict)
+            if cut:
+                yield from word_tokenize(buffer[begin:cut], **kwargs)
+                begin = cut
+                continue
+
+            # No safe cut point, hold back the last tokens of the piece
+            # to be tokenized again with the following text
+            tokens = word_tokenize(buffer[begin:end], **kwargs)
+            n_tokens = len(tokens)
+            cut = end
+            while n_tokens > 1 and end - cut < _STREAM_LOOKBACK:
+                n_tokens -= 1
+                cut -= len(tokens[n_tokens])
+            yield from tokens[:n_tokens]
+            begin = cut
+
+    buffer = buffer[begin:] + "".join(pending)
+    if buffer:
+        yield from word_tokenize(buffer, **kwargs)
+
+
 def indices_words(words: list[str]) -> list[tuple[int, int]]:
     """Convert a list of words to a list of character index pairs.
 
@@ -848,23 +1323,30 @@ class Tokenizer:
 
     def __init__(
         self,
-        custom_dict: Union[Trie, Iterable[str], str, None] = None,
+        custom_dict: Union[
+            Trie, DoubleArrayTrie, Iterable[str], str, None
+        ] = None,
         engine: str = "newmm",
         keep_whitespace: bool = True,
         join_broken_num: bool = True,
+        cache: Optional[WordTokenizeCache] = None,
     ) -> None:
         """Initialize tokenizer object.
 
         :param custom_dict: a file path, a list of vocabularies to be
                     used to create a trie, or an instantiated
-                    :class:`pythainlp.util.Trie` object.
-        :type custom_dict: Union[Trie, Iterable[str], str, None]
+                    :class:`pythainlp.util.Trie` or
+                    :class:`pythainlp.util.DoubleArrayTrie` object.
+        :type custom_dict: Union[Trie, DoubleArrayTrie, Iterable[str], str, None]
         :param str engine: tokenizer engine
             (i.e. *newmm*, *mm*, *longest*, *deepcut*)
         :param bool keep_whitespace: True to keep whitespace, a common
             marker for end of phrase in Thai
+        :param WordTokenizeCache cache: cache of results for
+            :meth:`word_tokenize`, can be shared with other tokenizers
+            and :func:`pythainlp.tokenize.word_tokenize`
         """
-        self.__trie_dict: Trie = Trie([])
+        self.__trie_dict: Union[Trie, DoubleArrayTrie] = Trie([])
         if custom_dict:
             self.__trie_dict = dict_trie(custom_dict)
         else:
@@ -877,6 +1359,7 @@ class Tokenizer:
             )
         self.__keep_whitespace: bool = keep_whitespace
         self.__join_broken_num: bool = join_broken_num
+        self.__cache: Optional[WordTokenizeCache] = cache
 
     def word_tokenize(self, text: str) -> list[str]:
         """Main tokenization function.
@@ -898,6 +1381,66 @@ class Tokenizer:
             engine=self.__engine,
             keep_whitespace=self.__keep_whitespace,
             join_broken_num=self.__join_broken_num,
+            cache=self.__cache,
+        )
+
+    def word_tokenize_spans(self, text: str) -> array[int]:
+        """Tokenization function returning character offsets.
+
+        See :func:`pythainlp.tokenize.word_tokenize_spans`.
+
+        :param str text: text to be tokenized
+        :return: flat array of start and end (exclusive) offsets of words
+        :rtype: array[int]
+
+        :Example:
+
+            >>> from pythainlp.tokenize import Tokenizer
+            >>> tokenizer = Tokenizer()
+            >>> tokenizer.word_tokenize_spans("สวัสดีครับ").tolist()
+            [0, 6, 6, 10]
+        """
+        return word_tokenize_spans(
+            text,
+            custom_dict=self.__trie_dict,
+            engine=self.__engine,
+            keep_whitespace=self.__keep_whitespace,
+            join_broken_num=self.__join_broken_num,
+        )
+
+    def word_tokenize_batch(
+        self,
+        texts: Iterable[str],
+        num_workers: Optional[int] = 1,
+        chunk_size: int = 256,
+    ) -> Iterator[list[str]]:
+        """Tokenization function for many texts.
+
+        See :func:`pythainlp.tokenize.word_tokenize_batch`.
+
+        :param Iterable[str] texts: texts to be tokenized
+        :param int num_workers: number of worker processes.
+            1 (default) tokenizes in the current process,
+            None uses the number of CPUs.
+        :param int chunk_size: number of texts sent to a worker at a time
+        :return: an iterator of lists of words, one list for each text
+        :rtype: Iterator[list[str]]
+
+        :Example:
+
+            >>> from pythainlp.tokenize import Tokenizer
+            >>> tokenizer = Tokenizer()
+            >>> list(tokenizer.word_tokenize_batch(["สวัสดีครับ", "ภาษาไทย"]))
+            [['สวัสดี', 'ครับ'], ['ภาษาไทย']]
+        """
+        return word_tokenize_batch(
+            texts,
+            custom_dict=self.__trie_dict,
+            engine=self.__engine,
+            keep_whitespace=self.__keep_whitespace,
+            join_broken_num=self.__join_broken_num,
+            num_workers=num_workers,
+            chunk_size=chunk_size,
         )
 
     def set_tokenize_engine(self, engine: str) -> None:
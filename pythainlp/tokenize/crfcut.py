@@ -17,12 +17,19 @@ POS features are not used due to unreliable POS tagging available
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
 import pycrfsuite
 
 from pythainlp.corpus import corpus_path
 from pythainlp.tokenize import word_tokenize
+from pythainlp.tools.core import _bounded_pool_map, _resolve_num_workers
 from pythainlp.tools.path import safe_path_join
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 _ENDERS: set[str] = {
     # ending honorifics
     "ครับ",
@@ -125,12 +132,52 @@ _STARTERS: set[str] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _feature_templates(
+    window: int, max_n_gram: int
+) -> tuple[tuple[int, int, str, tuple[str, ...], tuple[str, ...]], ...]:
+    """Feature templates for each n-gram size and position in the window.
+
+    Each template is (n_gram, offset, word feature prefix,
+    ender features, starter features). Ender and starter features
+    are indexed by the bit mask of the enders or starters in the n-gram.
+    """
+    templates = []
+    for n_gram in range(1, min(max_n_gram + 1, 2 + window * 2)):
+        for offset in range(-window, window + 2 - n_gram):
+            position = f"{n_gram}_{offset}_{offset + n_gram}"
+            masks = range(1 << n_gram)
+            enders = tuple(
+                f"ender_{position}="
+                + "|".join(
+                    "ender" if mask >> k & 1 else "normal"
+                    for k in range(n_gram)
+                )
+                for mask in masks
+            )
+            starters = tuple(
+                f"starter_{position}="
+                + "|".join(
+                    "starter" if mask >> k & 1 else "normal"
+                    for k in range(n_gram)
+                )
+                for mask in masks
+            )
+            templates.append(
+                (n_gram, offset, f"word_{position}=", enders, starters)
+            )
+    return tuple(templates)
+
+
 def _extract_features(
     doc: list[str], window: int = 2, max_n_gram: int = 3
 ) -> list[list[str]]:
     """Extract features for CRF by sliding `max_n_gram` of tokens
     for +/- `window` from the current token
 
+    Each n-gram of the document is joined once and shared by the
+    features of all tokens whose window covers it.
+
     :param List[str] doc: tokens from which features are to be extracted
     :param int window: size of window before and after the current token
     :param int max_n_gram: create n_grams from 1-gram to `max_n_gram`-gram \
@@ -140,34 +187,63 @@ def _extract_features(
     if not doc:
         return []
 
-    doc_features = []
-    # Pad the document with "xxpad" tokens efficiently
+    templates = _feature_templates(window, max_n_gram)
     padded_doc = ["xxpad"] * window
     padded_doc.extend(doc)
     padded_doc.extend(["xxpad"] * window)
-    doc = padded_doc
 
-    # add enders and starters
-    doc_ender = ["ender" if token in _ENDERS else "normal" for token in doc]
-    doc_starter = [
-        "starter" if token in _STARTERS else "normal" for token in doc
-    ]
+    # n-grams, and bit masks of enders and starters in them,
+    # for each n-gram size and starting position
+    n_grams: dict[int, list[str]] = {1: padded_doc}
+    ender_masks: dict[int, list[int]] = {
+        1: [token in _ENDERS for token in padded_doc]
+    }
+    starter_masks: dict[int, list[int]] = {
+        1: [token in _STARTERS for token in padded_doc]
+    }
+    for n_gram in range(2, templates[-1][0] + 1):
+        shorter = n_grams[n_gram - 1]
+        n_grams[n_gram] = [
+            shorter[j] + "|" + padded_doc[j + n_gram - 1]
+            for j in range(len(padded_doc) - n_gram + 1)
+        ]
+        for masks in (ender_masks, starter_masks):
+            shorter_mask = masks[n_gram - 1]
+            unigram_mask = masks[1]
+            masks[n_gram] = [
+                shorter_mask[j] | unigram_mask[j + n_gram - 1] << n_gram - 1
+                for j in range(len(padded_doc) - n_gram + 1)
+            ]
 
-    # for each word
-    for i in range(window, len(doc) - window):
-        # bias term
+    bound_templates = [
+        (
+            offset,
+            prefix,
+            n_grams[n_gram],
+            enders,
+            ender_masks[n_gram],
+            starters,
+            starter_masks[n_gram],
+        )
+        for n_gram, offset, prefix, enders, starters in templates
+    ]
+    doc_features = []
+    for i in range(window, len(padded_doc) - window):
         word_features = ["bias"]
-        # ngram features
-        for n_gram in range(1, min(max_n_gram + 1, 2 + window * 2)):
-            for j in range(i - window, i + window + 2 - n_gram):
-                feature_position = f"{n_gram}_{j - i}_{j - i + n_gram}"
-                word_ = f"{'|'.join(doc[j : (j + n_gram)])}"
-                word_features += [f"word_{feature_position}={word_}"]
-                ender_ = f"{'|'.join(doc_ender[j : (j + n_gram)])}"
-                word_features += [f"ender_{feature_position}={ender_}"]
-                starter_ = f"{'|'.join(doc_starter[j : (j + n_gram)])}"
-                word_features += [f"starter_{feature_position}={starter_}"]
-        # append to feature per word
+        append = word_features.append
+        for (
+            offset,
+            prefix,
+            grams,
+            enders,
+            ender_mask,
+            starters,
+            starter_mask,
+        ) in bound_templates:
+            j = i + offset
+            append(prefix + grams[j])
+            append(enders[ender_mask[j]])
+            append(starters[starter_mask[j]])
         doc_features.append(word_features)
 
     return doc_features
@@ -178,32 +254,78 @@ _tagger: pycrfsuite.Tagger = pycrfsuite.Tagger()  # pyright: ignore[reportAttrib
 _tagger.open(safe_path_join(corpus_path(), _CRFCUT_DATA_FILENAME))
 
 
-def segment(text: str) -> list[str]:
-    """CRF-based sentence segmentation.
-
-    :param str text: text to be tokenized into sentences
-    :return: list of words, tokenized from the text
-    """
-    toks = word_tokenize(text)
-    feat = _extract_features(toks)
-    labs = _tagger.tag(feat)
+def _segment_tokens(toks: list[str]) -> list[str]:
+    """Group tokens into sentences with the CRF model."""
+    if not toks:
+        return []
+    labs = _tagger.tag(_extract_features(toks))
     labs[-1] = "E"  # make sure it cuts the last sentence
 
     # To ensure splitting of sentences using Terminal Punctuation
-    for idx, _ in enumerate(toks):
-        if toks[idx].strip().endswith(("!", ".", "?")):
+    for idx, tok in enumerate(toks):
+        stripped = tok.strip()
+        if stripped.endswith(("!", ".", "?")):
             labs[idx] = "E"
         # Spaces or empty strings would no longer be treated as end of sentence.
-        elif (idx == 0 or labs[idx - 1] == "E") and toks[idx].strip() == "":
+        elif (idx == 0 or labs[idx - 1] == "E") and stripped == "":
             labs[idx] = "I"
 
+    # join the tokens of each sentence once, from its first to last token
     sentences = []
-    sentence = ""
-    for i, w in enumerate(toks):
-        sentence = sentence + w
-        # Empty strings should not be part of output.
-        if labs[i] == "E" and sentence != "":
-            sentences.append(sentence)
-            sentence = ""
+    start = 0
+    for i, lab in enumerate(labs):
+        if lab == "E":
+            sentence = "".join(toks[start : i + 1])
+            # Empty strings should not be part of output.
+            if sentence:
+                sentences.append(sentence)
+            start = i + 1
 
     return sentences
+
+
+def segment(text: str) -> list[str]:
+    """CRF-based sentence segmentation.
+
+    :param str text: text to be tokenized into sentences
+    :return: list of words, tokenized from the text
+    """
+    return _segment_tokens(word_tokenize(text))
+
+
+def _segment_chunk(texts: list[str]) -> list[list[str]]:
+    return [segment(text) for text in texts]
+
+
+def segment_batch(
+    texts: Iterable[str],
+    num_workers: Optional[int] = 1,
+    chunk_size: int = 64,
+) -> Iterator[list[str]]:
+    """CRF-based sentence segmentation for many texts.
+
+    Segments each text in ``texts`` like :func:`segment`, optionally in
+    parallel using a pool of worker processes, each with its own CRF
+    tagger. Results are yielded in the same order as ``texts``, as soon
+    as they are ready.
+
+    :param Iterable[str] texts: texts to be tokenized into sentences
+    :param int num_workers: number of worker processes.
+        1 (default) segments in the current process,
+        None uses the number of CPUs.
+    :param int chunk_size: number of texts sent to a worker at a time
+    :return: an iterator of lists of sentences, one list for each text
+    :rtype: Iterator[list[str]]
+
+    :Example:
+
+        >>> from pythainlp.tokenize.crfcut import segment_batch
+        >>> texts = ["ผมกินข้าว เธอเล่นเกม", "สวัสดีครับ"]
+        >>> list(segment_batch(texts))  # doctest: +SKIP
+        [['ผมกินข้าว ', 'เธอเล่นเกม'], ['สวัสดีครับ']]
+    """
+    num_workers = _resolve_num_workers(num_workers, chunk_size)
+
+    if num_workers == 1:
+        return (segment(text) for text in texts)
+    return _bounded_pool_map(_segment_chunk, texts, num_workers, chunk_size)
@@ -14,13 +14,16 @@ from __future__ import annotations
 
 import re
 import threading
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
-    from pythainlp.util import Trie
+    from array import array
+
+    from pythainlp.util import DoubleArrayTrie, Trie
 
 from pythainlp import thai_tonemarks
 from pythainlp.tokenize import word_dict_trie
+from pythainlp.tokenize._utils import ends_to_spans
 
 _FRONT_DEP_CHAR: list[str] = [
     "ะ",
@@ -48,76 +51,74 @@ _UNKNOWN: bool = False
 
 
 class LongestMatchTokenizer:
-    __trie: Trie
+    __trie: Union[Trie, DoubleArrayTrie]
 
-    def __init__(self, trie: Trie) -> None:
-        self.__trie: Trie = trie
+    def __init__(self, trie: Union[Trie, DoubleArrayTrie]) -> None:
+        self.__trie: Union[Trie, DoubleArrayTrie] = trie
 
     @staticmethod
-    def __search_nonthai(text: str) -> Optional[str]:
-        match = _RE_NONTHAI.search(text)
+    def __search_nonthai(text: str, begin_pos: int) -> int:
+        """End of the non-Thai word at begin_pos, or begin_pos if none."""
+        match = _RE_NONTHAI.match(text, begin_pos)
         if not match:
-            return None
-        if match.group(0):
-            return match.group(0).lower()
-        return None
+            return begin_pos
+        return match.end()
 
     def __is_next_word_valid(self, text: str, begin_pos: int) -> bool:
-        text = text[begin_pos:].strip()
+        # skip leading whitespace, as if text[begin_pos:].strip()
+        len_text = len(text)
+        while begin_pos < len_text and text[begin_pos].isspace():
+            begin_pos += 1
 
-        if not text:
+        if begin_pos == len_text:
             return True
 
-        match = self.__search_nonthai(text)
-        if match:
+        if self.__search_nonthai(text, begin_pos) > begin_pos:
             return True
 
-        for pos in range(len(text) + 1):
-            if text[0:pos] in self.__trie:
-                return True
-
-        return False
+        return bool(self.__trie.prefix_ends(text, begin_pos))
 
-    def __longest_matching(self, text: str, begin_pos: int) -> str:
-        text = text[begin_pos:]
+    def __longest_matching(self, text: str, begin_pos: int) -> int:
+        """End of the longest word at begin_pos, or begin_pos if none."""
+        word_end = begin_pos
+        word_valid_end = begin_pos
 
-        match = self.__search_nonthai(text)
-        if match:
-            return match
+        for end_pos in self.__trie.prefix_ends(text, begin_pos):
+            word_end = end_pos
+            if self.__is_next_word_valid(text, end_pos):
+                word_valid_end = end_pos
 
-        word = None
-        word_valid = None
+        if word_end == begin_pos:
+            return begin_pos
 
-        for pos in range(len(text) + 1):
-            w = text[0:pos]
-            if w in self.__trie:
-                word = w
-                if self.__is_next_word_valid(text, pos):
-                    word_valid = w
+        if word_valid_end == begin_pos:
+            word_valid_end = word_end
 
-        if word:
-            if not word_valid:
-                word_valid = word
-
-            try:
-                len_word_valid = len(word_valid)
-                if text[len_word_valid] in _TRAILING_CHAR:
-                    return text[0 : len_word_valid + 1]
-                else:
-                    return word_valid
-            except IndexError:
-                return word_valid
-        else:
-            return ""
+        if (
+            word_valid_end < len(text)
+            and text[word_valid_end] in _TRAILING_CHAR
+        ):
+            return word_valid_end + 1
+        return word_valid_end
 
-    def __segment(self, text: str) -> list[str]:
+    def __segment(self, text: str) -> tuple[list[int], list[int]]:
+        """End positions of tokens, and the flat (start, end) pairs of
+        non-Thai words, which are lowercased in the tokens.
+        """
         begin_pos = 0
         len_text = len(text)
-        tokens: list[str] = []
+        token_ends: list[int] = []
         token_statuses: list[int] = []
+        nonthai_spans: list[int] = []
         while begin_pos < len_text:
-            match = self.__longest_matching(text, begin_pos)
-            if not match:
+            match_end = self.__search_nonthai(text, begin_pos)
+            if match_end > begin_pos:
+                nonthai_spans.append(begin_pos)
+                nonthai_spans.append(match_end)
+            else:
+                match_end = self.__longest_matching(text, begin_pos)
+
+            if match_end == begin_pos:
                 if (
                     begin_pos != 0
                     and not text[begin_pos].isspace()
@@ -128,56 +129,104 @@ class LongestMatchTokenizer:
                         or (token_statuses and token_statuses[-1] == _UNKNOWN)
                     )
                 ):
-                    tokens[-1] += text[begin_pos]
+                    token_ends[-1] = begin_pos + 1
                     token_statuses[-1] = _UNKNOWN
                 else:
-                    tokens.append(text[begin_pos])
+                    token_ends.append(begin_pos + 1)
                     token_statuses.append(_UNKNOWN)
                 begin_pos += 1
             else:
                 if begin_pos != 0 and text[begin_pos - 1] in _REAR_DEP_CHAR:
-                    tokens[-1] += match
+                    token_ends[-1] = match_end
                 else:
-                    tokens.append(match)
+                    token_ends.append(match_end)
                     token_statuses.append(_KNOWN)
-                begin_pos += len(match)
+                begin_pos = match_end
 
         # Group consecutive spaces into one token
-        grouped_tokens: list[str] = []
-        for token in tokens:
-            if (
-                token.isspace()
-                and grouped_tokens
-                and grouped_tokens[-1].isspace()
-            ):
-                grouped_tokens[-1] += token
+        grouped_ends: list[int] = []
+        prev_space = False
+        token_begin = 0
+        for token_end in token_ends:
+            space = text[token_begin:token_end].isspace()
+            if space and prev_space:
+                grouped_ends[-1] = token_end
             else:
-                grouped_tokens.append(token)
+                grouped_ends.append(token_end)
+            prev_space = space
+            token_begin = token_end
 
-        return grouped_tokens
+        return grouped_ends, nonthai_spans
 
     def tokenize(self, text: str) -> list[str]:
-        tokens = self.__segment(text)
+        token_ends, nonthai_spans = self.__segment(text)
+        if nonthai_spans:
+            # Lowercasing letters and digits keeps the positions
+            parts = []
+            begin_pos = 0
+            for i in range(0, len(nonthai_spans), 2):
+                start, end = nonthai_spans[i], nonthai_spans[i + 1]
+                parts.append(text[begin_pos:start])
+                parts.append(text[start:end].lower())
+                begin_pos = end
+            parts.append(text[begin_pos:])
+            text = "".join(parts)
+
+        tokens = []
+        begin_pos = 0
+        for end_pos in token_ends:
+            tokens.append(text[begin_pos:end_pos])
+            begin_pos = end_pos
         return tokens
 
+    def tokenize_spans(self, text: str) -> array[int]:
+        return ends_to_spans(self.__segment(text)[0])
+
 
 _tokenizers: dict[int, LongestMatchTokenizer] = {}
 _tokenizers_lock: threading.Lock = threading.Lock()
 
 
-def segment(text: str, custom_dict: Optional[Trie] = None) -> list[str]:
+def segment(
+    text: str, custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None
+) -> list[str]:
     """Dictionary-based longest matching word segmentation.
 
     This function is thread-safe. It uses a lock to protect access to the
     internal tokenizer cache.
 
     :param str text: text to be tokenized into words
-    :param pythainlp.util.Trie custom_dict: dictionary for tokenization
+    :param pythainlp.util.Trie custom_dict: dictionary for tokenization,
+        a :class:`pythainlp.util.DoubleArrayTrie` can also be used
     :return: list of words, tokenized from the text
     """
     if not text or not isinstance(text, str):
         return []
 
+    return _get_tokenizer(custom_dict).tokenize(text)
+
+
+def segment_spans(
+    text: str, custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None
+) -> array[int]:
+    """Same as :func:`segment` but returns character offsets of words,
+    taken from the matching without building the words.
+
+    :param str text: text to be tokenized into words
+    :param pythainlp.util.Trie custom_dict: dictionary for tokenization,
+        a :class:`pythainlp.util.DoubleArrayTrie` can also be used
+    :return: flat array of (start, end) pairs, end is exclusive
+    :rtype: array[int]
+    """
+    if not text or not isinstance(text, str):
+        return ends_to_spans(())
+
+    return _get_tokenizer(custom_dict).tokenize_spans(text)
+
+
+def _get_tokenizer(
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]],
+) -> LongestMatchTokenizer:
     if not custom_dict:
         custom_dict = word_dict_trie()
 
@@ -189,6 +238,4 @@ def segment(text: str, custom_dict: Optional[Trie] = None) -> list[str]:
             _tokenizers[custom_dict_ref_id] = LongestMatchTokenizer(
                 custom_dict
             )
-        tokenizer = _tokenizers[custom_dict_ref_id]
-
-    return tokenizer.tokenize(text)
+        return _tokenizers[custom_dict_ref_id]
@@ -15,14 +15,16 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
+    from array import array
     from collections.abc import Iterator
 
-    from pythainlp.util import Trie
+    from pythainlp.util import DoubleArrayTrie, Trie
 
 from pythainlp.tokenize import word_dict_trie
+from pythainlp.tokenize._utils import ends_to_spans
 
 
 class LatticeString(str):
@@ -65,61 +67,77 @@ _RE_NONTHAI: str = r"""(?x)
 _PAT_NONTHAI: re.Pattern[str] = re.compile(_RE_NONTHAI)
 
 
-def _multicut(
-    text: str, custom_dict: Optional[Trie] = None
-) -> Iterator[LatticeString]:
-    """Return LatticeString"""
-    if not custom_dict:
-        custom_dict = word_dict_trie()
-    len_text = len(text)
-    words_at: defaultdict[int, list[str]] = defaultdict(
-        list
-    )  # main data structure
-
-    def serialize(p: int, p2: int) -> Iterator[str]:  # helper function
-        for w in words_at[p]:
-            p_ = p + len(w)
-            if p_ == p2:
-                yield w
-            elif p_ < p2:
-                for path in serialize(p_, p2):
-                    yield w + "/" + path
+def _multicut_ends(
+    text: str,
+    custom_dict: Union[Trie, DoubleArrayTrie],
+    words_at: defaultdict[int, list[int]],
+) -> Iterator[tuple[int, bool]]:
+    """Return the end position of each LatticeString, and whether
+    it is in the dictionary.
 
+    words_at is filled with the end positions of the words starting at
+    each position.
+    """
+    len_text = len(text)
     q = {0}
-    last_p = 0  # last position for yield
     while min(q) < len_text:
         p = min(q)
         q -= {p}  # q.pop, but for set
 
-        for w in custom_dict.prefixes(text[p:]):
-            words_at[p].append(w)
-            q.add(p + len(w))
+        for p_ in custom_dict.prefix_ends(text, p):
+            words_at[p].append(p_)
+            q.add(p_)
 
         len_q = len(q)
 
         if len_q == 1:
-            q0 = min(q)
-            yield LatticeString(text[last_p:q0], list(serialize(last_p, q0)))
-            last_p = q0
+            yield min(q), True
         elif len_q == 0:  # len(q) == 0  means not found in dictionary
-            m = _PAT_NONTHAI.match(text[p:])
+            m = _PAT_NONTHAI.match(text, p)
             if m:  # non-Thai token
-                i = p + m.span()[1]
+                i = m.end()
             else:  # non-Thai token, find minimum skip
                 for i in range(p, len_text):
-                    ww = custom_dict.prefixes(text[i:])
-                    m = _PAT_NONTHAI.match(text[i:])
+                    ww = custom_dict.prefix_ends(text, i)
+                    m = _PAT_NONTHAI.match(text, i)
                     if ww or m:
                         break
                 else:
                     i = len_text
-            w = text[p:i]
-            words_at[p].append(w)
-            yield LatticeString(w, in_dict=False)
-            last_p = i
+            words_at[p].append(i)
+            yield i, False
             q.add(i)
 
 
+def _multicut(
+    text: str, custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None
+) -> Iterator[LatticeString]:
+    """Return LatticeString"""
+    if not custom_dict:
+        custom_dict = word_dict_trie()
+    # main data structure:
+    # - key is beginning position of a word
+    # - value is end positions of words starting there
+    words_at: defaultdict[int, list[int]] = defaultdict(list)
+
+    def serialize(p: int, p2: int) -> Iterator[str]:  # helper function
+        for p_ in words_at[p]:
+            w = text[p:p_]
+            if p_ == p2:
+                yield w
+            elif p_ < p2:
+                for path in serialize(p_, p2):
+                    yield w + "/" + path
+
+    last_p = 0  # last position for yield
+    for p, in_dict in _multicut_ends(text, custom_dict, words_at):
+        if in_dict:
+            yield LatticeString(text[last_p:p], list(serialize(last_p, p)))
+        else:
+            yield LatticeString(text[last_p:p], in_dict=False)
+        last_p = p
+
+
 def mmcut(text: str) -> list[str]:
     res = []
     for w in _multicut(text):
@@ -141,14 +159,16 @@ def _combine(ww: list[LatticeString]) -> Iterator[str]:
                     yield m.replace("/", "|") + "|" + tail
 
 
-def segment(text: str, custom_dict: Optional[Trie] = None) -> list[str]:
+def segment(
+    text: str, custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None
+) -> list[str]:
     """Dictionary-based maximum matching word segmentation.
 
     :param text: text to be tokenized
     :type text: str
     :param custom_dict: tokenization dictionary,\
         defaults to a Trie generated from pythainlp.corpus.thai_words
-    :type custom_dict: Trie, optional
+    :type custom_dict: Trie or DoubleArrayTrie, optional
     :return: list of segmented tokens
     :rtype: list[str]
     """
@@ -161,8 +181,32 @@ def segment(text: str, custom_dict: Optional[Trie] = None) -> list[str]:
     return list(_multicut(text, custom_dict=custom_dict))
 
 
+def segment_spans(
+    text: str, custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None
+) -> array[int]:
+    """Same as :func:`segment` but returns character offsets of tokens,
+    taken from the matching without building the tokens.
+
+    :param str text: text to be tokenized
+    :param custom_dict: tokenization dictionary,\
+        defaults to word_dict_trie()
+    :type custom_dict: Trie or DoubleArrayTrie, optional
+    :return: flat array of (start, end) pairs, end is exclusive
+    :rtype: array[int]
+    """
+    if not text or not isinstance(text, str):
+        return ends_to_spans(())
+
+    if not custom_dict:
+        custom_dict = word_dict_trie()
+
+    return ends_to_spans(
+        p for p, _ in _multicut_ends(text, custom_dict, defaultdict(list))
+    )
+
+
 def find_all_segment(
-    text: str, custom_dict: Optional[Trie] = None
+    text: str, custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None
 ) -> list[str]:
     """Get all possible segment variations.
 
@@ -170,7 +214,7 @@ def find_all_segment(
     :type text: str
     :param custom_dict: tokenization dictionary,\
         defaults to word_dict_trie()
-    :type custom_dict: Trie, optional
+    :type custom_dict: Trie or DoubleArrayTrie, optional
     :return: list of segment variations
     :rtype: list[str]
     """
@@ -5,7 +5,8 @@
 Thai Character Cluster (TCC) boundaries with improved rules.
 
 The codes are based on the notebooks created by Korakot Chaovavanich,
-with heuristic graph size limit added to avoid exponential waiting time.
+with the breadth-first path search replaced by dynamic programming
+to keep the running time linear on long ambiguous runs.
 
 :See Also:
     * \
@@ -17,16 +18,17 @@ with heuristic graph size limit added to avoid exponential waiting time.
 from __future__ import annotations
 
 import re
-from collections import defaultdict
 from heapq import heappop, heappush
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
+    from array import array
     from collections.abc import Generator
 
-    from pythainlp.util import Trie
+    from pythainlp.util import DoubleArrayTrie, Trie
 
 from pythainlp.tokenize import word_dict_trie
+from pythainlp.tokenize._utils import ends_to_spans
 from pythainlp.tokenize.tcc_p import tcc_pos_array
 
 # match non-Thai tokens
@@ -46,9 +48,6 @@ _PAT_NONTHAI: re.Pattern[str] = re.compile(
 _PAT_THAI_TWOCHARS: re.Pattern[str] = re.compile("[ก-ฮ]{,2}$")
 
 
-# maximum graph size before cutoff
-_MAX_GRAPH_SIZE: int = 50
-
 # window size for safe mode
 _TEXT_SCAN_POINT: int = 120
 _TEXT_SCAN_LEFT: int = 20
@@ -60,61 +59,71 @@ del _TEXT_SCAN_LEFT
 del _TEXT_SCAN_RIGHT
 
 
-def _bfs_paths_graph(
-    graph: defaultdict[int, list[int]], start: int, goal: int
-) -> Generator[list[int], None, None]:
-    # visited set prevents re-exploring nodes already reached via a shorter
-    # path, converting worst-case BFS from exponential to O(V + E).
-    visited: set[int] = {start}
-    queue = [(start, [start])]
-    while queue:
-        (vertex, path) = queue.pop(0)
-        for pos in graph[vertex]:
-            if pos == goal:
-                yield path + [pos]
-            elif pos not in visited:
-                visited.add(pos)
-                queue.append((pos, path + [pos]))
-
-
-def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
+def _shortest_path(
+    graph: dict[int, list[int]], start: int, goal: int
+) -> list[int]:
+    # Dynamic programming over the word lattice, from right to left.
+    # All edges point forward, and the keys of graph are in ascending
+    # order, so a reversed pass visits every position after its successors.
+    # dist[pos] is the minimum number of words from pos to goal and
+    # next_pos[pos] is the first successor, in dictionary order, that
+    # achieves it; this picks the same path a breadth-first search would.
+    dist = {goal: 0}
+    next_pos = {}
+    for pos in reversed(graph):
+        best = -1
+        for end_pos in graph[pos]:
+            d = dist.get(end_pos, -1)
+            if d >= 0 and (best < 0 or d < best):
+                best = d
+                next_pos[pos] = end_pos
+        if best >= 0:
+            dist[pos] = best + 1
+
+    path = []
+    pos = start
+    while pos != goal:
+        pos = next_pos[pos]
+        path.append(pos)
+    return path
+
+
+def _onecut_ends(
+    text: str, custom_dict: Union[Trie, DoubleArrayTrie]
+) -> Generator[int, None, None]:
+    # Yields the end position of each token; tokens are contiguous
     # main data structure:
     # - key is beginning position (int)
     # - value is possible ending positions (List[int])
-    # if key is not found, value is empty list
-    graph = defaultdict(list)
-
-    graph_size = 0  # keep track of graph size, if too big, force cutoff
+    # positions are added in ascending order, dead ends are left out
+    graph: dict[int, list[int]] = {}
 
     valid_poss = tcc_pos_array(text)  # bytearray of valid TCC break positions
 
     len_text = len(text)
     pos_list = [0]  # priority queue of possible breaking positions
+    queued = bytearray(len_text + 1)  # positions ever pushed to pos_list
     end_pos = 0
     while pos_list[0] < len_text:
         begin_pos = heappop(pos_list)
-        for word in custom_dict.prefixes(text, begin_pos):
-            end_pos_candidate = begin_pos + len(word)
-            if valid_poss[end_pos_candidate]:
-                graph[begin_pos].append(end_pos_candidate)
-                graph_size = graph_size + 1
-
-                if end_pos_candidate not in pos_list:
+        end_pos_candidates = [
+            end_pos_candidate
+            for end_pos_candidate in custom_dict.prefix_ends(text, begin_pos)
+            if valid_poss[end_pos_candidate]
+        ]
+        if end_pos_candidates:
+            graph[begin_pos] = end_pos_candidates
+            for end_pos_candidate in end_pos_candidates:
+                if not queued[end_pos_candidate]:
+                    queued[end_pos_candidate] = 1
                     heappush(pos_list, end_pos_candidate)
 
-                if graph_size > _MAX_GRAPH_SIZE:
-                    break
-
         len_pos_list = len(pos_list)
         if len_pos_list == 1:  # one candidate, no longer ambiguous
-            end_pos_candidates = next(
-                _bfs_paths_graph(graph, end_pos, pos_list[0])
-            )
-            graph_size = 0
-            graph.clear()
-            for pos in end_pos_candidates[1:]:
-                yield text[end_pos:pos]
+            for pos in _shortest_path(graph, end_pos, pos_list[0]):
+                yield pos
                 end_pos = pos
+            graph.clear()
         elif len_pos_list == 0:  # no candidate, deal with non-dictionary word
             m = _PAT_NONTHAI.match(text, begin_pos)
             if m:  # non-Thai token, skip to the end
@@ -122,15 +131,13 @@ def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
             else:  # Thai token, find minimum skip
                 for pos in range(begin_pos + 1, len_text):
                     if valid_poss[pos]:
-                        words = [
-                            word
-                            for word in custom_dict.prefixes(text, pos)
-                            if (
-                                valid_poss[pos + len(word)]
-                                and not _PAT_THAI_TWOCHARS.match(word)
+                        if any(
+                            valid_poss[word_end]
+                            and not _PAT_THAI_TWOCHARS.match(
+                                text, pos, word_end
                             )
-                        ]
-                        if words:  # is a Thai token that longer than 2 chars
+                            for word_end in custom_dict.prefix_ends(text, pos)
+                        ):  # is a Thai token that longer than 2 chars
                             end_pos = pos
                             break
 
@@ -141,15 +148,65 @@ def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
                 else:
                     end_pos = len_text
 
-            graph_size = 0
-            graph.clear()
-            yield text[begin_pos:end_pos]
+            yield end_pos
+            queued[end_pos] = 1
             heappush(pos_list, end_pos)
 
 
+def _segment_ends(
+    text: str, custom_dict: Union[Trie, DoubleArrayTrie], safe_mode: bool
+) -> Generator[int, None, None]:
+    # Yields the end position of each token in text
+    if not safe_mode or len(text) < _TEXT_SCAN_END:
+        yield from _onecut_ends(text, custom_dict)
+        return
+
+    # if the text is longer than the limit,
+    # break them into smaller chunks, then tokenize each chunk
+    part_begins = []
+    part_begin = 0
+    len_text = len(text)
+    while len_text - part_begin >= _TEXT_SCAN_END:
+        sample = text[
+            part_begin + _TEXT_SCAN_BEGIN : part_begin + _TEXT_SCAN_END
+        ]
+
+        # find possible breaking positions
+        cut_pos = _TEXT_SCAN_END
+
+        # try to break by space first
+        space_idx = sample.rfind(" ")
+        if space_idx >= 0:
+            cut_pos = space_idx + 1 + _TEXT_SCAN_BEGIN
+        else:
+            # choose the position that covers longest token
+            token_begin = 0
+            token_max_begin = 0
+            token_max_len = 0
+            for token_end in _onecut_ends(sample, custom_dict):
+                if token_end - token_begin >= token_max_len:
+                    token_max_len = token_end - token_begin
+                    token_max_begin = token_begin
+                token_begin = token_end
+            cut_pos = _TEXT_SCAN_BEGIN + token_max_begin
+
+        part_begins.append(part_begin)
+        part_begin += cut_pos
+
+    # append remaining text
+    if part_begin < len_text:
+        part_begins.append(part_begin)
+    part_begins.append(len_text)
+
+    # tokenizes each text part
+    for part_begin, part_end in zip(part_begins, part_begins[1:]):
+        for end_pos in _onecut_ends(text[part_begin:part_end], custom_dict):
+            yield part_begin + end_pos
+
+
 def segment(
     text: str,
-    custom_dict: Optional[Trie] = None,
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None,
     safe_mode: bool = False,
 ) -> list[str]:
     """Maximal-matching word segmentation constrained by Thai Character Cluster.
@@ -166,7 +223,7 @@ def segment(
     :type text: str
     :param custom_dict: tokenization dictionary,\
         defaults to word_dict_trie()
-    :type custom_dict: Trie, optional
+    :type custom_dict: Trie or DoubleArrayTrie, optional
     :param safe_mode: use chunk-based processing to reduce memory use and
         processing time for long text with many ambiguous breaking points,
         defaults to False
@@ -180,46 +237,41 @@ def segment(
     if not custom_dict:
         custom_dict = word_dict_trie()
 
-    if not safe_mode or len(text) < _TEXT_SCAN_END:
-        return list(_onecut(text, custom_dict))
+    tokens = []
+    begin_pos = 0
+    for end_pos in _segment_ends(text, custom_dict, safe_mode):
+        tokens.append(text[begin_pos:end_pos])
+        begin_pos = end_pos
 
-    # if the text is longer than the limit,
-    # break them into smaller chunks, then tokenize each chunk
-    text_parts = []
-    while len(text) >= _TEXT_SCAN_END:
-        sample = text[_TEXT_SCAN_BEGIN:_TEXT_SCAN_END]
+    return tokens
 
-        # find possible breaking positions
-        cut_pos = _TEXT_SCAN_END
 
-        # try to break by space first
-        space_idx = sample.rfind(" ")
-        if space_idx >= 0:
-            cut_pos = space_idx + 1 + _TEXT_SCAN_BEGIN
-        else:
-            tokens = list(_onecut(sample, custom_dict))
-            token_max_idx = 0
-            token_max_len = 0
-            for i, token in enumerate(tokens):
-                if len(token) >= token_max_len:
-                    token_max_len = len(token)
-                    token_max_idx = i
+def segment_spans(
+    text: str,
+    custom_dict: Optional[Union[Trie, DoubleArrayTrie]] = None,
+    safe_mode: bool = False,
+) -> array[int]:
+    """Same as :func:`segment` but returns character offsets of tokens,
+    taken from the path search without building the tokens.
 
-            # choose the position that covers longest token
-            cut_pos = _TEXT_SCAN_BEGIN
-            for i in range(0, token_max_idx):
-                cut_pos = cut_pos + len(tokens[i])
+    :param str text: text to be tokenized
+    :param custom_dict: tokenization dictionary,\
+        defaults to word_dict_trie()
+    :type custom_dict: Trie or DoubleArrayTrie, optional
+    :param bool safe_mode: see :func:`segment`
+    :return: flat array of (start, end) pairs, end is exclusive
+    :rtype: array[int]
 
-        text_parts.append(text[:cut_pos])
-        text = text[cut_pos:]
+    :Example:
 
-    # append remaining text
-    if len(text):
-        text_parts.append(text)
+        >>> from pythainlp.tokenize.newmm import segment_spans
+        >>> segment_spans("ฉันรักภาษาไทย").tolist()
+        [0, 3, 3, 6, 6, 13]
+    """
+    if not text or not isinstance(text, str):
+        return ends_to_spans(())
 
-    # tokenizes each text part
-    tokens = []
-    for text_part in text_parts:
-        tokens.extend(list(_onecut(text_part, custom_dict)))
+    if not custom_dict:
+        custom_dict = word_dict_trie()
 
-    return tokens
+    return ends_to_spans(_segment_ends(text, custom_dict, safe_mode))
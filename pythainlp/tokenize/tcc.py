@@ -61,6 +61,13 @@ ct[ะาำ]?k
 
 _PAT_TCC: re.Pattern[str] = re.compile("|".join(_RE_TCC))
 
+# A TCC, or any single character where no TCC rule matches.
+# Matches of this pattern are consecutive and cover the whole text,
+# so one finditer() pass finds every cluster without slicing the text.
+_PAT_TCC_SCAN: re.Pattern[str] = re.compile(
+    "|".join(_RE_TCC) + "|.", re.DOTALL
+)
+
 
 def tcc(text: str) -> Iterator[str]:
     """TCC generator which generates Thai Character Clusters
@@ -72,16 +79,8 @@ def tcc(text: str) -> Iterator[str]:
     if not text or not isinstance(text, str):
         return
 
-    len_text = len(text)
-    p = 0
-    while p < len_text:
-        m = _PAT_TCC.match(text[p:])
-        if m:
-            n = m.span()[1]
-        else:
-            n = 1
-        yield text[p : p + n]
-        p += n
+    for m in _PAT_TCC_SCAN.finditer(text):
+        yield m.group()
 
 
 def tcc_pos(text: str) -> set[int]:
@@ -94,13 +93,29 @@ def tcc_pos(text: str) -> set[int]:
     if not text or not isinstance(text, str):
         return set()
 
-    p_set = set()
-    p = 0
-    for w in tcc(text):
-        p += len(w)
-        p_set.add(p)
+    return {m.end() for m in _PAT_TCC_SCAN.finditer(text)}
+
+
+def tcc_pos_array(text: str) -> bytearray:
+    """TCC positions as a bytearray.
+
+    Returns a bytearray of length ``len(text) + 1`` where index ``i``
+    is ``1`` if position ``i`` is a valid Thai Character Cluster boundary,
+    and ``0`` otherwise.  Array-index lookup is faster and uses less
+    memory than set membership for large texts.
+
+    :param str text: text to be tokenized into character clusters
+    :return: bytearray of valid TCC boundary flags, indexed by position
+    :rtype: bytearray
+    """
+    if not text or not isinstance(text, str):
+        return bytearray(1)
+
+    arr = bytearray(len(text) + 1)
+    for m in _PAT_TCC_SCAN.finditer(text):
+        arr[m.end()] = 1
 
-    return p_set
+    return arr
 
 
 def segment(text: str) -> list[str]:
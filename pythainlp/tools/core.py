@@ -5,8 +5,19 @@
 
 from __future__ import annotations
 
+import os
 import sys
 import warnings
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 
 def warn_deprecation(
@@ -51,3 +62,67 @@ def safe_print(text: str) -> None:
                 sys.stdout.encoding
             )
         )
+
+
+def _resolve_num_workers(num_workers: Optional[int], chunk_size: int) -> int:
+    """Check the options of a batch function that can use worker processes.
+
+    :param num_workers: number of worker processes,
+        or ``None`` for the number of CPUs
+    :param int chunk_size: number of items sent to a worker at a time
+    :return: the number of worker processes
+    :rtype: int
+    :raises ValueError: if ``num_workers`` or ``chunk_size`` is less than 1
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers < 1:
+        raise ValueError("num_workers must be at least 1.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    return num_workers
+
+
+def _bounded_pool_map(
+    fn: Callable[[list[_T]], list[_R]],
+    iterable: Iterable[_T],
+    num_workers: int,
+    chunk_size: int,
+    initializer: Optional[Callable[..., object]] = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[_R]:
+    """Map a function over chunks of items in a pool of worker processes.
+
+    Items are sent to the workers in lists of ``chunk_size``.
+    At most two chunks per worker are in flight at a time, so
+    ``iterable`` can be a large or endless stream.
+    Results are yielded in the same order as the items.
+
+    :param fn: picklable function mapping a chunk to a list of results
+    :param iterable: items
+    :param int num_workers: number of worker processes
+    :param int chunk_size: number of items sent to a worker at a time
+    :param initializer: called with ``initargs`` when a worker starts
+    :param initargs: arguments of ``initializer``
+    :return: an iterator of results, one for each item
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    item_iter = iter(iterable)
+    # Keep a bounded number of chunks in flight to limit memory use
+    max_pending = num_workers * 2
+    pending: deque[Future[list[_R]]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(item_iter, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(fn, chunk))
+            if not pending:
+                break
+            yield from pending.popleft().result()
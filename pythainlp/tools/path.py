@@ -9,8 +9,9 @@ For text processing and text conversion, see pythainlp.util
 from __future__ import annotations
 
 import os
+import secrets
 import sys
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, BinaryIO, Callable, cast
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -259,6 +260,40 @@ def get_pythainlp_data_path() -> str:
     return path
 
 
+def _write_atomic(path: str, write: Callable[[BinaryIO], None]) -> None:
+    """Write a file through a temporary file in the same directory.
+
+    The temporary file is renamed to ``path`` once ``write`` returns,
+    so other processes never see a partially written file.
+    The file gets the usual permissions of a new file (``0o644`` minus
+    the umask), not the owner-only permissions of a temporary file,
+    so processes of other users can read it.
+
+    :param str path: path of the file to be written
+    :param Callable write: function that writes the content to the
+        binary file object it is given
+    """
+    abs_path = os.path.abspath(path)
+    # Not tempfile.mkstemp(), which makes the file readable by its owner
+    # only. The mode given to os.open() is reduced by the umask.
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = f"{abs_path}.{secrets.token_hex(8)}.tmp"
+        try:
+            fd = os.open(tmp_path, flags, 0o644)
+        except FileExistsError:
+            continue
+        break
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def get_pythainlp_path() -> str:
     """This function returns full path of PyThaiNLP codes.
 
@@ -4,6 +4,8 @@
 """Utility functions, like date conversion and digit conversion"""
 
 __all__: list[str] = [
+    "DoubleArrayTrie",
+    "TextPipeline",
     "Trie",
     "abbreviation_to_full_text",
     "arabic_digit_to_thai_digit",
@@ -17,6 +19,7 @@ __all__: list[str] = [
     "count_thai_chars",
     "countthai",
     "dict_trie",
+    "dict_trie_snapshot",
     "digit_to_text",
     "display_thai_char",
     "emoji_to_thai",
@@ -32,6 +35,7 @@ __all__: list[str] = [
     "longest_common_subsequence",
     "nectec_to_ipa",
     "normalize",
+    "normalize_batch",
     "now_reign_year",
     "num_to_thaiword",
     "num_to_thaiword_float",
@@ -96,6 +100,10 @@ from pythainlp.util.digitconv import (
     text_to_thai_digit,
     thai_digit_to_arabic_digit,
 )
+from pythainlp.util.double_array_trie import (
+    DoubleArrayTrie,
+    dict_trie_snapshot,
+)
 from pythainlp.util.emojiconv import emoji_to_thai
 from pythainlp.util.encoding import tis620_to_utf8, to_idna
 from pythainlp.util.keyboard import (
@@ -110,6 +118,7 @@ from pythainlp.util.normalize import (
     expand_maiyamok,
     maiyamok,
     normalize,
+    normalize_batch,
     remove_dangling,
     remove_dup_spaces,
     remove_repeat_vowels,
@@ -120,6 +129,7 @@ from pythainlp.util.normalize import (
 )
 from pythainlp.util.numtoword import bahttext, num_to_thaiword, num_to_thaiword_float
 from pythainlp.util.phoneme import ipa_to_rtgs, nectec_to_ipa, remove_tone_ipa
+from pythainlp.util.pipeline import TextPipeline
 from pythainlp.util.profanity import (
     censor_profanity,
     contains_profanity,
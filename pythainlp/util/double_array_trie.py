@@ -0,0 +1,455 @@
+# SPDX-FileCopyrightText: 2016-2026 PyThaiNLP Project
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+"""Immutable double-array trie.
+
+A compact, array-backed alternative to :class:`pythainlp.util.Trie`
+for large, read-only dictionaries such as the default tokenizer
+dictionary. The trie can be saved to a file and memory-mapped back,
+so processes can share one copy of the dictionary.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO, Optional, Union
+
+from pythainlp.tools import get_pythainlp_data_path, is_read_only_mode
+from pythainlp.tools.path import _write_atomic
+
+# Sentinel in the check array for an unused slot.
+# The root node is at index 0, so 0 cannot be used as "free".
+_FREE: int = -1
+
+# Snapshot file layout: header, UTF-8 alphabet padded to 4 bytes,
+# int32 base array, int32 check array, and one end flag byte per slot.
+_MAGIC: bytes = b"PTDA"
+_FORMAT_VERSION: int = 1
+_HEADER: struct.Struct = struct.Struct("<4sBBxxIII")
+_BYTEORDERS: tuple[str, str] = ("little", "big")
+
+_SNAPSHOT_DIRNAME: str = "trie"
+_SNAPSHOT_EXT: str = ".datrie"
+
+
+class DoubleArrayTrie(Iterable[str]):
+    """Immutable double-array trie for fast prefix-based word search.
+
+    The trie is built once from a list of words and stored in a few
+    flat integer arrays instead of one Python object per node.
+    This uses much less memory than :class:`pythainlp.util.Trie`
+    and makes each character transition a couple of array lookups.
+
+    It has the same read-only interface as :class:`pythainlp.util.Trie`
+    (``prefixes()``, ``prefix_ends()``, ``in``, iteration, and ``len()``)
+    and can be used as ``custom_dict`` for dictionary-based tokenizers
+    such as *newmm*, *longest*, and *mm*.
+    Words cannot be added or removed after construction;
+    build a new trie instead.
+
+    :param Iterable[str] words: an iterable collection of words.
+        Spaces in front of and following each word will be removed.
+
+    :Example:
+
+        >>> from pythainlp.util import DoubleArrayTrie
+        >>> trie = DoubleArrayTrie(["สวัสดี", "สวัส", "ดี", "ครับ"])
+        >>> "สวัสดี" in trie
+        True
+        >>> trie.prefixes("สวัสดีครับ")
+        ['สวัส', 'สวัสดี']
+        >>> len(trie)
+        4
+    """
+
+    __slots__: tuple[str, ...] = (
+        "__weakref__",
+        "_alphabet",
+        "_base",
+        "_check",
+        "_code",
+        "_end",
+        "_word_count",
+    )
+
+    _alphabet: str
+    _base: Union[array[int], memoryview]
+    _check: Union[array[int], memoryview]
+    _code: dict[str, int]
+    _end: Union[bytearray, memoryview]
+    _word_count: int
+
+    def __init__(self, words: Iterable[str]) -> None:
+        keys = sorted({w.strip() for w in words} - {""})
+        # Code 0 is reserved, so a child slot never equals its parent's base.
+        # Codes follow code point order, so the sorted keys are also sorted
+        # by code and siblings are visited in ascending code order.
+        alphabet = "".join(sorted({ch for w in keys for ch in w}))
+        code = {ch: i + 1 for i, ch in enumerate(alphabet)}
+
+        base: list[int] = [0]
+        check: list[int] = [_FREE]
+        end = bytearray(1)
+        # Disjoint-set forest over slots: following nxt from i leads to
+        # the first free slot at or after i, so the search for a base
+        # skips over occupied regions instead of scanning them.
+        nxt: list[int] = [0]
+
+        def _next_free(i: int) -> int:
+            root = i
+            while root < len(nxt) and nxt[root] != root:
+                root = nxt[root]
+            while i < len(nxt) and nxt[i] != i:
+                nxt[i], i = root, nxt[i]
+            return root
+
+        # Each stack item is a node index and the range of sorted keys,
+        # all sharing the node's prefix of length depth.
+        stack = [(0, 0, len(keys), 0)] if keys else []
+        while stack:
+            node, lo, hi, depth = stack.pop()
+            if len(keys[lo]) == depth:
+                # The shortest key in a sorted range is the prefix itself
+                end[node] = 1
+                lo += 1
+                if lo == hi:
+                    continue
+
+            # Group keys in [lo, hi) by the character at this depth
+            labels: list[int] = []
+            bounds: list[int] = []
+            prev = ""
+            for i in range(lo, hi):
+                ch = keys[i][depth]
+                if ch != prev:
+                    labels.append(code[ch])
+                    bounds.append(i)
+                    prev = ch
+            bounds.append(hi)
+
+            # Find the first base where every child slot is free
+            first = labels[0]
+            last = labels[-1]
+            pos = _next_free(first + 1)
+            while True:
+                b = pos - first
+                size = b + last + 1
+                if size > len(check):
+                    grow = size - len(check)
+                    base.extend([0] * grow)
+                    check.extend([_FREE] * grow)
+                    end.extend(bytes(grow))
+                    nxt.extend(range(len(nxt), size))
+                if all(check[b + c] == _FREE for c in labels):
+                    break
+                pos = _next_free(pos + 1)
+
+            base[node] = b
+            for c in labels:
+                check[b + c] = node
+                nxt[b + c] = b + c + 1
+            for j, c in enumerate(labels):
+                stack.append((b + c, bounds[j], bounds[j + 1], depth + 1))
+
+        # Pad the tail so base + code is always a valid index,
+        # which saves a bounds check on every transition.
+        pad = len(alphabet) + 1
+        base.extend([0] * pad)
+        check.extend([_FREE] * pad)
+        end.extend(bytes(pad))
+
+        self._alphabet = alphabet
+        self._code = code
+        self._base = array("i", base)
+        self._check = array("i", check)
+        self._end = end
+        self._word_count = len(keys)
+
+    def save(self, path: str) -> None:
+        """Save the trie to a file, to be loaded later with :meth:`load`.
+
+        The file is written to a temporary file first and then renamed,
+        so other processes never see a partially written file.
+
+        :param str path: path of the file to be written
+        """
+        alphabet = self._alphabet.encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            _BYTEORDERS.index(sys.byteorder),
+            self._word_count,
+            len(alphabet),
+            len(self._check),
+        )
+        padding = bytes(-len(alphabet) % 4)
+
+        def write(f: BinaryIO) -> None:
+            f.write(header)
+            f.write(alphabet)
+            f.write(padding)
+            f.write(memoryview(self._base).cast("B"))
+            f.write(memoryview(self._check).cast("B"))
+            f.write(self._end)
+
+        _write_atomic(path, write)
+
+    @classmethod
+    def load(cls, path: str) -> DoubleArrayTrie:
+        """Load a trie saved with :meth:`save`.
+
+        The file is memory-mapped read-only, so loading is nearly instant
+        and processes loading the same file share its memory pages.
+
+        :param str path: path of the file to be loaded
+        :return: a trie object
+        :rtype: pythainlp.util.DoubleArrayTrie
+        :raises ValueError: if the file is not a valid trie file
+        """
+        with open(path, "rb") as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file cannot be mapped
+                raise ValueError(f"{path} is not a trie file.") from None
+        view = memoryview(buf)
+
+        if len(view) < _HEADER.size:
+            raise ValueError(f"{path} is not a trie file.")
+        magic, version, byteorder, word_count, alphabet_size, size = (
+            _HEADER.unpack_from(view)
+        )
+        if magic != _MAGIC or byteorder > 1:
+            raise ValueError(f"{path} is not a trie file.")
+        if version != _FORMAT_VERSION:
+            raise ValueError(
+                f"{path} has unsupported trie file version {version}."
+            )
+        start = _HEADER.size + alphabet_size + (-alphabet_size % 4)
+        if len(view) != start + size * 9:
+            raise ValueError(f"{path} is truncated or corrupted.")
+
+        trie = cls.__new__(cls)
+        trie._alphabet = str(
+            view[_HEADER.size : _HEADER.size + alphabet_size], "utf-8"
+        )
+        trie._code = {ch: i + 1 for i, ch in enumerate(trie._alphabet)}
+        trie._word_count = word_count
+        base = view[start : start + size * 4]
+        check = view[start + size * 4 : start + size * 8]
+        trie._end = view[start + size * 8 :]
+        if _BYTEORDERS[byteorder] == sys.byteorder:
+            trie._base = base.cast("i")
+            trie._check = check.cast("i")
+        else:
+            # Byte-swapped copies cannot share the mapped pages
+            trie._base = array("i", base.tobytes())
+            trie._base.byteswap()
+            trie._check = array("i", check.tobytes())
+            trie._check.byteswap()
+        return trie
+
+    def __getstate__(self) -> tuple[str, int, bytes, bytes, bytes]:
+        # Memory-mapped arrays cannot be pickled, so copy them out
+        return (
+            self._alphabet,
+            self._word_count,
+            memoryview(self._base).cast("B").tobytes(),
+            memoryview(self._check).cast("B").tobytes(),
+            bytes(self._end),
+        )
+
+    def __setstate__(
+        self, state: tuple[str, int, bytes, bytes, bytes]
+    ) -> None:
+        alphabet, word_count, base, check, end = state
+        self._alphabet = alphabet
+        self._code = {ch: i + 1 for i, ch in enumerate(alphabet)}
+        self._word_count = word_count
+        self._base = array("i", base)
+        self._check = array("i", check)
+        self._end = bytearray(end)
+
+    def _walk(self, key: str) -> int:
+        """Return the node index reached by key, or -1 if there is none."""
+        base = self._base
+        check = self._check
+        code = self._code
+        node = 0
+        for ch in key:
+            c = code.get(ch)
+            if c is None:
+                return -1
+            t = base[node] + c
+            if check[t] != node:
+                return -1
+            node = t
+        return node
+
+    def prefixes(self, text: str, start: int = 0) -> list[str]:
+        """List all possible words from first sequence of characters in a word.
+
+        :param str text: text to search for prefixes
+        :param int start: starting position in text, defaults to 0
+        :return: a list of possible words starting at ``start``
+        :rtype: list[str]
+        """
+        res = []
+        base = self._base
+        check = self._check
+        code = self._code
+        end = self._end
+        node = 0
+        for i in range(start, len(text)):
+            c = code.get(text[i])
+            if c is None:
+                break
+            t = base[node] + c
+            if check[t] != node:
+                break
+            node = t
+            if end[node]:
+                res.append(text[start : i + 1])
+        return res
+
+    def prefix_ends(self, text: str, start: int = 0) -> list[int]:
+        """List end positions of all words in the trie found at ``start``.
+
+        Same as :meth:`prefixes` but returns positions instead of words,
+        so no substring is created. ``text[start:end]`` is a word for each
+        returned ``end``.
+
+        :param str text: text to search for prefixes
+        :param int start: starting position in text, defaults to 0
+        :return: a list of end positions (exclusive), in ascending order
+        :rtype: list[int]
+        """
+        res = []
+        base = self._base
+        check = self._check
+        code = self._code
+        end = self._end
+        node = 0
+        for i in range(start, len(text)):
+            c = code.get(text[i])
+            if c is None:
+                break
+            t = base[node] + c
+            if check[t] != node:
+                break
+            node = t
+            if end[node]:
+                res.append(i + 1)
+        return res
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        node = self._walk(key)
+        return node >= 0 and bool(self._end[node])
+
+    def __iter__(self) -> Iterator[str]:
+        # DFS in code order, so words are yielded in sorted order.
+        # Children of a node are found by probing every code in the
+        # alphabet, as the double array does not store child lists.
+        base = self._base
+        check = self._check
+        end = self._end
+        alphabet = self._alphabet
+
+        def _dfs(node: int, prefix: list[str]) -> Iterator[str]:
+            if end[node]:
+                yield "".join(prefix)
+            b = base[node]
+            for i, ch in enumerate(alphabet):
+                t = b + i + 1
+                if check[t] == node:
+                    prefix.append(ch)
+                    yield from _dfs(t, prefix)
+                    prefix.pop()
+
+        yield from _dfs(0, [])
+
+    def __len__(self) -> int:
+        return self._word_count
+
+
+def dict_trie_snapshot(
+    dict_source: str, snapshot_dir: Optional[str] = None
+) -> DoubleArrayTrie:
+    """Create a double-array trie from a dictionary file, via a snapshot.
+
+    The first call builds the trie from the file and saves it as a
+    snapshot. Later calls, including ones from other processes,
+    memory-map the snapshot instead of rebuilding the trie.
+
+    A snapshot is tied to the content of the dictionary file, so it is
+    rebuilt automatically when the file changes.
+    Outdated snapshots of the same file are removed.
+    In read-only mode (see :func:`pythainlp.tools.is_read_only_mode`),
+    no snapshot is written and the trie is built in memory.
+
+    :param str dict_source: path to dictionary file, one word per line
+    :param str snapshot_dir: directory to keep snapshots in,
+        defaults to ``trie`` in the PyThaiNLP data directory
+    :return: a trie object
+    :rtype: pythainlp.util.DoubleArrayTrie
+
+    :Example:
+
+        >>> import os
+        >>> from pythainlp.corpus import corpus_path
+        >>> from pythainlp.util import dict_trie_snapshot  # doctest: +SKIP
+        >>> path = os.path.join(corpus_path(), "words_th.txt")
+        >>> trie = dict_trie_snapshot(path)  # doctest: +SKIP
+        >>> "ภาษาไทย" in trie  # doctest: +SKIP
+        True
+    """
+    with open(dict_source, "rb") as f:
+        data = f.read()
+
+    # Name is unique per source path, content and snapshot format
+    abs_source = os.path.abspath(dict_source)
+    stem = os.path.splitext(os.path.basename(abs_source))[0]
+    source_id = hashlib.sha256(abs_source.encode("utf-8")).hexdigest()[:8]
+    content_hash = hashlib.sha256(data + bytes([_FORMAT_VERSION]))
+    content_id = content_hash.hexdigest()[:16]
+    prefix = f"{stem}-{source_id}-"
+    filename = f"{prefix}{content_id}{_SNAPSHOT_EXT}"
+
+    read_only = is_read_only_mode()
+    if snapshot_dir is None:
+        snapshot_dir = os.path.join(
+            get_pythainlp_data_path(), _SNAPSHOT_DIRNAME
+        )
+    snapshot_path = os.path.join(snapshot_dir, filename)
+
+    if os.path.isfile(snapshot_path):
+        try:
+            return DoubleArrayTrie.load(snapshot_path)
+        except ValueError:
+            pass  # corrupted snapshot, rebuild it
+
+    trie = DoubleArrayTrie(data.decode("utf-8-sig").splitlines())
+    if read_only:
+        return trie
+
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        trie.save(snapshot_path)
+        for name in os.listdir(snapshot_dir):
+            if (
+                name != filename
+                and name.startswith(prefix)
+                and name.endswith(_SNAPSHOT_EXT)
+            ):
+                os.remove(os.path.join(snapshot_dir, name))
+    except OSError:
+        pass  # a snapshot is only a cache, the trie is still usable
+
+    return trie
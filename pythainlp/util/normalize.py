@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import re
-from typing import Pattern, Union
+from typing import TYPE_CHECKING, Pattern, Union
 
 from pythainlp import thai_above_vowels as above_v
 from pythainlp import thai_below_vowels as below_v
@@ -17,6 +17,9 @@ from pythainlp import thai_tonemarks as tonemarks
 from pythainlp.tokenize import word_tokenize
 from pythainlp.tools import warn_deprecation
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 _DANGLING_CHARS: str = f"{above_v}{below_v}{tonemarks}\u0e3a\u0e4c\u0e4d\u0e4e"
 _RE_REMOVE_DANGLINGS: Pattern[str] = re.compile(f"^[{_DANGLING_CHARS}]+")
 _RE_REMOVE_DANGLINGS_AFTER_SPACE: Pattern[str] = re.compile(
@@ -41,14 +44,18 @@ _REORDER_PAIRS: list[tuple[str, str]] = [
     ),  # FOLLOW VOWEL + TONEMARK+ -> TONEMARK + FOLLOW VOWEL
     ("([^\u0e24\u0e26])\u0e45", "\\1\u0e32"),  # Lakkhangyao -> Sara Aa
 ]
+_RE_REORDER_PAIRS: list[tuple[Pattern[str], str]] = [
+    (re.compile(pattern), repl) for pattern, repl in _REORDER_PAIRS
+]
 
 # VOWELS + Phinthu, Thanthakhat, Nikhahit, Yamakkan
 _NOREPEAT_CHARS: str = (
     f"{follow_v}{lead_v}{above_v}{below_v}\u0e3a\u0e4c\u0e4d\u0e4e"
 )
-_NOREPEAT_PAIRS: list[tuple[str, str]] = list(
-    zip([f"({ch}[ ]*)+{ch}" for ch in _NOREPEAT_CHARS], _NOREPEAT_CHARS)
-)
+# A run of one of these characters, possibly with spaces in between,
+# becomes one character. Runs of different characters never merge,
+# so all characters are handled by one pattern.
+_RE_NOREPEAT: Pattern[str] = re.compile(f"([{_NOREPEAT_CHARS}])(?:[ ]*\\1)+")
 
 _RE_TONEMARKS: Pattern[str] = re.compile(f"[{tonemarks}]+")
 
@@ -61,6 +68,25 @@ _RE_REMOVE_SPACES_BEFORE_NONBASE: Pattern[str] = re.compile(
     f"([{thai_consonants}])(?<![{thai_vowels}][{thai_consonants}]) ([{_DANGLING_CHARS}])"
 )
 
+# Matches wherever a rule of remove_spaces_before_marks(),
+# remove_repeat_vowels() or remove_dangling() could change the text,
+# text without a match is already normalized by them
+_RE_NORMALIZE_RULES: Pattern[str] = re.compile(
+    "|".join(
+        [
+            f"^[{_DANGLING_CHARS}]",  # dangling at the beginning
+            f" [{_DANGLING_CHARS}]",  # space before a non-base character
+            "\u0e40\u0e40",  # Sara E + Sara E
+            f"[{tonemarks}\u0e4c][{above_v}{below_v}]",
+            f"\u0e4d[{tonemarks}]*\u0e32",
+            f"[{follow_v}][{tonemarks}]",
+            "[^\u0e24\u0e26]\u0e45",
+            f"(?P<ch>[{_NOREPEAT_CHARS}])[ ]*(?P=ch)",  # repeated vowel or sign
+            f"[{tonemarks}]{{2}}",  # repeated tone mark
+        ]
+    )
+)
+
 
 def _last_char(
     matchobj: re.Match[str],
@@ -115,7 +141,8 @@ def remove_dup_spaces(text: str) -> str:
     """
     while "  " in text:
         text = text.replace("  ", " ")
-    text = _RE_REMOVE_NEWLINES.sub("\n", text)
+    if "\n" in text:
+        text = _RE_REMOVE_NEWLINES.sub("\n", text)
     text = text.strip()
     return text
 
@@ -223,8 +250,8 @@ def reorder_vowels(text: str) -> str:
         >>> reorder_vowels("ก้ำ")  # reorder tone marks and vowels
         'ก้ำ'
     """
-    for pair in _REORDER_PAIRS:
-        text = re.sub(pair[0], pair[1], text)
+    for pattern, repl in _RE_REORDER_PAIRS:
+        text = pattern.sub(repl, text)
 
     return text
 
@@ -248,8 +275,7 @@ def remove_repeat_vowels(text: str) -> str:
         'ดี'
     """
     text = reorder_vowels(text)
-    for pair in _NOREPEAT_PAIRS:
-        text = re.sub(pair[0], pair[1], text)
+    text = _RE_NOREPEAT.sub("\\1", text)
 
     # remove repeating tone marks, use last tone mark
     text = _RE_TONEMARKS.sub(_last_char, text)
@@ -268,9 +294,12 @@ def normalize(text: str) -> str:
         * Remove duplicate tone marks
         * Remove dangling non-base characters at the beginning of text
 
-    normalize() simply call remove_zw(), remove_dup_spaces(),
-    remove_spaces_before_marks(), remove_repeat_vowels(), and
-    remove_dangling(), in that order.
+    normalize() gives the same result as calling remove_zw(),
+    remove_dup_spaces(), remove_spaces_before_marks(),
+    remove_repeat_vowels(), and remove_dangling(), in that order.
+    After removing zero-width characters and duplicate spaces,
+    it scans the text once for anything the other rules would change,
+    and returns text that needs no more changes right away.
 
     If a user wants to customize the selection or the order of rules
     to be applied, they can choose to call those functions by themselves.
@@ -291,6 +320,9 @@ def normalize(text: str) -> str:
     """
     text = remove_zw(text)
     text = remove_dup_spaces(text)
+    if not _RE_NORMALIZE_RULES.search(text):
+        return text
+
     text = remove_spaces_before_marks(text)
     text = remove_repeat_vowels(text)
     text = remove_dangling(text)
@@ -298,6 +330,28 @@ def normalize(text: str) -> str:
     return text
 
 
+def normalize_batch(texts: Iterable[str]) -> Iterator[str]:
+    """Normalize many texts with :func:`normalize`.
+
+    Texts are normalized one at a time as the result is consumed,
+    so ``texts`` can be a large or endless stream,
+    such as the lines of a file.
+
+    :param Iterable[str] texts: input texts
+    :return: an iterator of normalized texts, one for each text
+    :rtype: Iterator[str]
+
+    :Example:
+
+        >>> from pythainlp.util import normalize_batch
+        >>> list(normalize_batch(["เเปลก", "นานาาา"]))
+        ['แปลก', 'นานา']
+        >>> with open("corpus.txt", encoding="utf-8") as f:  # doctest: +SKIP
+        ...     lines = [line for line in normalize_batch(f)]
+    """
+    return map(normalize, texts)
+
+
 def expand_maiyamok(sent: Union[str, list[str]]) -> list[str]:
     """Expand Maiyamok.
 
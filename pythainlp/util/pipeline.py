@@ -0,0 +1,258 @@
+# SPDX-FileCopyrightText: 2016-2026 PyThaiNLP Project
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+"""Text cleanup pipeline made of the cleanup functions in pythainlp.util"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Callable, Union
+
+from pythainlp import thai_tonemarks
+from pythainlp.corpus import thai_words
+from pythainlp.util.digitconv import (
+    _arabic_thai_translate_table,
+    _digit_spell_translate_table,
+    _thai_arabic_translate_table,
+)
+from pythainlp.util.emojiconv import emoji_to_thai
+from pythainlp.util.normalize import (
+    _ZERO_WIDTH_CHARS,
+    expand_maiyamok,
+    normalize,
+    remove_dangling,
+    remove_dup_spaces,
+    remove_repeat_vowels,
+    remove_spaces_before_marks,
+    reorder_vowels,
+)
+from pythainlp.util.remove_trailing_repeat_consonants import (
+    _consonant_repeaters,
+    _remove_trailing_repeat_consonants,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+_TranslateTable = dict[int, Union[int, str, None]]
+
+
+def _compose_tables(
+    first: _TranslateTable, second: _TranslateTable
+) -> _TranslateTable:
+    """Translate table that does ``first``, then ``second``."""
+    table: _TranslateTable = {}
+    for key, value in first.items():
+        if value is None:
+            table[key] = None
+        else:
+            if isinstance(value, int):
+                value = chr(value)
+            table[key] = value.translate(second)
+    for key, value in second.items():
+        table.setdefault(key, value)
+    return table
+
+
+# Stages that replace or delete single characters, as translate tables.
+# Neighboring stages of this kind are merged into one str.translate().
+_TRANSLATE_STAGES: dict[str, _TranslateTable] = {
+    "remove_zw": dict.fromkeys(map(ord, _ZERO_WIDTH_CHARS)),
+    "remove_tonemark": dict.fromkeys(map(ord, thai_tonemarks)),
+    "thai_digit_to_arabic_digit": _thai_arabic_translate_table,
+    "arabic_digit_to_thai_digit": _arabic_thai_translate_table,
+    "digit_to_text": _compose_tables(
+        _thai_arabic_translate_table, _digit_spell_translate_table
+    ),
+}
+
+
+def _expand_maiyamok_text(text: str) -> str:
+    return "".join(expand_maiyamok(text))
+
+
+def _remove_trailing_repeat_consonants_stage() -> Callable[[str], str]:
+    # Find the words with repeated final consonants once, not per text.
+    # The stage keeps its own table, apart from the one of
+    # remove_trailing_repeat_consonants(), so neither changes the other.
+    repeaters = _consonant_repeaters(thai_words())
+
+    def stage(text: str) -> str:
+        return _remove_trailing_repeat_consonants(text, repeaters)
+
+    return stage
+
+
+# Other stages, as functions that make the stage function
+_FUNCTION_STAGES: dict[str, Callable[[], Callable[[str], str]]] = {
+    "normalize": lambda: normalize,
+    "reorder_vowels": lambda: reorder_vowels,
+    "remove_dup_spaces": lambda: remove_dup_spaces,
+    "remove_dangling": lambda: remove_dangling,
+    "remove_repeat_vowels": lambda: remove_repeat_vowels,
+    "remove_spaces_before_marks": lambda: remove_spaces_before_marks,
+    "expand_maiyamok": lambda: _expand_maiyamok_text,
+    "emoji_to_thai": lambda: emoji_to_thai,
+    "remove_trailing_repeat_consonants": (
+        _remove_trailing_repeat_consonants_stage
+    ),
+}
+
+
+class TextPipeline:
+    """Sequence of text cleanup stages, compiled once and run on many texts.
+
+    Each stage takes a text and returns a text.
+    A stage is either the name of a cleanup function in
+    :mod:`pythainlp.util`, or any function from str to str.
+
+    Stage names:
+
+        * *normalize*, *reorder_vowels*, *remove_dup_spaces*,
+          *remove_dangling*, *remove_repeat_vowels*,
+          *remove_spaces_before_marks*, *remove_zw*, *remove_tonemark* -
+          see the functions with the same names
+        * *thai_digit_to_arabic_digit*, *arabic_digit_to_thai_digit*,
+          *digit_to_text*, *emoji_to_thai* -
+          see the functions with the same names
+        * *remove_trailing_repeat_consonants* - with the default dictionary
+        * *expand_maiyamok* - :func:`pythainlp.util.expand_maiyamok`,
+          with the words joined back into a text
+
+    Neighboring stages that only replace or delete single characters
+    (*remove_zw*, *remove_tonemark*, and the digit conversions)
+    are merged into one stage that goes through the text once.
+    The result is the same as running the stages one by one.
+
+    The time spent in each (merged) stage is added up,
+    see :meth:`timings`.
+
+    :param Sequence stages: names of cleanup functions or functions
+        from str to str, in the order they are applied
+    :param bool timing: True (default) to time each stage
+
+    :Example:
+
+        >>> from pythainlp.util import TextPipeline
+        >>> pipeline = TextPipeline(
+        ...     ["remove_zw", "thai_digit_to_arabic_digit", "normalize"]
+        ... )
+        >>> pipeline.stage_names
+        ['remove_zw+thai_digit_to_arabic_digit', 'normalize']
+        >>> pipeline("เเปลก\\u200b ๑๒๓")
+        'แปลก 123'
+        >>> list(pipeline.run_batch(["นานาาา", "ดีีีี"]))
+        ['นานา', 'ดี']
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Union[str, Callable[[str], str]]],
+        timing: bool = True,
+    ) -> None:
+        self.timing: bool = timing
+        self._names: list[str] = []
+        self._funcs: list[Callable[[str], str]] = []
+
+        table: _TranslateTable = {}
+        table_names: list[str] = []
+        for stage in stages:
+            if isinstance(stage, str) and stage in _TRANSLATE_STAGES:
+                table = _compose_tables(table, _TRANSLATE_STAGES[stage])
+                table_names.append(stage)
+                continue
+
+            if table_names:
+                self._add_table_stage(table_names, table)
+                table, table_names = {}, []
+
+            if isinstance(stage, str):
+                if stage not in _FUNCTION_STAGES:
+                    raise ValueError(
+                        f"Unknown stage: {stage!r}. Available stages: "
+                        + ", ".join(
+                            sorted([*_TRANSLATE_STAGES, *_FUNCTION_STAGES])
+                        )
+                    )
+                self._names.append(stage)
+                self._funcs.append(_FUNCTION_STAGES[stage]())
+            elif callable(stage):
+                self._names.append(getattr(stage, "__name__", repr(stage)))
+                self._funcs.append(stage)
+            else:
+                raise TypeError(
+                    f"A stage must be a str or a callable, not {stage!r}."
+                )
+
+        if table_names:
+            self._add_table_stage(table_names, table)
+
+        self._seconds: list[float] = [0.0] * len(self._funcs)
+        self.num_texts: int = 0
+
+    def _add_table_stage(
+        self, names: list[str], table: _TranslateTable
+    ) -> None:
+        def stage(text: str) -> str:
+            return text.translate(table)
+
+        self._names.append("+".join(names))
+        self._funcs.append(stage)
+
+    @property
+    def stage_names(self) -> list[str]:
+        """Names of the stages after merging, in the order they run."""
+        return list(self._names)
+
+    def timings(self) -> list[tuple[str, float]]:
+        """Total time spent in each stage.
+
+        :return: pairs of stage name and seconds, in the order the
+            stages run
+        :rtype: list[tuple[str, float]]
+        """
+        return list(zip(self._names, self._seconds))
+
+    def reset_timings(self) -> None:
+        """Reset the time spent in each stage and the number of texts."""
+        self._seconds = [0.0] * len(self._funcs)
+        self.num_texts = 0
+
+    def __call__(self, text: str) -> str:
+        """Run all stages on a text.
+
+        :param str text: input text
+        :return: cleaned up text
+        :rtype: str
+        """
+        if not isinstance(text, str):
+            raise TypeError("The text must be str type.")
+
+        self.num_texts += 1
+        if not self.timing:
+            for func in self._funcs:
+                text = func(text)
+            return text
+
+        seconds = self._seconds
+        for i, func in enumerate(self._funcs):
+            start = time.perf_counter()
+            text = func(text)
+            seconds[i] += time.perf_counter() - start
+        return text
+
+    def run_batch(self, texts: Iterable[str]) -> Iterator[str]:
+        """Run all stages on many texts.
+
+        Texts are processed one at a time as the result is consumed,
+        so ``texts`` can be a large or endless stream,
+        such as the lines of a file.
+
+        :param Iterable[str] texts: input texts
+        :return: an iterator of cleaned up texts, one for each text
+        :rtype: Iterator[str]
+        """
+        return map(self, texts)
+
+    def __repr__(self) -> str:
+        return f"TextPipeline({self._names!r})"
@@ -73,6 +73,22 @@ def remove_trailing_repeat_consonants(
     if has_dictionary_updated:
         _update_consonant_repeaters(custom_dict)
 
+    return _remove_trailing_repeat_consonants(text, last_consonants_repeaters)
+
+
+def _remove_trailing_repeat_consonants(
+    text: str, repeaters: dict[str, list[str]]
+) -> str:
+    """Remove repeating consonants at the last of each segment of text.
+
+    Details are the same as remove_trailing_repeat_consonants().
+
+    :param str text: input text
+    :param dict[str, list[str]] repeaters: words that have repeating
+        consonants at the end, for each consonant
+    :return: text without repeating Thai consonants
+    :rtype: str
+    """
     # separate by newline
     modified_lines = []
     for line in text.split("\n"):
@@ -80,7 +96,7 @@ def remove_trailing_repeat_consonants(
 
         for cnt, segment in enumerate(segments):
             segments[cnt] = _remove_repeat_trailing_consonants_from_segment(
-                segment
+                segment, repeaters
             )
 
         # revert spaces
@@ -93,13 +109,17 @@ def remove_trailing_repeat_consonants(
     return modified_text
 
 
-def _remove_repeat_trailing_consonants_from_segment(segment: str) -> str:
+def _remove_repeat_trailing_consonants_from_segment(
+    segment: str, repeaters: dict[str, list[str]]
+) -> str:
     """Remove repeating consonants at the last of the segment.
 
     Processes only at the end of the given text.
     Details are the same as remove_repeat_consonants().
 
     :param str segment: segment of text
+    :param dict[str, list[str]] repeaters: words that have repeating
+        consonants at the end, for each consonant
     :return: segment without repeating Thai consonants
     :rtype: str
     """
@@ -120,14 +140,14 @@ def _remove_repeat_trailing_consonants_from_segment(segment: str) -> str:
 
     # find the words that has 2 or more duplication of
     # this character at the end.
-    repeaters = last_consonants_repeaters[dup]
+    dup_repeaters = repeaters[dup]
 
     # remove all of the last repeating character
     segment_head = _remove_all_last_consonants(segment, dup)
 
     # find the longest word that matches the segment
     longest_word, repetition = _find_longest_consonant_repeaters_match(
-        segment_head, repeaters
+        segment_head, dup_repeaters
     )
 
     if len(longest_word) > 0:
@@ -169,20 +189,35 @@ def _update_consonant_repeaters(custom_dict: Iterable[str]) -> None:
     Search all words in the dictionary that has more than 1 consonants
     repeating at the end and store them in the global dictionary.
 
-    :param str consonant: consonant to be searched
     :param Trie dictionary: Trie dictionary to search
     :rtype: None
     """
+    last_consonants_repeaters.update(_consonant_repeaters(custom_dict))
+
+
+def _consonant_repeaters(custom_dict: Iterable[str]) -> dict[str, list[str]]:
+    """Find all words that has repeating consonants at the end
+    from the dictionary.
+
+    Same as _update_consonant_repeaters(), but the words are returned
+    in a new dictionary and the global dictionary is left as is.
+
+    :param Trie dictionary: Trie dictionary to search
+    :return: words that have repeating consonants at the end,
+        for each consonant
+    :rtype: dict[str, list[str]]
+    """
     # initialize dictionary
-    for consonant in list(consonants):
-        last_consonants_repeaters[consonant] = []
+    repeaters: dict[str, list[str]] = {
+        consonant: [] for consonant in consonants
+    }
 
     # register
     for word in custom_dict:
         if _is_last_consonant_repeater(word):
-            last_consonants_repeaters[word[-1]].append(word)
+            repeaters[word[-1]].append(word)
 
-    return
+    return repeaters
 
 
 def _is_last_consonant_repeater(word: str) -> bool:
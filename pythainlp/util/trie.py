@@ -9,7 +9,9 @@ Designed to be used for tokenizer's dictionary, but can be for other purposes.
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
-from typing import Optional, Union
+from typing import Optional, Union, overload
+
+from pythainlp.util.double_array_trie import DoubleArrayTrie
 
 
 class Trie(Iterable[str]):
@@ -37,6 +39,7 @@ class Trie(Iterable[str]):
 
     root: Node
     _word_count: int
+    _version: int
 
     class Node:
         __slots__: tuple[str, str] = ("end", "children")
@@ -48,6 +51,8 @@ class Trie(Iterable[str]):
 
     def __init__(self, words: Iterable[str]) -> None:
         self._word_count: int = 0
+        # incremented on every change, used to invalidate cached results
+        self._version: int = 0
         self.root: Trie.Node = Trie.Node()
         for word in words:
             self.add(word)
@@ -71,6 +76,7 @@ class Trie(Iterable[str]):
         if not cur.end:
             cur.end = True
             self._word_count += 1
+            self._version += 1
 
     def remove(self, word: str) -> None:
         """Remove a word from the trie.
@@ -93,6 +99,7 @@ class Trie(Iterable[str]):
             return  # path exists but not a complete word
         node.end = False
         self._word_count -= 1
+        self._version += 1
         # Prune nodes that are now unused (not an end and no children).
         # parent.children is always non-None here because the path was
         # built by traversing through existing children dicts.
@@ -128,6 +135,43 @@ class Trie(Iterable[str]):
             i += 1
         return res
 
+    def prefix_ends(self, text: str, start: int = 0) -> list[int]:
+        """List end positions of all words in the trie found at ``start``.
+
+        Same as :meth:`prefixes` but returns positions instead of words,
+        so no substring is created. ``text[start:end]`` is a word for each
+        returned ``end``.
+
+        :param str text: text to search for prefixes
+        :param int start: starting position in text, defaults to 0
+        :return: a list of end positions (exclusive), in ascending order
+        :rtype: list[int]
+
+        :Example:
+
+            >>> from pythainlp.util import Trie
+            >>> trie = Trie(["สวัส", "สวัสดี", "ดี"])
+            >>> trie.prefix_ends("สวัสดีครับ")
+            [4, 6]
+            >>> trie.prefix_ends("สวัสดีครับ", 4)
+            [6]
+        """
+        res = []
+        cur = self.root
+        i = start
+        n = len(text)
+        while i < n:
+            if cur.children is None:
+                break
+            node = cur.children.get(text[i])
+            if node is None:
+                break
+            i += 1
+            if node.end:
+                res.append(i)
+            cur = node
+        return res
+
     def __contains__(self, key: str) -> bool:
         cur = self.root
         for ch in key:
@@ -158,17 +202,34 @@ class Trie(Iterable[str]):
         return self._word_count
 
 
-def dict_trie(dict_source: Union[str, Iterable[str], Trie]) -> Trie:
+@overload
+def dict_trie(dict_source: DoubleArrayTrie) -> DoubleArrayTrie: ...  # type: ignore[overload-overlap]
+
+
+@overload
+def dict_trie(dict_source: Union[str, Iterable[str], Trie]) -> Trie: ...
+
+
+def dict_trie(
+    dict_source: Union[str, Iterable[str], Trie, DoubleArrayTrie],
+) -> Union[Trie, DoubleArrayTrie]:
     """Create a dictionary trie from a file or an iterable.
 
+    A :class:`pythainlp.util.DoubleArrayTrie` is immutable,
+    so it is returned as is instead of being copied.
+
     :param str|Iterable[str]|pythainlp.util.Trie dict_source: a path to
         dictionary file or a list of words or a pythainlp.util.Trie object
-    :return: a trie object
-    :rtype: pythainlp.util.Trie
+        or a pythainlp.util.DoubleArrayTrie object
+    :return: a trie object, the same object if ``dict_source`` is
+        a :class:`pythainlp.util.DoubleArrayTrie`
+    :rtype: pythainlp.util.Trie or pythainlp.util.DoubleArrayTrie
     """
-    trie = Trie([])
+    trie: Union[Trie, DoubleArrayTrie] = Trie([])
 
-    if isinstance(dict_source, str) and len(dict_source) > 0:
+    if isinstance(dict_source, DoubleArrayTrie):
+        trie = dict_source
+    elif isinstance(dict_source, str) and len(dict_source) > 0:
         # dict_source is a path to dictionary text file
         with open(dict_source, encoding="utf8") as f:
             _vocabs = f.read().splitlines()
@@ -8,8 +8,19 @@ Initial code from https://github.com/cstorm125/thai2fit
 
 __all__: list[str] = [
     "WordVector",
+    "WordVectorIndex",
+    "load_word_vector_snapshot",
+    "save_word_vector_snapshot",
+    "word_vector_index",
+    "word_vector_snapshot",
 ]
 
 from pythainlp.word_vector.core import (
     WordVector,
 )
+from pythainlp.word_vector.index import WordVectorIndex, word_vector_index
+from pythainlp.word_vector.snapshot import (
+    load_word_vector_snapshot,
+    save_word_vector_snapshot,
+    word_vector_snapshot,
+)
@@ -3,12 +3,22 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import logging
-from collections.abc import Callable
-from typing import TYPE_CHECKING, cast
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Optional, cast
 
 from pythainlp.corpus import get_corpus_path
-from pythainlp.tokenize import thai2fit_tokenizer, word_tokenize
+from pythainlp.tokenize import (
+    thai2fit_tokenizer,
+    word_tokenize,
+    word_tokenize_batch,
+)
+from pythainlp.tools.core import _resolve_num_workers
+from pythainlp.word_vector.index import WordVectorIndex, word_vector_index
+from pythainlp.word_vector.snapshot import (
+    _load_word2vec_format,
+    word_vector_snapshot,
+)
 
 if TYPE_CHECKING:
     import numpy as np
@@ -23,17 +33,13 @@ _TK_SP: str = "xxspace"
 _TK_EOL: str = "xxeol"
 
 
-class _DuplicateWordFilter(logging.Filter):
-    """Suppress gensim's 'duplicate word' warnings for word2vec files."""
-
-    def filter(self, record: logging.LogRecord) -> bool:
-        return "duplicate word" not in record.getMessage()
-
-
 class WordVector:
     """Word Vector class
 
     :param str model_name: model name
+    :param bool use_snapshot: if `True` (default), load the model from a
+        memory-mapped snapshot, made on first use, instead of parsing the
+        model file (see :func:`pythainlp.word_vector.word_vector_snapshot`)
 
     **Options for model_name**
         * *thai2fit_wv* (default) - word vector from thai2fit
@@ -42,20 +48,31 @@ class WordVector:
         * *ltw2v_v1.0_5_window* - word vector from LTW2V v1.0 and 5 window
     """
 
-    def __init__(self, model_name: str = "thai2fit_wv") -> None:
+    def __init__(
+        self, model_name: str = "thai2fit_wv", use_snapshot: bool = True
+    ) -> None:
         self.model_name: str
         self.model: "Word2VecKeyedVectors"
         self.WV_DIM: int
         self.tokenize: Callable[[str], list[str]]
-        self.load_wordvector(model_name)
-
-    def load_wordvector(self, model_name: str) -> None:
+        self._tokenize_batch: Callable[..., Iterator[list[str]]]
+        self._corpus_file: str
+        self._use_snapshot: bool
+        self._index: Optional[WordVectorIndex]
+        self.load_wordvector(model_name, use_snapshot)
+
+    def load_wordvector(
+        self, model_name: str, use_snapshot: bool = True
+    ) -> None:
         """Load word vector model.
 
+        With a snapshot, the vectors are memory-mapped read-only, so
+        worker processes loading the same model share its memory pages.
+
         :param str model_name: model name
+        :param bool use_snapshot: if `True` (default), load the model from
+            a memory-mapped snapshot instead of parsing the model file
         """
-        from gensim.models import KeyedVectors
-
         self.model_name = model_name
         corpus_file = get_corpus_path(self.model_name)
         if not corpus_file:
@@ -65,23 +82,22 @@ class WordVector:
                 f"    Python: pythainlp.corpus.download('{model_name}')\n"
                 f"    CLI:    thainlp data get {model_name}"
             )
-        _filter = _DuplicateWordFilter()
-        _gensim_kv_logger = logging.getLogger("gensim.models.keyedvectors")
-        _gensim_kv_logger.addFilter(_filter)
-        try:
-            self.model = KeyedVectors.load_word2vec_format(
-                corpus_file,
-                binary=True,
-                unicode_errors="ignore",
-            )
-        finally:
-            _gensim_kv_logger.removeFilter(_filter)
+        if use_snapshot:
+            self.model = word_vector_snapshot(corpus_file)
+        else:
+            self.model = _load_word2vec_format(corpus_file)
         self.WV_DIM = self.model.vector_size
+        self._corpus_file = corpus_file
+        self._use_snapshot = use_snapshot
+        self._index = None
 
         if self.model_name == "thai2fit_wv":
-            self.tokenize = thai2fit_tokenizer().word_tokenize
+            tokenizer = thai2fit_tokenizer()
+            self.tokenize = tokenizer.word_tokenize
+            self._tokenize_batch = tokenizer.word_tokenize_batch
         else:
             self.tokenize = word_tokenize
+            self._tokenize_batch = word_tokenize_batch
 
     def get_model(self) -> Word2VecKeyedVectors:
         """Get word vector model.
@@ -272,6 +288,79 @@ class WordVector:
         """
         return cast(float, self.model.similarity(word1, word2))
 
+    def get_index(self, n_lists: Optional[int] = None) -> WordVectorIndex:
+        """Get the approximate nearest-neighbor index of the model.
+
+        The index is built on first use. With a snapshot (see
+        ``use_snapshot``), it is saved next to the snapshot and later
+        loaded from there, see
+        :func:`pythainlp.word_vector.word_vector_index`.
+
+        :param int n_lists: number of clusters of the index,
+            see :class:`pythainlp.word_vector.WordVectorIndex`
+        :return: index of the word vectors of the model
+        :rtype: pythainlp.word_vector.WordVectorIndex
+        """
+        if self._index is not None and (
+            n_lists is None or self._index.n_lists == n_lists
+        ):
+            return self._index
+        if self._use_snapshot:
+            self._index = word_vector_index(
+                self._corpus_file, self.model, n_lists=n_lists
+            )
+        else:
+            self._index = WordVectorIndex(self.model.vectors, n_lists=n_lists)
+        return self._index
+
+    def most_similar_batch(
+        self, words: Iterable[str], topn: int = 10, n_probe: int = 16
+    ) -> list[list[tuple[str, float]]]:
+        """Find the most similar words of many words, approximately.
+
+        Uses the approximate nearest-neighbor index of the model
+        (see :meth:`get_index`) to look up all words at once,
+        instead of comparing each word with the whole vocabulary.
+        For each word, the result is like ``model.most_similar(word)``:
+        the words with the highest cosine similarity,
+        not including the word itself.
+        A few of them may be missed, and similarities are accurate to
+        about three significant digits.
+
+        :param Iterable[str] words: words to find similar words of
+        :param int topn: number of similar words for each word
+        :param int n_probe: number of clusters of the index to look in,
+            higher is slower and more accurate
+
+        :raises KeyError: if there is any word in `words` that is not in
+                          the vocabulary of the model.
+        :return: for each word, a list of similar words and their
+                 similarity, most similar first
+        :rtype: list[list[tuple[str, float]]]
+
+        :Example:
+
+        >>> from pythainlp.word_vector import WordVector
+        >>>
+        >>> wv = WordVector()
+        >>> similar = wv.most_similar_batch(["แม่น้ำ", "ภูเขา"], topn=3)
+        >>> [word for word, _ in similar[0]]
+        ['ลำน้ำ', 'ทะเลสาบ', 'ลุ่มน้ำ']
+        """
+        rows = [self.model.get_index(word) for word in words]
+        if not rows:
+            return []
+        ids, scores = self.get_index().search_rows(rows, topn, n_probe)
+        index_to_key = self.model.index_to_key
+        return [
+            [
+                (index_to_key[i], float(score))
+                for i, score in zip(row_ids.tolist(), row_scores)
+                if i >= 0
+            ]
+            for row_ids, row_scores in zip(ids, scores)
+        ]
+
     def sentence_vectorizer(
         self, text: str, use_mean: bool = True
     ) -> "NDArray[np.float32]":
@@ -327,16 +416,115 @@ class WordVector:
         if not len_words:
             return vec
 
-        for word in words:
-            if word == " " and self.model_name == "thai2fit_wv":
-                word = _TK_SP
-            elif word == "\n" and self.model_name == "thai2fit_wv":
-                word = _TK_EOL
-
-            if word in self.model.index_to_key:
-                vec += self.model.get_vector(word)
+        for index in self._word_ids(words):
+            vec += self.model.vectors[index]
 
         if use_mean:
             vec /= len_words
 
         return vec
+
+    def _word_ids(self, words: list[str]) -> list[int]:
+        """Vocabulary indexes of the words that are in the vocabulary."""
+        key_to_index = self.model.key_to_index
+        if self.model_name == "thai2fit_wv":
+            words = [
+                _TK_SP if w == " " else _TK_EOL if w == "\n" else w
+                for w in words
+            ]
+        return [
+            index
+            for index in map(key_to_index.get, words)
+            if index is not None
+        ]
+
+    def sentence_vectorizer_batch(
+        self,
+        texts: Iterable[str],
+        use_mean: bool = True,
+        num_workers: Optional[int] = 1,
+        chunk_size: int = 256,
+    ) -> "NDArray[np.float32]":
+        """Converts many Thai sentences into vectors.
+
+        Gives the same vector as :meth:`sentence_vectorizer` for each text,
+        as one row of a matrix.
+        The word vectors of ``chunk_size`` texts are gathered and summed
+        together, and texts can be tokenized in parallel using a pool of
+        worker processes, see
+        :func:`pythainlp.tokenize.word_tokenize_batch`.
+
+        :param Iterable[str] texts: text inputs
+        :param bool use_mean: if `True` aggregate word vectors with mean of all
+                                 word vectors. Otherwise, aggregate with
+                                 summation of all word vectors
+        :param int num_workers: number of worker processes for tokenization.
+            1 (default) tokenizes in the current process,
+            None uses the number of CPUs.
+        :param int chunk_size: number of texts tokenized by a worker and
+            vectorized at a time
+
+        :return: a :class:`numpy.ndarray` of dtype ``numpy.float32`` and
+               shape ``(number of texts, WV_DIM)``, one row for each text
+        :rtype: numpy.typing.NDArray[numpy.float32]
+
+        :Example:
+
+        >>> from pythainlp.word_vector import WordVector
+        >>>
+        >>> wv = WordVector()
+        >>> texts = ["แมวกินปลา", "หมากินกระดูก", ""]
+        >>> wv.sentence_vectorizer_batch(texts).shape
+        (3, 300)
+        """
+        import numpy as np
+
+        num_workers = _resolve_num_workers(num_workers, chunk_size)
+
+        if num_workers == 1:
+            tokenized: Iterator[list[str]] = map(self.tokenize, texts)
+        else:
+            tokenized = self._tokenize_batch(
+                texts, num_workers=num_workers, chunk_size=chunk_size
+            )
+
+        blocks = []
+        while True:
+            docs = list(islice(tokenized, chunk_size))
+            if not docs:
+                break
+            blocks.append(self._vectorize_docs(docs, use_mean))
+
+        if not blocks:
+            return np.zeros((0, self.WV_DIM), dtype=np.float32)
+        return np.concatenate(blocks)
+
+    def _vectorize_docs(
+        self, docs: list[list[str]], use_mean: bool
+    ) -> "NDArray[np.float32]":
+        import numpy as np
+
+        vecs = np.zeros((len(docs), self.WV_DIM), dtype=np.float32)
+
+        # Vocabulary indexes, one row for each document, padded with -1
+        doc_ids = [self._word_ids(words) for words in docs]
+        max_len = max(map(len, doc_ids))
+        ids = np.full((len(docs), max_len), -1, dtype=np.intp)
+        for i, row in enumerate(doc_ids):
+            ids[i, : len(row)] = row
+
+        # Add the k-th word vector of all documents at once, so each row
+        # is summed in the same order as in sentence_vectorizer()
+        vectors = self.model.vectors
+        for k in range(max_len):
+            found = ids[:, k] >= 0
+            vecs[found] += vectors[ids[found, k]]
+
+        if use_mean:
+            len_words = np.array(
+                [len(words) for words in docs], dtype=np.float32
+            )
+            nonempty = len_words > 0
+            vecs[nonempty] /= len_words[nonempty, np.newaxis]
+
+        return vecs
@@ -0,0 +1,418 @@
+# SPDX-FileCopyrightText: 2016-2026 PyThaiNLP Project
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+"""Approximate nearest-neighbor index of word vectors.
+
+Finding the most similar words by brute force compares a query with
+every vector of the vocabulary. :class:`WordVectorIndex` is an inverted
+file (IVF) index: the unit-length vectors are clustered with spherical
+k-means, and a query is only compared with the vectors of the
+``n_probe`` clusters whose centroids are closest to it.
+The vectors are kept as float16, sorted by cluster, so each cluster is
+one contiguous block of rows. Queries of a batch that probe the same
+cluster are scored together with one matrix product.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Optional
+
+from pythainlp.tools import is_read_only_mode
+from pythainlp.tools.path import _write_atomic
+from pythainlp.word_vector.snapshot import _snapshot_path
+
+if TYPE_CHECKING:
+    import numpy as np
+    from gensim.models.keyedvectors import KeyedVectors
+    from numpy.typing import ArrayLike, NDArray
+
+_FORMAT_VERSION: int = 1
+
+_VECTORS_EXT: str = ".ivf.npy"
+_LISTS_EXT: str = ".ivf.npz"
+
+_CHUNK_SIZE: int = 4096  # rows per matrix product while building
+
+
+def _unit_rows(
+    vectors: "NDArray[np.floating]", dtype: Optional[type] = None
+) -> "NDArray[np.floating]":
+    """Rows scaled to unit length, zero rows are kept as is."""
+    import numpy as np
+
+    out: "NDArray[np.floating]" = np.empty(
+        vectors.shape, dtype=dtype or np.float32
+    )
+    for start in range(0, len(vectors), _CHUNK_SIZE):
+        chunk = np.asarray(vectors[start : start + _CHUNK_SIZE], np.float32)
+        norms = np.linalg.norm(chunk, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        out[start : start + _CHUNK_SIZE] = chunk / norms
+    return out
+
+
+def _assign(
+    vectors: "NDArray[np.floating]", centroids: "NDArray[np.float32]"
+) -> "NDArray[np.intp]":
+    """Index of the closest centroid of each row."""
+    import numpy as np
+
+    labels = np.empty(len(vectors), dtype=np.intp)
+    for start in range(0, len(vectors), _CHUNK_SIZE):
+        chunk = np.asarray(vectors[start : start + _CHUNK_SIZE], np.float32)
+        labels[start : start + _CHUNK_SIZE] = np.argmax(
+            chunk @ centroids.T, axis=1
+        )
+    return labels
+
+
+def _spherical_kmeans(
+    data: "NDArray[np.float32]",
+    n_clusters: int,
+    n_iter: int,
+    rng: "np.random.Generator",
+) -> "NDArray[np.float32]":
+    """Centroids of unit-length rows, as unit-length rows."""
+    import numpy as np
+
+    centroids = data[rng.choice(len(data), n_clusters, replace=False)]
+    for _ in range(n_iter):
+        labels = _assign(data, centroids)
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=n_clusters)
+        starts = np.cumsum(counts) - counts
+        found = counts > 0
+        centroids = np.zeros_like(centroids)
+        centroids[found] = np.add.reduceat(data[order], starts[found], axis=0)
+        # Restart empty clusters from random rows
+        num_empty = n_clusters - int(np.count_nonzero(found))
+        if num_empty:
+            centroids[~found] = data[rng.choice(len(data), num_empty)]
+        centroids = _unit_rows(centroids)
+    return centroids
+
+
+class WordVectorIndex:
+    """Approximate nearest-neighbor index of vectors by cosine similarity.
+
+    Results are approximate in two ways: only the vectors in the
+    ``n_probe`` closest clusters are compared with a query, and
+    similarities are computed from float16 vectors (about three
+    significant digits).
+    With ``n_probe`` equal to ``n_lists``, every vector is compared.
+
+    :param numpy.typing.ArrayLike vectors: matrix of vectors, one row
+        for each word, such as ``KeyedVectors.vectors`` of :mod:`gensim`
+    :param int n_lists: number of clusters, defaults to the square root
+        of the number of vectors
+    :param int n_iter: number of k-means iterations
+    :param int seed: seed of the random number generator of k-means
+
+    :Example:
+
+        >>> import numpy as np
+        >>> from pythainlp.word_vector import WordVectorIndex
+        >>> vectors = np.random.default_rng(0).normal(size=(1000, 50))
+        >>> index = WordVectorIndex(vectors)
+        >>> ids, scores = index.search(vectors[:2], topn=3)
+        >>> ids[:, 0]
+        array([0, 1])
+    """
+
+    def __init__(
+        self,
+        vectors: "ArrayLike",
+        n_lists: Optional[int] = None,
+        n_iter: int = 10,
+        seed: int = 0,
+    ) -> None:
+        import numpy as np
+
+        vectors = np.asarray(vectors)
+        if vectors.ndim != 2 or not len(vectors):
+            raise ValueError("vectors must be a non-empty 2-D matrix.")
+        if n_lists is None:
+            n_lists = max(1, int(len(vectors) ** 0.5))
+        if not 1 <= n_lists <= len(vectors):
+            raise ValueError(
+                "n_lists must be between 1 and the number of vectors."
+            )
+
+        unit = _unit_rows(vectors, np.float16)
+        rng = np.random.default_rng(seed)
+        # Train on a sample, enough for the centroids to settle
+        num_train = min(len(unit), 64 * n_lists)
+        sample = np.sort(rng.choice(len(unit), num_train, replace=False))
+        centroids = _spherical_kmeans(
+            unit[sample].astype(np.float32), n_lists, n_iter, rng
+        )
+
+        labels = _assign(unit, centroids)
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=n_lists)
+
+        self._vectors: NDArray[np.float16] = unit[order]
+        self._ids: NDArray[np.int64] = order.astype(np.int64)
+        self._offsets: NDArray[np.int64] = np.concatenate(
+            ([0], np.cumsum(counts))
+        ).astype(np.int64)
+        self._centroids: NDArray[np.float32] = centroids
+        self._positions: NDArray[np.int64] = self._inverse(self._ids)
+
+    @staticmethod
+    def _inverse(ids: "NDArray[np.int64]") -> "NDArray[np.int64]":
+        import numpy as np
+
+        positions = np.empty_like(ids)
+        positions[ids] = np.arange(len(ids))
+        return positions
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def n_lists(self) -> int:
+        """Number of clusters."""
+        return len(self._centroids)
+
+    def save(self, path: str) -> None:
+        """Save the index, to be loaded later with :meth:`load`.
+
+        Two files are written: ``path + ".ivf.npy"`` with the vectors
+        and ``path + ".ivf.npz"`` with the clusters.
+        Each file is written to a temporary file first and then renamed,
+        so other processes never see a partially written file.
+
+        :param str path: path of the index, without extension
+        """
+        import numpy as np
+
+        _write_atomic(
+            path + _LISTS_EXT,
+            lambda f: np.savez(
+                f,
+                version=np.array(_FORMAT_VERSION),
+                ids=self._ids,
+                offsets=self._offsets,
+                centroids=self._centroids,
+            ),
+        )
+        _write_atomic(
+            path + _VECTORS_EXT,
+            lambda f: np.save(f, self._vectors, allow_pickle=False),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> WordVectorIndex:
+        """Load an index saved with :meth:`save`.
+
+        The vectors are memory-mapped read-only, so processes loading
+        the same index share its memory pages.
+
+        :param str path: path of the index, without extension
+        :return: an index
+        :rtype: pythainlp.word_vector.WordVectorIndex
+        :raises ValueError: if the files are not a valid index
+        """
+        import numpy as np
+
+        with np.load(path + _LISTS_EXT, allow_pickle=False) as lists:
+            if int(lists["version"]) != _FORMAT_VERSION:
+                raise ValueError(
+                    f"{path} has unsupported index file version "
+                    f"{int(lists['version'])}."
+                )
+            ids = lists["ids"]
+            offsets = lists["offsets"]
+            centroids = lists["centroids"]
+        vectors = np.load(
+            path + _VECTORS_EXT, mmap_mode="r", allow_pickle=False
+        )
+        if (
+            vectors.ndim != 2
+            or len(vectors) != len(ids)
+            or offsets[-1] != len(ids)
+            or centroids.shape[1:] != vectors.shape[1:]
+        ):
+            raise ValueError(f"{path} is truncated or corrupted.")
+
+        index = cls.__new__(cls)
+        index._vectors = vectors
+        index._ids = ids
+        index._offsets = offsets
+        index._centroids = centroids
+        index._positions = cls._inverse(ids)
+        return index
+
+    def search(
+        self, queries: "ArrayLike", topn: int = 10, n_probe: int = 16
+    ) -> tuple["NDArray[np.int64]", "NDArray[np.float32]"]:
+        """Find the vectors most similar to each query vector.
+
+        :param numpy.typing.ArrayLike queries: matrix of query vectors,
+            one row for each query
+        :param int topn: number of vectors to find for each query
+        :param int n_probe: number of clusters to look in for each query
+        :return: row indexes of the vectors and their cosine similarity
+            with the query, both of shape ``(number of queries, topn)``,
+            most similar first. If fewer than ``topn`` vectors are found,
+            the rest of the row is filled with index -1 and
+            similarity ``-inf``.
+        :rtype: tuple[numpy.typing.NDArray[numpy.int64],
+            numpy.typing.NDArray[numpy.float32]]
+        """
+        import numpy as np
+
+        queries = _unit_rows(np.atleast_2d(np.asarray(queries)))
+        return self._search(queries, topn, n_probe, None)
+
+    def search_rows(
+        self, rows: "ArrayLike", topn: int = 10, n_probe: int = 16
+    ) -> tuple["NDArray[np.int64]", "NDArray[np.float32]"]:
+        """Find the vectors most similar to vectors of the index.
+
+        Like :meth:`search`, with the vectors at ``rows`` as queries,
+        but a vector is not in its own results.
+
+        :param numpy.typing.ArrayLike rows: row indexes of query vectors
+        :param int topn: number of vectors to find for each query
+        :param int n_probe: number of clusters to look in for each query
+        :return: row indexes of the vectors and their cosine similarity
+            with the query, see :meth:`search`
+        :rtype: tuple[numpy.typing.NDArray[numpy.int64],
+            numpy.typing.NDArray[numpy.float32]]
+        """
+        import numpy as np
+
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.int64))
+        queries = self._vectors[self._positions[rows]].astype(np.float32)
+        return self._search(queries, topn, n_probe, rows)
+
+    def _search(
+        self,
+        queries: "NDArray[np.float32]",
+        topn: int,
+        n_probe: int,
+        exclude: Optional["NDArray[np.int64]"],
+    ) -> tuple["NDArray[np.int64]", "NDArray[np.float32]"]:
+        import numpy as np
+
+        if topn < 1:
+            raise ValueError("topn must be at least 1.")
+        if n_probe < 1:
+            raise ValueError("n_probe must be at least 1.")
+        n_probe = min(n_probe, self.n_lists)
+        num_queries = len(queries)
+        # One more candidate per cluster, in case it is the query itself
+        per_list = topn if exclude is None else topn + 1
+
+        coarse = queries @ self._centroids.T
+        if n_probe < self.n_lists:
+            probes = np.argpartition(-coarse, n_probe - 1, axis=1)
+            probes = probes[:, :n_probe]
+        else:
+            probes = np.broadcast_to(
+                np.arange(self.n_lists), (num_queries, n_probe)
+            )
+
+        # Best candidates of each query in each of its clusters
+        cand_pos: "NDArray[np.int64]" = np.full(
+            (num_queries, n_probe, per_list), -1, np.int64
+        )
+        cand_scores: "NDArray[np.float32]" = np.full(
+            (num_queries, n_probe, per_list), -np.inf, np.float32
+        )
+
+        # Group the (query, probe) pairs by cluster
+        flat = probes.ravel()
+        pairs = np.argsort(flat, kind="stable")
+        bounds = np.searchsorted(flat[pairs], np.arange(self.n_lists + 1))
+        for c in range(self.n_lists):
+            group = pairs[bounds[c] : bounds[c + 1]]
+            start, end = self._offsets[c], self._offsets[c + 1]
+            if not len(group) or start == end:
+                continue
+            q_idx, p_idx = np.divmod(group, n_probe)
+            block = np.asarray(self._vectors[start:end], np.float32)
+            scores = block @ queries[q_idx].T  # (rows in cluster, queries)
+            k = min(per_list, end - start)
+            if k < end - start:
+                top = np.argpartition(-scores, k - 1, axis=0)[:k]
+            else:
+                top = np.broadcast_to(
+                    np.arange(k)[:, np.newaxis], scores.shape
+                )
+            cand_pos[q_idx, p_idx, :k] = (top + start).T
+            cand_scores[q_idx, p_idx, :k] = np.take_along_axis(
+                scores, top, axis=0
+            ).T
+
+        cand_pos = cand_pos.reshape(num_queries, -1)
+        cand_scores = cand_scores.reshape(num_queries, -1)
+        cand_ids = np.where(cand_pos >= 0, self._ids[cand_pos], -1)
+        if exclude is not None:
+            cand_scores[cand_ids == exclude[:, np.newaxis]] = -np.inf
+
+        # Merge the candidates of all clusters, most similar first
+        k = min(topn, cand_scores.shape[1])
+        best = np.argsort(-cand_scores, axis=1, kind="stable")[:, :k]
+        ids = np.take_along_axis(cand_ids, best, axis=1)
+        scores = np.take_along_axis(cand_scores, best, axis=1)
+        ids[np.isneginf(scores)] = -1
+        if k < topn:
+            ids = np.pad(ids, ((0, 0), (0, topn - k)), constant_values=-1)
+            scores = np.pad(
+                scores, ((0, 0), (0, topn - k)), constant_values=-np.inf
+            )
+        return ids, scores
+
+
+def word_vector_index(
+    model_file: str,
+    model: KeyedVectors,
+    snapshot_dir: Optional[str] = None,
+    n_lists: Optional[int] = None,
+) -> WordVectorIndex:
+    """Get the index of a word2vec binary model, built once and saved.
+
+    The first call builds a :class:`WordVectorIndex` of the model and
+    saves it next to the snapshot of the model
+    (see :func:`pythainlp.word_vector.word_vector_snapshot`).
+    Later calls, including ones from other processes, load the saved
+    index. Like a snapshot, the index is rebuilt when the model file is
+    replaced, and is not saved in read-only mode.
+
+    :param str model_file: path of a word2vec binary model
+    :param gensim.models.keyedvectors.KeyedVectors model: the model
+        loaded from ``model_file``
+    :param str snapshot_dir: directory to keep snapshots in,
+        defaults to ``word_vector`` in the PyThaiNLP data directory
+    :param int n_lists: number of clusters, see :class:`WordVectorIndex`.
+        A saved index with a different number of clusters is rebuilt.
+    :return: an index of the vectors of ``model``
+    :rtype: pythainlp.word_vector.WordVectorIndex
+    """
+    path = _snapshot_path(model_file, snapshot_dir)
+    if os.path.isfile(path + _VECTORS_EXT):
+        try:
+            index = WordVectorIndex.load(path)
+            if len(index) == len(model.index_to_key) and (
+                n_lists is None or index.n_lists == n_lists
+            ):
+                return index
+        except (OSError, ValueError, KeyError):
+            pass  # corrupted index, rebuild it
+
+    index = WordVectorIndex(model.vectors, n_lists=n_lists)
+    if is_read_only_mode():
+        return index
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        index.save(path)
+    except OSError:
+        return index  # the index is only a cache, it is still usable
+
+    # Map the saved index, so this process shares the pages too
+    return WordVectorIndex.load(path)
@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2016-2026 PyThaiNLP Project
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+"""Memory-mapped snapshots of word2vec binary models.
+
+Parsing a word2vec binary file reads every vector into memory,
+which is slow for large models and repeated by every process.
+A snapshot keeps the vectors as a NumPy ``.npy`` matrix, the words
+as a JSON list, in the same order, and the attributes of the words
+(such as their counts) as NumPy ``.npz`` arrays. The matrix is memory-mapped
+read-only, so loading is fast and processes using the same model share
+its memory pages.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import zipfile
+from typing import TYPE_CHECKING, BinaryIO, Optional
+
+from pythainlp.tools import get_pythainlp_data_path, is_read_only_mode
+from pythainlp.tools.path import _write_atomic
+
+if TYPE_CHECKING:
+    from gensim.models.keyedvectors import KeyedVectors
+
+_FORMAT_VERSION: int = 2
+
+_SNAPSHOT_DIRNAME: str = "word_vector"
+_VECTORS_EXT: str = ".npy"
+_VOCAB_EXT: str = ".json"
+_ATTRS_EXT: str = ".attrs.npz"
+# Extensions of the files made from a model file, see also index.py
+_SNAPSHOT_EXTS: tuple[str, ...] = (_VECTORS_EXT, _VOCAB_EXT, ".npz")
+
+
+class _DuplicateWordFilter(logging.Filter):
+    """Suppress gensim's 'duplicate word' warnings for word2vec files."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return "duplicate word" not in record.getMessage()
+
+
+def _load_word2vec_format(model_file: str) -> KeyedVectors:
+    from gensim.models import KeyedVectors
+
+    _filter = _DuplicateWordFilter()
+    _gensim_kv_logger = logging.getLogger("gensim.models.keyedvectors")
+    _gensim_kv_logger.addFilter(_filter)
+    try:
+        return KeyedVectors.load_word2vec_format(
+            model_file,
+            binary=True,
+            unicode_errors="ignore",
+        )
+    finally:
+        _gensim_kv_logger.removeFilter(_filter)
+
+
+def save_word_vector_snapshot(model: KeyedVectors, path: str) -> None:
+    """Save word vectors as a snapshot, to be loaded later with
+    :func:`load_word_vector_snapshot`.
+
+    Three files are written: ``path + ".npy"`` with the vectors,
+    ``path + ".json"`` with the words, and ``path + ".attrs.npz"``
+    with the attributes of the words, such as their ``count``
+    (see :meth:`gensim.models.keyedvectors.KeyedVectors.get_vecattr`).
+    Each file is written to a temporary file first and then renamed,
+    so other processes never see a partially written file.
+
+    :param gensim.models.keyedvectors.KeyedVectors model: word vectors
+    :param str path: path of the snapshot, without extension
+    """
+    import numpy as np
+
+    vocab = json.dumps(model.index_to_key, ensure_ascii=False)
+    vectors = np.ascontiguousarray(model.vectors)
+    # Attributes that are Python objects would need pickle, leave them out
+    attrs = {
+        name: arr
+        for name, arr in model.expandos.items()
+        if np.asarray(arr).dtype != object
+    }
+
+    def write_vocab(f: BinaryIO) -> None:
+        f.write(vocab.encode("utf-8"))
+
+    def write_attrs(f: BinaryIO) -> None:
+        np.savez(f, **attrs)
+
+    def write_vectors(f: BinaryIO) -> None:
+        np.save(f, vectors, allow_pickle=False)
+
+    # Vectors last: a snapshot is only used once its vectors exist
+    _write_atomic(path + _VOCAB_EXT, write_vocab)
+    _write_atomic(path + _ATTRS_EXT, write_attrs)
+    _write_atomic(path + _VECTORS_EXT, write_vectors)
+
+
+def load_word_vector_snapshot(path: str) -> KeyedVectors:
+    """Load word vectors saved with :func:`save_word_vector_snapshot`.
+
+    The vectors are memory-mapped read-only, so loading is nearly
+    instant and processes loading the same snapshot share its memory
+    pages.
+
+    :param str path: path of the snapshot, without extension
+    :return: read-only word vectors
+    :rtype: gensim.models.keyedvectors.KeyedVectors
+    :raises ValueError: if the files are not a valid snapshot
+    """
+    import numpy as np
+    from gensim.models import KeyedVectors
+
+    with open(path + _VOCAB_EXT, encoding="utf-8") as f:
+        try:
+            words = json.load(f)
+        except json.JSONDecodeError:
+            raise ValueError(
+                f"{path} is not a word vector snapshot."
+            ) from None
+    vectors = np.load(path + _VECTORS_EXT, mmap_mode="r", allow_pickle=False)
+    try:
+        with np.load(path + _ATTRS_EXT, allow_pickle=False) as attrs_file:
+            attrs = {name: attrs_file[name] for name in attrs_file.files}
+    except zipfile.BadZipFile:
+        raise ValueError(f"{path} is truncated or corrupted.") from None
+    if (
+        not isinstance(words, list)
+        or vectors.ndim != 2
+        or vectors.shape[0] != len(words)
+        or any(arr.shape != (len(words),) for arr in attrs.values())
+    ):
+        raise ValueError(f"{path} is truncated or corrupted.")
+
+    model = KeyedVectors(vectors.shape[1], dtype=vectors.dtype)
+    model.vectors = vectors
+    model.index_to_key = words
+    model.key_to_index = {word: i for i, word in enumerate(words)}
+    model.next_index = len(words)
+    model.expandos = attrs
+    return model
+
+
+def _snapshot_path(model_file: str, snapshot_dir: Optional[str]) -> str:
+    """Path of the snapshot of a model file, without extension."""
+    # Name is unique per source path, file version and snapshot format
+    abs_source = os.path.abspath(model_file)
+    stat = os.stat(abs_source)
+    stem = os.path.splitext(os.path.basename(abs_source))[0]
+    source_id = hashlib.sha256(abs_source.encode("utf-8")).hexdigest()[:8]
+    content_hash = hashlib.sha256(
+        f"{stat.st_size}:{stat.st_mtime_ns}:{_FORMAT_VERSION}".encode()
+    )
+    content_id = content_hash.hexdigest()[:16]
+    if snapshot_dir is None:
+        snapshot_dir = os.path.join(
+            get_pythainlp_data_path(), _SNAPSHOT_DIRNAME
+        )
+    return os.path.join(snapshot_dir, f"{stem}-{source_id}-{content_id}")
+
+
+def word_vector_snapshot(
+    model_file: str, snapshot_dir: Optional[str] = None
+) -> KeyedVectors:
+    """Load a word2vec binary model, via a snapshot.
+
+    The first call parses the model file and saves it as a snapshot
+    (see :func:`save_word_vector_snapshot`). Later calls, including ones
+    from other processes, memory-map the snapshot instead of parsing
+    the model file.
+
+    A snapshot is tied to the size and modification time of the model
+    file, so it is rebuilt automatically when the file is replaced,
+    for example by downloading the model again.
+    Outdated snapshots of the same file are removed.
+    In read-only mode (see :func:`pythainlp.tools.is_read_only_mode`),
+    no snapshot is written and the model file is parsed in memory.
+
+    :param str model_file: path of a word2vec binary model
+    :param str snapshot_dir: directory to keep snapshots in,
+        defaults to ``word_vector`` in the PyThaiNLP data directory
+    :return: word vectors, read-only if loaded from a snapshot
+    :rtype: gensim.models.keyedvectors.KeyedVectors
+
+    :Example:
+
+        >>> from pythainlp.corpus import get_corpus_path
+        >>> from pythainlp.word_vector import word_vector_snapshot
+        >>> path = get_corpus_path("thai2fit_wv")  # doctest: +SKIP
+        >>> model = word_vector_snapshot(path)  # doctest: +SKIP
+        >>> model.vector_size  # doctest: +SKIP
+        300
+    """
+    snapshot_path = _snapshot_path(model_file, snapshot_dir)
+    snapshot_dir = os.path.dirname(snapshot_path)
+    filename = os.path.basename(snapshot_path)
+    prefix = filename[: filename.rindex("-") + 1]
+    read_only = is_read_only_mode()
+
+    if os.path.isfile(snapshot_path + _VECTORS_EXT):
+        try:
+            return load_word_vector_snapshot(snapshot_path)
+        except (OSError, ValueError):
+            pass  # corrupted snapshot, rebuild it
+
+    model = _load_word2vec_format(model_file)
+    if read_only:
+        return model
+
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        save_word_vector_snapshot(model, snapshot_path)
+        for name in os.listdir(snapshot_dir):
+            if (
+                name.startswith(prefix)
+                and not name.startswith(filename)
+                and name.endswith(_SNAPSHOT_EXTS)
+            ):
+                os.remove(os.path.join(snapshot_dir, name))
+    except OSError:
+        return model  # a snapshot is only a cache, the model is usable
+
+    # Map the snapshot, so this process shares the pages too
+    return load_word_vector_snapshot(snapshot_path)
@@ -14,6 +14,7 @@ test_packages: list[str] = [
     "tests.compact.testc_corpus",
     "tests.compact.testc_el",
     "tests.compact.testc_parse",
+    "tests.compact.testc_tag",
     "tests.compact.testc_tokenize",
     "tests.compact.testc_tools",
     "tests.compact.testc_transliterate",
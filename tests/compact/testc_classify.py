@@ -2,6 +2,8 @@
 # SPDX-FileType: SOURCE
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import tempfile
 import unittest
 
 from pythainlp.classify import GzipModel
@@ -28,3 +30,41 @@ class ClsTestCaseC(unittest.TestCase):
         self.assertIsNotNone(model.predict("ฉันดีใจ", k=3))
         # Edge cases: k larger than number of classes
         self.assertIsNotNone(model.predict("ฉันดีใจ", k=10))
+
+    def test_GzipModel_batch_and_binary(self):
+        training_data = [
+            ("บริการแย่มากก เป็นหมอได้ไง😤", "Negative"),
+            ("ขับรถแย่มาก", "Negative"),
+            ("ดีนะครับ", "Positive"),
+            ("ลองแล้วรสนี้อร่อย... ชอบๆ", "Positive"),
+            ("นี่เป็นบทความหนึ่ง", "Neutral"),
+        ]
+        texts = ["ฉันดีใจ", "", "แย่มาก", "บทความ"]
+        model = GzipModel(training_data)
+        expected = [model.predict(text, k=3) for text in texts]
+        self.assertEqual(model.predict_batch(texts, k=3), expected)
+        self.assertEqual(
+            model.predict_batch(texts, k=3, num_workers=2, chunk_size=1),
+            expected,
+        )
+        with self.assertRaises(ValueError):
+            model.predict_batch(texts, num_workers=0)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for compressor in ("gzip", "zlib", "bz2", "lzma"):
+                model = GzipModel(training_data, compressor=compressor)
+                expected = [model.predict(text) for text in texts]
+                for binary in (False, True):
+                    path = os.path.join(temp_dir, f"{compressor}{binary}")
+                    model.save(path, binary=binary)
+                    loaded = GzipModel(model_path=path)
+                    self.assertEqual(loaded.compressor, compressor)
+                    self.assertEqual(loaded.cx2_list, model.cx2_list)
+                    self.assertEqual(
+                        loaded.training_data.tolist(),
+                        model.training_data.tolist(),
+                    )
+                    self.assertEqual(loaded.predict_batch(texts), expected)
+
+        with self.assertRaises(ValueError):
+            GzipModel(training_data, compressor="zip")
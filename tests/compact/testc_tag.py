@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 PyThaiNLP Project
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for pythainlp.tag module."""
+
+import unittest
+
+from pythainlp.tag import PerceptronTagger
+from pythainlp.tag.perceptron import _pud_tagger
+from pythainlp.tokenize import word_tokenize
+
+TEXTS = [
+    "ฉันรักภาษาไทยเพราะฉันเป็นคนไทย",
+    "นายกรัฐมนตรีเดินทางไปประชุมที่กรุงเทพฯ เมื่อวันที่ 12-3 ปี 2024",
+    "แมวกินปลา",
+    "C-3PO พูดภาษาไทยได้ 99 คำ",
+]
+
+
+class PerceptronTaggerTestCaseC(unittest.TestCase):
+    def test_tag_sents(self):
+        tagger = PerceptronTagger()
+        tagger.train(
+            [
+                [("คน", "N"), ("เดิน", "V")],
+                [("แมว", "N"), ("กิน", "V"), ("ปลา", "N")],
+                [("นก", "N"), ("บิน", "V")],
+            ]
+        )
+        sents = [["คน", "กิน", "ปลา"], [], ["นก", "เดิน"], ["แมว"]]
+        expected = [tagger.tag(sent) for sent in sents]
+        self.assertEqual(tagger.tag_sents(sents), expected)
+        self.assertEqual(tagger.tag_sents([]), [])
+
+        # tag() uses the compiled weights until the model changes
+        self.assertIsNotNone(tagger._compiled)
+        self.assertEqual(tagger.tag(["คน", "กิน", "ปลา"]), expected[0])
+        tagger.train([[("คน", "V"), ("ปลา", "V")]])
+        self.assertIsNone(tagger._compiled)
+
+    def test_tag_sents_pretrained(self):
+        tagger = PerceptronTagger()
+        tagger.model = _pud_tagger().model
+        tagger.tagdict = _pud_tagger().tagdict
+        tagger.classes = _pud_tagger().classes
+        sents = [word_tokenize(text) for text in TEXTS]
+        expected = [tagger.tag(sent) for sent in sents]
+        tagger.compile()
+        self.assertEqual(tagger.tag_sents(sents), expected)
+        self.assertEqual([tagger.tag(sent) for sent in sents], expected)
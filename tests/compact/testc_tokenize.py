@@ -61,6 +61,22 @@ class SentTokenizeCRFCutTestCaseC(unittest.TestCase):
             [["ผม", "กิน", "ข้าว", " ", "\n", "เธอ", "เล่น", "เกม"]],
         )
 
+    def test_crfcut_segment_batch(self):
+        from pythainlp.tokenize.crfcut import segment, segment_batch
+
+        texts = [SENT_1, SENT_2, SENT_3, "", "ผมกินข้าว เธอเล่นเกม"]
+        expected = [segment(text) for text in texts]
+        self.assertEqual(expected[3], [])
+        self.assertEqual(list(segment_batch(texts)), expected)
+        self.assertEqual(
+            list(segment_batch(texts, num_workers=2, chunk_size=2)),
+            expected,
+        )
+        with self.assertRaises(ValueError):
+            segment_batch(texts, num_workers=0)
+        with self.assertRaises(ValueError):
+            segment_batch(texts, chunk_size=0)
+
 
 class SubwordTokenizeHanSoloTestCaseC(unittest.TestCase):
     def test_subword_tokenize(self):
@@ -2,15 +2,18 @@
 # SPDX-FileType: SOURCE
 # SPDX-License-Identifier: Apache-2.0
 
+import pickle
 import unittest
 
 from pythainlp.soundex import (
+    PhoneticIndex,
     complete_soundex,
     complete_soundex_similarity,
     lk82,
     metasound,
     prayut_and_somchaip,
     soundex,
+    soundex_batch,
     udom83,
 )
 
@@ -184,3 +187,61 @@ class SoundexTestCase(unittest.TestCase):
         self.assertEqual(metasound("กธ", 2), "ก2")
         self.assertEqual(metasound("กฏ", 2), "ก2")
         self.assertEqual(metasound("กฑ", 2), "ก2")
+
+    def test_soundex_batch(self):
+        words = ["รัก", "ลัก", "บูรณการ", "รัก", "", "vp"]
+        for engine in [
+            "udom83",
+            "lk82",
+            "metasound",
+            "prayut_and_somchaip",
+            "complete_soundex",
+        ]:
+            expected = [soundex(w, engine=engine, length=5) for w in words]
+            self.assertEqual(
+                soundex_batch(words, engine=engine, length=5), expected
+            )
+        self.assertEqual(
+            soundex_batch(iter(words), num_workers=2, chunk_size=2),
+            [soundex(w) for w in words],
+        )
+        self.assertEqual(soundex_batch([]), [])
+        with self.assertRaises(ValueError):
+            soundex_batch(words, num_workers=0)
+        with self.assertRaises(ValueError):
+            soundex_batch(words, chunk_size=0)
+
+    def test_phonetic_index(self):
+        words = ["สมชาย", "สมชัย", "สมศรี", "มานี", "สมชาย", ""]
+        index = PhoneticIndex(words)
+        self.assertEqual(len(index), 4)
+        self.assertIn("สมชาย", index)
+        self.assertNotIn("", index)
+        self.assertEqual(list(index), ["สมชาย", "สมชัย", "สมศรี", "มานี"])
+        self.assertEqual(index.code("สมชาย"), soundex("สมชาย"))
+
+        self.assertEqual(index.candidates("ซมชาย"), ["สมชาย", "สมชัย"])
+        self.assertEqual(index.candidates("กขค"), [])
+        self.assertEqual(index.candidates(""), [])
+
+        ranked = index.search("สมชาย")
+        self.assertEqual([w for w, _ in ranked], ["สมชาย", "สมชัย"])
+        self.assertEqual(ranked[0][1], 1.0)
+        self.assertEqual(
+            ranked[1][1],
+            complete_soundex_similarity(
+                complete_soundex("สมชาย"), complete_soundex("สมชัย")
+            ),
+        )
+        self.assertEqual(index.search("สมชาย", limit=1), ranked[:1])
+        self.assertEqual(index.search("สมชาย", min_similarity=1.0), ranked[:1])
+
+        index.add("ซมชาย")
+        self.assertEqual(index.candidates("สมชาย"), ["สมชาย", "สมชัย", "ซมชาย"])
+
+        index = PhoneticIndex(words, engine="metasound", length=3)
+        self.assertEqual(index.code("มานี"), metasound("มานี", 3))
+        self.assertEqual(
+            pickle.loads(pickle.dumps(index)).candidates("มานี"),
+            index.candidates("มานี"),
+        )
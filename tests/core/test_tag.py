@@ -2,14 +2,20 @@
 # SPDX-FileType: SOURCE
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import os
+import pickle
+import tempfile
 import unittest
 from os import path
+from unittest.mock import patch
 
 from pythainlp.corpus import download
 from pythainlp.tag import (
     NER,
     EntitySpan,
     PerceptronTagger,
+    convert_tagger_model,
     perceptron,
     pos_tag,
     pos_tag_sents,
@@ -96,6 +102,34 @@ class TagTestCase(unittest.TestCase):
             ],
         )
 
+    def test_pos_tag_sents_batch(self):
+        sentences = [
+            ["ผม", "กิน", "ข้าว"],
+            [],
+            ["แมว", "วิ่ง", " ", "(", "2024", ")"],
+            TEST_TOKENS,
+        ] * 3
+        for engine in ("perceptron", "unigram"):
+            for corpus in ("pud", "tdtb", "tud"):
+                expected = [
+                    pos_tag(sent, engine=engine, corpus=corpus)
+                    for sent in sentences
+                ]
+                self.assertEqual(
+                    pos_tag_sents(sentences, engine=engine, corpus=corpus),
+                    expected,
+                )
+        self.assertEqual(
+            pos_tag_sents(
+                sentences, corpus="pud", num_workers=2, chunk_size=5
+            ),
+            [pos_tag(sent, corpus="pud") for sent in sentences],
+        )
+        with self.assertRaises(ValueError):
+            pos_tag_sents(sentences, engine="unigram", corpus="invalid")
+        with self.assertRaises(ValueError):
+            pos_tag_sents(sentences, num_workers=0)
+
     def test_pos_tag_error_handling(self):
         with self.assertRaises(ValueError):
             pos_tag(["ทดสอบ"], engine="invalid_engine", corpus="invalid_corpus")
@@ -224,6 +258,105 @@ class PerceptronTaggerTestCase(unittest.TestCase):
         with self.assertRaises(IOError):
             tagger.load("ptagger_notexistX4AcOcX.pkl")  # file does not exist
 
+    def test_perceptron_tagger_binary_model(self):
+        words = ["ผม", "รัก", "คุณ", "มาก", "ปี", "2021", "C-3PO", "ABC"]
+        sents = [words, words[::-1], words[2:5], ["คน"]]
+        tagger = PerceptronTagger(path=perceptron._TUD_PATH)
+        expected = [tagger.tag(sent) for sent in sents]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bin_path = os.path.join(temp_dir, "tud.bin")
+            self.assertEqual(
+                convert_tagger_model(perceptron._TUD_PATH, bin_path), bin_path
+            )
+            bin_tagger = PerceptronTagger(path=bin_path)
+            self.assertEqual(bin_tagger.classes, tagger.classes)
+            self.assertEqual(bin_tagger.tagdict, tagger.tagdict)
+            self.assertEqual([bin_tagger.tag(s) for s in sents], expected)
+            self.assertEqual(bin_tagger.tag_sents(sents), expected)
+
+            # training goes on from a copy of the memory-mapped weights
+            bin_tagger.train([[("ฟฟฟ", "NOUN"), ("ฮฮฮ", "VERB")]], nr_iter=1)
+            self.assertIsInstance(bin_tagger.model.weights, dict)
+            self.assertEqual(len(bin_tagger.tag(words)), len(words))
+
+    def test_unigram_tagger_binary_model(self):
+        from pythainlp.tag.binary_model import load_unigram_model
+
+        with open(unigram._PUD_PATH, encoding="utf-8-sig") as f:
+            model = json.load(f)
+        words = ["ผม", "รัก", "คุณ", "มาก", "ปี", "2021", "C-3PO", "ABC"]
+        expected = unigram.tag(words, corpus="pud")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bin_path = convert_tagger_model(
+                unigram._PUD_PATH, os.path.join(temp_dir, "pud.bin")
+            )
+            bin_model = load_unigram_model(bin_path)
+            # words are looked up in the model file, not copied to a dict
+            self.assertNotIsInstance(bin_model, dict)
+            self.assertEqual(len(bin_model), len(model))
+            self.assertEqual(bin_model, model)
+            self.assertEqual(pickle.loads(pickle.dumps(bin_model)), model)
+            self.assertNotIn("ฟฟฟฮฮฮ", bin_model)
+            self.assertNotIn(1, bin_model)
+            self.assertIsNone(bin_model.get("\ud800"))
+
+            with patch.object(unigram, "_PUD_TAGGER", bin_model):
+                self.assertEqual(unigram.tag(words, corpus="pud"), expected)
+                self.assertEqual(
+                    unigram.tag_sents([words, words[::-1]], corpus="pud"),
+                    [expected, expected[::-1]],
+                )
+
+    def test_binary_model_resolution(self):
+        from pythainlp.tag.binary_model import (
+            binary_model_path,
+            load_unigram_model,
+            resolve_model_path,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = os.path.join(temp_dir, "unigram.json")
+            with open(json_path, "w", encoding="utf-8") as f:
+                f.write('{"คน": "N", "เดิน": "V"}')
+
+            with patch.dict(os.environ, {"PYTHAINLP_DATA": temp_dir}):
+                self.assertEqual(resolve_model_path(json_path), json_path)
+                bin_path = convert_tagger_model(json_path)
+                self.assertEqual(bin_path, binary_model_path(json_path))
+                self.assertEqual(resolve_model_path(json_path), bin_path)
+                self.assertEqual(
+                    load_unigram_model(bin_path), {"คน": "N", "เดิน": "V"}
+                )
+
+                # the JSON file is only hashed when its size or time changes
+                with patch(
+                    "pythainlp.tag.binary_model._file_hash"
+                ) as file_hash:
+                    self.assertEqual(resolve_model_path(json_path), bin_path)
+                    file_hash.assert_not_called()
+                os.utime(json_path, ns=(0, 0))
+                self.assertEqual(resolve_model_path(json_path), bin_path)
+
+                # a binary model of an older JSON file is ignored
+                with open(json_path, "w", encoding="utf-8") as f:
+                    f.write('{"คน": "N"}')
+                self.assertEqual(resolve_model_path(json_path), json_path)
+
+            with patch.dict(
+                os.environ,
+                {"PYTHAINLP_DATA": temp_dir, "PYTHAINLP_READ_ONLY": "1"},
+            ):
+                with self.assertRaises(PermissionError):
+                    convert_tagger_model(json_path)
+
+            not_model = os.path.join(temp_dir, "list.json")
+            with open(not_model, "w", encoding="utf-8") as f:
+                f.write("[1, 2]")
+            with self.assertRaises(ValueError):
+                convert_tagger_model(not_model, not_model + ".bin")
+
 
 class TagLocationsTestCase(unittest.TestCase):
     """Test pythainlp.tag.locations"""
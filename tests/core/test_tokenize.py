@@ -2,11 +2,18 @@
 # SPDX-FileType: SOURCE
 # SPDX-License-Identifier: Apache-2.0
 
+import io
+import os
 import time
 import unittest
+from collections.abc import Iterator
+from types import ModuleType
+from typing import cast
+from unittest.mock import patch
 
 from pythainlp.tokenize import (
     Tokenizer,
+    WordTokenizeCache,
     display_cell_tokenize,
     etcc,
     longest,
@@ -15,14 +22,19 @@ from pythainlp.tokenize import (
     paragraph_tokenize,
     sent_tokenize,
     subword_tokenize,
+    syllable_dict_trie,
     syllable_tokenize,
     tcc,
     tcc_p,
     word_detokenize,
     word_dict_trie,
+    word_dict_trie_snapshot,
     word_tokenize,
+    word_tokenize_batch,
+    word_tokenize_spans,
+    word_tokenize_stream,
 )
-from pythainlp.util import dict_trie
+from pythainlp.util import DoubleArrayTrie, Trie, dict_trie
 
 from ..test_helpers import assert_segment_handles_none_and_empty
 
@@ -409,6 +421,244 @@ class TokenizeTestCase(unittest.TestCase):
                 "รถไฟฟ้า", custom_dict=dict_trie(["ไฟ"]), engine="icu"
             )
 
+    def test_word_tokenize_cache(self):
+        with self.assertRaises(ValueError):
+            WordTokenizeCache(maxsize=0)
+
+        cache = WordTokenizeCache(maxsize=2)
+        text = "ฉันรักภาษาไทยเพราะฉันเป็นคนไทย"
+        expected = word_tokenize(text)
+        tokens = word_tokenize(text, cache=cache)
+        self.assertEqual(tokens, expected)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        # returned lists are copies
+        tokens.append("x")
+        self.assertEqual(word_tokenize(text, cache=cache), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # options are part of the key
+        self.assertEqual(
+            word_tokenize(text, engine="longest", cache=cache),
+            word_tokenize(text, engine="longest"),
+        )
+        self.assertEqual(cache.misses, 2)
+
+        # least recently used result is dropped
+        word_tokenize("ภาษาไทย", cache=cache)
+        self.assertEqual(len(cache), 2)
+        word_tokenize(text, cache=cache)
+        self.assertEqual(cache.misses, 4)
+
+        # changing a trie invalidates its results
+        trie = dict_trie(["ภาษา", "ไทย"])
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+        self.assertEqual(
+            word_tokenize("ภาษาไทย", custom_dict=trie, cache=cache),
+            ["ภาษา", "ไทย"],
+        )
+        trie.add("ภาษาไทย")
+        self.assertEqual(
+            word_tokenize("ภาษาไทย", custom_dict=trie, cache=cache),
+            ["ภาษาไทย"],
+        )
+        self.assertEqual(cache.hits, 0)
+
+        # changing the default dictionary invalidates its results too
+        text_food = "ฉันชอบกินข้าวมันไก่"
+        default_trie = cast(Trie, word_dict_trie())
+        self.assertNotIn("ฉันชอบกิน", default_trie)
+        before = word_tokenize(text_food, cache=cache)
+        default_trie.add("ฉันชอบกิน")
+        try:
+            after = word_tokenize(text_food, cache=cache)
+            self.assertEqual(after, word_tokenize(text_food))
+            self.assertEqual(after[0], "ฉันชอบกิน")
+            self.assertNotEqual(after, before)
+        finally:
+            default_trie.remove("ฉันชอบกิน")
+        self.assertEqual(word_tokenize(text_food, cache=cache), before)
+
+        # a new trie at the address of a collected one is not confused
+        # with it, as the cache holds no reference to the trie
+        results = set()
+        for words in (["ภาษา"], ["ภาษาไทย"]):
+            results.add(
+                tuple(
+                    word_tokenize(
+                        "ภาษาไทย", custom_dict=dict_trie(words), cache=cache
+                    )
+                )
+            )
+        self.assertEqual(results, {("ภาษา", "ไทย"), ("ภาษาไทย",)})
+
+        # shared between Tokenizer objects and word_tokenize()
+        shared = WordTokenizeCache()
+        tokenizer = Tokenizer(cache=shared)
+        self.assertEqual(tokenizer.word_tokenize(text), expected)
+        self.assertEqual(Tokenizer(cache=shared).word_tokenize(text), expected)
+        self.assertEqual(shared.hits, 1)
+        tokenizer.set_tokenize_engine("longest")
+        self.assertEqual(
+            tokenizer.word_tokenize(text),
+            word_tokenize(text, engine="longest"),
+        )
+        self.assertEqual(shared.hits, 1)
+        self.assertEqual(
+            Tokenizer(custom_dict=["ภาษา"], cache=shared).word_tokenize(text),
+            word_tokenize(text, custom_dict=dict_trie(["ภาษา"])),
+        )
+        self.assertEqual(shared.hits, 1)
+
+    def test_word_tokenize_spans(self):
+        self.assertEqual(len(word_tokenize_spans("")), 0)
+        self.assertEqual(len(word_tokenize_spans(None)), 0)  # type: ignore[arg-type]
+        text = " ราคา 1,234.5 บาท  เวลา 12:00น ที่ 127.0.0.1 "
+        for engine in ("newmm", "newmm-safe", "longest", "mm"):
+            for keep_whitespace in (True, False):
+                for join_broken_num in (True, False):
+                    spans = word_tokenize_spans(
+                        text,
+                        engine=engine,
+                        keep_whitespace=keep_whitespace,
+                        join_broken_num=join_broken_num,
+                    )
+                    self.assertEqual(
+                        [text[s:e] for s, e in zip(spans[::2], spans[1::2])],
+                        word_tokenize(
+                            text,
+                            engine=engine,
+                            keep_whitespace=keep_whitespace,
+                            join_broken_num=join_broken_num,
+                        ),
+                    )
+        self.assertEqual(
+            Tokenizer(custom_dict=["ภาษา", "ไทย"])
+            .word_tokenize_spans("ภาษาไทย")
+            .tolist(),
+            [0, 4, 4, 7],
+        )
+
+        # offsets from the dictionary search, on long text in safe mode
+        # and with Latin words, which the longest engine lowercases
+        for engine, text in (
+            ("newmm-safe", LONG_TEXT),
+            ("newmm", LONG_TEXT),
+            ("longest", "ใช้ iPhone กับ ABC"),
+            ("mm", "ใช้ iPhone กับ ABC"),
+        ):
+            spans = word_tokenize_spans(text, engine=engine)
+            self.assertEqual(
+                [text[s:e].lower() for s, e in zip(spans[::2], spans[1::2])],
+                [
+                    token.lower()
+                    for token in word_tokenize(text, engine=engine)
+                ],
+            )
+
+    def test_word_tokenize_batch(self):
+        texts = [LONG_TEXT, TEXT_1, "", TEXT_2, None] * 3
+        expected = [word_tokenize(text) for text in texts]  # type: ignore[arg-type]
+        self.assertEqual(list(word_tokenize_batch(texts)), expected)  # type: ignore[arg-type]
+        self.assertEqual(
+            list(word_tokenize_batch(iter(texts), num_workers=2, chunk_size=2)),  # type: ignore[arg-type]
+            expected,
+        )
+        self.assertEqual(
+            list(
+                word_tokenize_batch(
+                    ["รถไฟฟ้า"], custom_dict=dict_trie(["ไฟ"]), num_workers=2
+                )
+            ),
+            [word_tokenize("รถไฟฟ้า", custom_dict=dict_trie(["ไฟ"]))],
+        )
+        self.assertEqual(list(word_tokenize_batch([], num_workers=2)), [])
+
+        _tokenizer = Tokenizer(engine="longest", keep_whitespace=False)
+        self.assertEqual(
+            list(_tokenizer.word_tokenize_batch([LONG_TEXT, TEXT_2])),
+            [
+                _tokenizer.word_tokenize(LONG_TEXT),
+                _tokenizer.word_tokenize(TEXT_2),
+            ],
+        )
+
+        with self.assertRaises(ValueError):
+            word_tokenize_batch([TEXT_2], num_workers=0)
+        with self.assertRaises(ValueError):
+            word_tokenize_batch([TEXT_2], chunk_size=0)
+
+    def test_word_tokenize_stream(self):
+        text = (LONG_TEXT + " ") * 5
+        chunks = [text[i : i + 7] for i in range(0, len(text), 7)]
+        for engine in ("newmm", "mm"):
+            expected = word_tokenize(text, engine=engine)
+            self.assertEqual(
+                list(
+                    word_tokenize_stream(
+                        chunks, engine=engine, buffer_size=200
+                    )
+                ),
+                expected,
+            )
+            self.assertEqual(
+                list(
+                    word_tokenize_stream(
+                        io.StringIO(text), engine=engine, buffer_size=200
+                    )
+                ),
+                expected,
+            )
+        self.assertEqual(
+            list(
+                word_tokenize_stream(
+                    chunks, keep_whitespace=False, buffer_size=200
+                )
+            ),
+            word_tokenize(text, keep_whitespace=False),
+        )
+        self.assertEqual(list(word_tokenize_stream([])), [])
+        self.assertEqual(list(word_tokenize_stream(["", ""])), [])
+
+        # Text without a safe cut point is still fully tokenized
+        text = "ฉันรักภาษาไทยเพราะฉันเป็นคนไทย" * 20
+        tokens = list(word_tokenize_stream([text], buffer_size=50))
+        self.assertEqual("".join(tokens), text)
+
+        with self.assertRaises(ValueError):
+            word_tokenize_stream([TEXT_2], buffer_size=0)
+
+    def test_word_tokenize_double_array_trie(self):
+        da_trie = DoubleArrayTrie(word_dict_trie())
+        for engine in ("newmm", "newmm-safe", "longest", "mm"):
+            self.assertEqual(
+                word_tokenize(LONG_TEXT, engine=engine, custom_dict=da_trie),
+                word_tokenize(LONG_TEXT, engine=engine),
+            )
+        self.assertEqual(
+            Tokenizer(da_trie).word_tokenize(LONG_TEXT),
+            word_tokenize(LONG_TEXT),
+        )
+
+    def test_word_dict_trie_snapshot_env(self):
+        trie = word_dict_trie()
+        self.assertIsInstance(trie, Trie)
+        word_dict_trie.cache_clear()
+        syllable_dict_trie.cache_clear()
+        try:
+            with patch.dict(os.environ, {"PYTHAINLP_DICT_SNAPSHOT": "1"}):
+                self.assertIs(word_dict_trie(), word_dict_trie_snapshot())
+                self.assertIsInstance(syllable_dict_trie(), DoubleArrayTrie)
+                self.assertEqual(
+                    word_tokenize(LONG_TEXT),
+                    word_tokenize(LONG_TEXT, custom_dict=trie),
+                )
+        finally:
+            word_dict_trie.cache_clear()
+            syllable_dict_trie.cache_clear()
+        self.assertIsInstance(word_dict_trie(), Trie)
+
     def test_etcc(self):
         assert_segment_handles_none_and_empty(self, etcc.segment)
         self.assertIsInstance(etcc.segment("คืนความสุข"), list)
@@ -615,6 +865,18 @@ class TokenizeTestCase(unittest.TestCase):
         # Should complete in well under 1 second after the BFS fix.
         self.assertLess(elapsed, 5.0)
 
+    def test_newmm_ambiguous_run(self):
+        # The fewest-words segmentation of an ambiguous run does not
+        # depend on how long the run is; there is no graph size cutoff.
+        for n in (1, 5, 60):
+            self.assertEqual(
+                newmm.segment("ด้าน" + "หน้าด้าน" * n),
+                ["ด้าน"] + ["หน้าด้าน"] * n,
+            )
+            self.assertEqual(
+                newmm.segment("ด้านหน้า" * n), ["ด้านหน้า"] * n
+            )
+
     def test_tcc(self):
         assert_segment_handles_none_and_empty(self, tcc.segment)
         self.assertEqual(
@@ -709,6 +971,40 @@ class TokenizeTestCase(unittest.TestCase):
         self.assertEqual(len(arr), len("ประเทศ") + 1)
         self.assertEqual(arr[0], 0)  # position 0 is never a boundary
 
+    def test_tcc_scan_matches_reference(self):
+        def reference_tcc(module: ModuleType, text: str) -> Iterator[str]:
+            # Original implementation: match the rules on each suffix
+            p = 0
+            while p < len(text):
+                m = module._PAT_TCC.match(text[p:])
+                n = m.end() if m else 1
+                yield text[p : p + n]
+                p += n
+
+        texts = [
+            "ประเทศไทย",
+            "เรือน้อยลอยอยู่",
+            "ประกันภัยสัมพันธ์ ABC 123\nเกลียดเปลี่ยน",
+            "เดียว\nเปลี่ยว",
+            "เลย",
+            "เลย\n",
+            "ก็อึหึ แคร์ เพ็ชร์ โต๊ะ เกาะ",
+            "\n\tx y",
+        ]
+        for module in (tcc, tcc_p):
+            for text in texts:
+                expected = list(reference_tcc(module, text))
+                self.assertEqual(list(module.tcc(text)), expected)
+                ends = set()
+                p = 0
+                for w in expected:
+                    p += len(w)
+                    ends.add(p)
+                self.assertEqual(module.tcc_pos(text), ends)
+                arr = module.tcc_pos_array(text)
+                self.assertEqual(len(arr), len(text) + 1)
+                self.assertEqual({i for i, v in enumerate(arr) if v}, ends)
+
     def test_display_cell_tokenize(self):
         self.assertEqual(display_cell_tokenize(""), [])
         self.assertEqual(
@@ -25,6 +25,7 @@ from pythainlp.tools import (
     is_read_only_mode as tools_is_read_only_mode,
 )
 from pythainlp.tools.core import safe_print, warn_deprecation
+from pythainlp.tools.path import _write_atomic
 
 
 class ToolsTestCase(unittest.TestCase):
@@ -294,3 +295,33 @@ class ToolsTestCase(unittest.TestCase):
         with patch.dict(os.environ, {}, clear=False):
             os.environ.pop("PYTHAINLP_ALLOW_UNSAFE_PICKLE", None)
             self.assertFalse(is_unsafe_pickle_allowed())
+
+    def test_write_atomic(self):
+        def write(f):
+            f.write(b"data")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.bin")
+            _write_atomic(path, write)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"data")
+
+            def fail(f):
+                f.write(b"partial")
+                raise RuntimeError("write failed")
+
+            with self.assertRaises(RuntimeError):
+                _write_atomic(path, fail)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"data")
+            self.assertEqual(os.listdir(tmpdir), ["data.bin"])
+
+            if os.name == "posix":
+                # Readable by other users, unlike a temporary file
+                for mask, mode in ((0o022, 0o644), (0o077, 0o600)):
+                    umask = os.umask(mask)
+                    try:
+                        _write_atomic(path, write)
+                    finally:
+                        os.umask(umask)
+                    self.assertEqual(os.stat(path).st_mode & 0o777, mode)
@@ -6,6 +6,8 @@
 """
 
 import os
+import pickle
+import tempfile
 import unittest
 from collections import Counter
 from datetime import date, datetime, time, timedelta, timezone
@@ -13,6 +15,8 @@ from unittest.mock import patch
 
 from pythainlp.corpus import corpus_path, thai_words
 from pythainlp.util import (
+    DoubleArrayTrie,
+    TextPipeline,
     Trie,
     analyze_thai_text,
     arabic_digit_to_thai_digit,
@@ -23,6 +27,7 @@ from pythainlp.util import (
     count_thai_chars,
     countthai,
     dict_trie,
+    dict_trie_snapshot,
     digit_to_text,
     display_thai_char,
     emoji_to_thai,
@@ -37,6 +42,7 @@ from pythainlp.util import (
     longest_common_subsequence,
     nectec_to_ipa,
     normalize,
+    normalize_batch,
     now_reign_year,
     num_to_thaiword,
     num_to_thaiword_float,
@@ -578,6 +584,9 @@ class UtilTestCase(unittest.TestCase):
         trie.add("ทบ")
         self.assertEqual(len(trie), 4)
         self.assertEqual(len(trie.prefixes("ทดสอบ")), 2)
+        self.assertEqual(trie.prefix_ends("ทดสอบ"), [2, 5])
+        self.assertEqual(trie.prefix_ends("xทดสอบ", 1), [3, 6])
+        self.assertEqual(trie.prefix_ends("ทดสอบ", 2), [])
 
         trie.remove("ทบ")
         trie.remove("ทด")
@@ -613,9 +622,107 @@ class UtilTestCase(unittest.TestCase):
         with self.assertRaises(TypeError):
             dict_trie("")
         with self.assertRaises(TypeError):
-            dict_trie(None)  # type: ignore[arg-type]
+            dict_trie(None)  # type: ignore[call-overload]
         with self.assertRaises(TypeError):
-            dict_trie(42)  # type: ignore[arg-type]
+            dict_trie(42)  # type: ignore[call-overload]
+
+    def test_double_array_trie(self):
+        self.assertEqual(len(DoubleArrayTrie([])), 0)
+        self.assertEqual(list(DoubleArrayTrie([])), [])
+        self.assertEqual(DoubleArrayTrie([]).prefixes("ทดสอบ"), [])
+
+        words = ["ทด", "ทดสอบ", "ทดลอง", " ทอผ้า ", "ทด", "Trie", ""]
+        trie = DoubleArrayTrie(words)
+        self.assertEqual(len(trie), 5)
+        self.assertIn("ทด", trie)
+        self.assertIn("ทอผ้า", trie)
+        self.assertNotIn("ทดส", trie)
+        self.assertNotIn("ทดสอบทด", trie)
+        self.assertNotIn("กขค", trie)
+        self.assertNotIn(42, trie)
+        self.assertEqual(
+            list(trie), ["Trie", "ทด", "ทดลอง", "ทดสอบ", "ทอผ้า"]
+        )
+        self.assertEqual(trie.prefixes("ทดสอบ"), ["ทด", "ทดสอบ"])
+        self.assertEqual(trie.prefixes("xทดสอบ", 1), ["ทด", "ทดสอบ"])
+        self.assertEqual(trie.prefixes("ทดลองทอผ้า", 5), ["ทอผ้า"])
+        self.assertEqual(trie.prefix_ends("ทดสอบ"), [2, 5])
+        self.assertEqual(trie.prefix_ends("ทดลองทอผ้า", 5), [10])
+        self.assertEqual(trie.prefix_ends("ทดลองทอผ้า", 10), [])
+        self.assertFalse(hasattr(trie, "add"))
+
+        # Must agree with Trie on a real dictionary
+        words = list(thai_words())[:5000]
+        trie = DoubleArrayTrie(words)
+        ref = Trie(words)
+        self.assertEqual(len(trie), len(ref))
+        self.assertEqual(list(trie), sorted(ref))
+        text = "".join(words[::50])
+        for i in range(len(text)):
+            self.assertEqual(trie.prefixes(text, i), ref.prefixes(text, i))
+            self.assertEqual(
+                trie.prefix_ends(text, i), ref.prefix_ends(text, i)
+            )
+
+        # Immutable, so dict_trie() shares it instead of copying
+        self.assertIs(dict_trie(trie), trie)
+
+    def test_double_array_trie_save_load(self):
+        trie = DoubleArrayTrie(["ทด", "ทดสอบ", "ทดลอง", "Trie"])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.datrie")
+            trie.save(path)
+            loaded = DoubleArrayTrie.load(path)
+            self.assertEqual(len(loaded), 4)
+            self.assertEqual(list(loaded), list(trie))
+            self.assertIn("ทดลอง", loaded)
+            self.assertEqual(loaded.prefixes("ทดสอบ"), ["ทด", "ทดสอบ"])
+            # Memory-mapped trie can be pickled, e.g. for worker processes
+            self.assertEqual(list(pickle.loads(pickle.dumps(loaded))), list(trie))
+            # Release the memory map, so the file can be replaced on Windows
+            del loaded
+
+            DoubleArrayTrie([]).save(path)
+            self.assertEqual(len(DoubleArrayTrie.load(path)), 0)
+
+            bad_path = os.path.join(temp_dir, "bad.datrie")
+            with open(bad_path, "wb") as f:
+                f.write(b"not a trie")
+            with self.assertRaises(ValueError):
+                DoubleArrayTrie.load(bad_path)
+            open(bad_path, "wb").close()
+            with self.assertRaises(ValueError):
+                DoubleArrayTrie.load(bad_path)
+
+    def test_dict_trie_snapshot(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, "words.txt")
+            snapshot_dir = os.path.join(temp_dir, "snapshots")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("ทด\nทดสอบ\n")
+
+            trie = dict_trie_snapshot(source, snapshot_dir)
+            self.assertEqual(list(trie), ["ทด", "ทดสอบ"])
+            self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+            # Second call loads the snapshot
+            trie = dict_trie_snapshot(source, snapshot_dir)
+            self.assertIsInstance(trie._base, memoryview)
+            self.assertEqual(list(trie), ["ทด", "ทดสอบ"])
+            del trie
+
+            # Changed source invalidates and replaces the snapshot
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("ทด\nทดลอง\n")
+            trie = dict_trie_snapshot(source, snapshot_dir)
+            self.assertEqual(list(trie), ["ทด", "ทดลอง"])
+            self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+
+            # Read-only mode never writes a snapshot
+            read_only_dir = os.path.join(temp_dir, "read_only")
+            with patch.dict(os.environ, {"PYTHAINLP_READ_ONLY": "1"}):
+                trie = dict_trie_snapshot(source, read_only_dir)
+            self.assertEqual(list(trie), ["ทด", "ทดลอง"])
+            self.assertFalse(os.path.exists(read_only_dir))
 
     # ### pythainlp.util.normalize
 
@@ -729,6 +836,122 @@ class UtilTestCase(unittest.TestCase):
 
     # ### pythainlp.util.thai
 
+    def test_normalize_batch(self):
+        texts = [
+            "",
+            "สวัสดี ครับ",
+            "\u200b  เเปลก\n\n นํา ",
+            "่ก ุ่ม  กา า  า",
+            "ก\u0e48\u0e49 \u0e48ข",
+            "นๅคา ฤๅษี",
+        ]
+
+        def normalize_step_by_step(text: str) -> str:
+            text = remove_zw(text)
+            text = remove_dup_spaces(text)
+            text = remove_spaces_before_marks(text)
+            text = remove_repeat_vowels(text)
+            return remove_dangling(text)
+
+        expected = [normalize_step_by_step(text) for text in texts]
+        self.assertEqual([normalize(text) for text in texts], expected)
+        self.assertEqual(list(normalize_batch(texts)), expected)
+        self.assertEqual(list(normalize_batch(iter(texts))), expected)
+        self.assertEqual(list(normalize_batch([])), [])
+
+    def test_text_pipeline(self):
+        texts = [
+            "",
+            "เเปลก\u200b ๑๒๓ ก่่อน",
+            "นานาาา  ดีีีี 😀",
+            "เด็กๆชอบไป ๕ โรงเรียน",
+            "อืมมมมมมมมมมมมมมม 0812",
+        ]
+
+        def step_by_step(text: str) -> str:
+            text = remove_zw(text)
+            text = thai_digit_to_arabic_digit(text)
+            text = remove_tonemark(text)
+            text = normalize(text)
+            text = emoji_to_thai(text)
+            text = "".join(expand_maiyamok(text))
+            text = remove_trailing_repeat_consonants(text)
+            return digit_to_text(text)
+
+        pipeline = TextPipeline(
+            [
+                "remove_zw",
+                "thai_digit_to_arabic_digit",
+                "remove_tonemark",
+                "normalize",
+                "emoji_to_thai",
+                "expand_maiyamok",
+                "remove_trailing_repeat_consonants",
+                "digit_to_text",
+            ]
+        )
+        self.assertEqual(
+            pipeline.stage_names,
+            [
+                "remove_zw+thai_digit_to_arabic_digit+remove_tonemark",
+                "normalize",
+                "emoji_to_thai",
+                "expand_maiyamok",
+                "remove_trailing_repeat_consonants",
+                "digit_to_text",
+            ],
+        )
+
+        expected = [step_by_step(text) for text in texts]
+        # the stage keeps the default dictionary it was made with
+        remove_trailing_repeat_consonants("อืมมม", ["อืมมมมม"])
+        self.assertEqual([pipeline(text) for text in texts], expected)
+        self.assertEqual(list(pipeline.run_batch(iter(texts))), expected)
+        self.assertEqual(pipeline.num_texts, 2 * len(texts))
+        timings = pipeline.timings()
+        self.assertEqual([name for name, _ in timings], pipeline.stage_names)
+        self.assertTrue(all(seconds >= 0 for _, seconds in timings))
+        pipeline.reset_timings()
+        self.assertEqual(pipeline.num_texts, 0)
+        self.assertEqual({seconds for _, seconds in pipeline.timings()}, {0.0})
+
+        # digit conversions in both directions merge into one table
+        pipeline = TextPipeline(
+            ["arabic_digit_to_thai_digit", "thai_digit_to_arabic_digit"],
+            timing=False,
+        )
+        self.assertEqual(len(pipeline.stage_names), 1)
+        self.assertEqual(pipeline("ราคา ๑๒ 34"), "ราคา 12 34")
+        self.assertEqual(pipeline.timings(), [(pipeline.stage_names[0], 0.0)])
+
+        pipeline = TextPipeline(["remove_zw", str.upper, "remove_zw"])
+        self.assertEqual(
+            pipeline.stage_names, ["remove_zw", "upper", "remove_zw"]
+        )
+        self.assertEqual(pipeline("a\u200bb"), "AB")
+
+        # making a pipeline keeps the dictionary of earlier calls
+        text = "อืมมมมมมมมมมมมม"
+        self.assertEqual(
+            remove_trailing_repeat_consonants(text, ["อืมมมมม"]), "อืมมมมม"
+        )
+        pipeline = TextPipeline(["remove_trailing_repeat_consonants"])
+        self.assertEqual(pipeline(text), "อืมมม")
+        self.assertEqual(
+            remove_trailing_repeat_consonants(
+                text, has_dictionary_updated=False
+            ),
+            "อืมมมมม",
+        )
+
+        self.assertEqual(TextPipeline([])("ก"), "ก")
+        with self.assertRaises(ValueError):
+            TextPipeline(["no_such_stage"])
+        with self.assertRaises(TypeError):
+            TextPipeline([1])  # type: ignore[list-item]
+        with self.assertRaises(TypeError):
+            pipeline(None)  # type: ignore[arg-type]
+
     def test_countthai(self):
         with self.assertWarns(DeprecationWarning):
             self.assertEqual(countthai(""), 0.0)
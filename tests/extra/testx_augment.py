@@ -5,13 +5,15 @@
 import unittest
 
 import nltk
+import numpy as np
 
 from pythainlp.augment import WordNetAug
 
 # from pythainlp.augment.lm import Thai2transformersAug
 # from pythainlp.augment.lm.phayathaibert import ThaiTextAugmenter
-from pythainlp.augment.word2vec import LTW2VAug
+from pythainlp.augment.word2vec import LTW2VAug, Word2VecAug
 from pythainlp.augment.wordnet import postype2wordnet
+from pythainlp.word_vector import WordVectorIndex
 
 # from pythainlp.augment.word2vec.bpemb_wv import BPEmbAug
 
@@ -46,6 +48,45 @@ class AugmentTestCaseX(unittest.TestCase):
         self.assertIsNotNone(_aug.tokenizer(self.text))
         self.assertIsNotNone(_aug.augment(self.text, n_sent=3, p=0.5))
 
+    def test_Word2VecAug_index(self):
+        from gensim.models import KeyedVectors
+
+        words = ["เรา", "ผม", "ฉัน", "รัก", "ชอบ", "คุณ", "เธอ"]
+        vectors = np.array(
+            [
+                [1, 0, 0],
+                [0.9, 0.1, 0],
+                [0.8, 0.2, 0],
+                [0, 1, 0],
+                [0, 0.9, 0.1],
+                [0, 0, 1],
+                [0.1, 0, 0.9],
+            ],
+            dtype=np.float32,
+        )
+        model = KeyedVectors(3)
+        model.add_vectors(words, vectors)
+        sent = ["เรา", "รัก", "คุณ", "มาก"]
+        _aug = Word2VecAug(model, lambda text: sent, type="model")
+        _index_aug = Word2VecAug(
+            model,
+            lambda text: sent,
+            type="model",
+            index=WordVectorIndex(vectors, n_lists=2),
+        )
+        self.assertEqual(
+            _index_aug.modify_sent(sent, p=0.9),
+            _aug.modify_sent(sent, p=0.9),
+        )
+        self.assertEqual(
+            _index_aug.modify_sent(sent, p=0.9),
+            [["ผม", "ฉัน"], ["ชอบ"], ["เธอ"], ["มาก"]],
+        )
+        self.assertEqual(
+            _index_aug.augment(self.text, n_sent=2, p=0.9),
+            [("ผม", "ชอบ", "เธอ", "มาก"), ("ฉัน", "ชอบ", "เธอ", "มาก")],
+        )
+
     # def test_Thai2transformersAug(self):
     #     _aug = Thai2transformersAug()
     #     self.assertIsNotNone(_aug.augment(self.text2, num_replace_tokens=1))
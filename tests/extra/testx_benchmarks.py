@@ -98,6 +98,64 @@ class BenchmarksTestCaseX(unittest.TestCase):
 
         self.assertIsNotNone(df)
 
+    def test_benchmark_num_workers(self):
+        expected = []
+        actual = []
+        for pair in TEST_DATA["sentences"]:
+            expected.append(pair["expected"])
+            actual.append(pair["actual"])
+
+        df = word_tokenization.benchmark(expected, actual)
+        df_pool = word_tokenization.benchmark(
+            expected, actual, num_workers=2, chunk_size=1
+        )
+        self.assertTrue(df.equals(df_pool))
+
+        with self.assertRaises(ValueError):
+            word_tokenization.benchmark(expected, actual, num_workers=0)
+        with self.assertRaises(ValueError):
+            word_tokenization.benchmark(expected, actual, chunk_size=0)
+
+    def test_benchmark_speed(self):
+        refs = ["ฉัน|รัก|ภาษาไทย", "สวัสดี|ครับ"]
+        texts = ["ฉันรักภาษาไทย", "สวัสดีครับ"]
+
+        df = word_tokenization.benchmark_speed(
+            texts, engines=["newmm"], ref_samples=refs, isolate=False
+        )
+        self.assertEqual(list(df.index), ["newmm"])
+        row = df.loc["newmm"]
+        self.assertEqual(row["texts"], 2)
+        self.assertEqual(row["tokens"], 5)
+        self.assertEqual(row["chars"], sum(len(t) for t in texts))
+        self.assertGreater(row["tokens_per_sec"], 0)
+        self.assertGreater(row["chars_per_sec"], 0)
+        self.assertLessEqual(row["latency_p50_ms"], row["latency_p99_ms"])
+        self.assertAlmostEqual(row["word_level:f1"], 1.0)
+
+        df = word_tokenization.benchmark_speed(texts, engines=["longest"])
+        self.assertEqual(list(df.index), ["longest"])
+        self.assertNotIn("word_level:f1", df.columns)
+
+        with self.assertRaises(ValueError):
+            word_tokenization.benchmark_speed([])
+        with self.assertRaises(ValueError):
+            word_tokenization.benchmark_speed(texts, ref_samples=refs[:1])
+
+    def test_preprocessing_cases(self):
+        cases = {
+            "ผม|ไม่| |ชอบ|": "ผม|ไม่|ชอบ",
+            "<NE>ผม</NE>|||กิน| |": "ผม|กิน",
+            " ฉัน||รัก\n": "ฉัน|รัก",
+        }
+        for txt, expected in cases.items():
+            self.assertEqual(word_tokenization.preprocessing(txt), expected)
+
+        self.assertEqual(
+            word_tokenization.preprocessing("ผม| |ไม่|\n", remove_space=False),
+            "ผม| |ไม่",
+        )
+
     def test_count_correctly_tokenized_words(self):
         for d in TEST_DATA["binary_sentences"]:
             sample = np.array(list(d["actual"])).astype(int)
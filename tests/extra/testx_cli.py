@@ -37,6 +37,21 @@ class CliTestCaseX(unittest.TestCase):
                 )
             )
 
+            self.assertIsNotNone(
+                BenchmarkApp(
+                    [
+                        "thainlp",
+                        "benchmark",
+                        "word-tokenization",
+                        "--test-file",
+                        "./tests/data/test.txt",
+                        "--speed",
+                        "--engines",
+                        "newmm,longest",
+                    ]
+                )
+            )
+
     def test_cli_tokenize(self):
         # Suppress output to keep test log clean
         with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
@@ -4,12 +4,34 @@
 
 import unittest
 
-from pythainlp.soundex.sound import audio_vector, word_approximation
+from pythainlp.soundex.sound import (
+    AudioCandidates,
+    _dst,
+    audio_vector,
+    word2audio,
+    word_approximation,
+)
 
 
 class SoundexTestCaseX(unittest.TestCase):
     def test_word_approximation(self):
         self.assertIsNotNone(word_approximation("รถ", ["รส", "รด", "คน"]))
 
+    def test_word_approximation_candidates(self):
+        words = ["รส", "รด", "คน", "น้ำ"]
+        expected = [
+            _dst.weighted_feature_edit_distance(
+                word2audio("รถ"), word2audio(w)
+            )
+            for w in words
+        ]
+        self.assertEqual(word_approximation("รถ", words), expected)
+
+        candidates = AudioCandidates(words)
+        self.assertEqual(len(candidates), 4)
+        self.assertEqual(word_approximation("รถ", candidates), expected)
+        self.assertEqual(candidates.distances("รถ").tolist(), expected)
+        self.assertEqual(word_approximation("รถ", []), [])
+
     def test_audio_vector(self):
         self.assertIsNotNone(audio_vector("คน"))
@@ -3,8 +3,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unittest
+from typing import cast
 
-from pythainlp.summarize import extract_keywords, summarize
+import numpy as np
+
+from pythainlp.summarize import (
+    DocumentFrequency,
+    extract_keywords,
+    extract_keywords_batch,
+    summarize,
+)
+from pythainlp.summarize.freq import FrequencySummarizer
 
 INPUT_TEXT = (
     "อาหาร หมายถึง ของแข็งหรือของเหลว "
@@ -31,6 +40,64 @@ class SummarizeTestCaseX(unittest.TestCase):
         )
         self.assertIsNotNone(summarize(INPUT_TEXT, 1, engine="XX"))
 
+    def test_summarize_batch(self):
+        texts = [INPUT_TEXT, "", "ฝนตกหนัก น้ำท่วมถนน รถติดมาก"]
+        summarizer = FrequencySummarizer()
+        summaries = list(summarizer.summarize_batch(texts, 1))
+        self.assertEqual(len(summaries), 3)
+        # With one document, all words have the same IDF
+        self.assertEqual(summaries[0], summarize(INPUT_TEXT, n=1))
+        self.assertEqual(summaries[1], [])
+        self.assertEqual(summarizer.doc_freq.num_docs, 3)
+        # Statistics carry over to later calls
+        list(summarizer.summarize_batch(iter(texts), 1, num_workers=2))
+        self.assertEqual(summarizer.doc_freq.num_docs, 6)
+
+    def test_document_frequency(self):
+        doc_freq = DocumentFrequency()
+        doc_freq.add(["ข่าว", "ฝน", "ฝน"])
+        doc_freq.add(["ข่าว", "รถ"])
+        self.assertEqual(doc_freq.num_docs, 2)
+        self.assertEqual(len(doc_freq), 3)
+        self.assertEqual(doc_freq["ข่าว"], 2)
+        self.assertEqual(doc_freq["ฝน"], 1)
+        self.assertEqual(doc_freq["ไม่มี"], 0)
+        self.assertEqual(doc_freq.idf("ข่าว"), 1.0)
+        self.assertGreater(doc_freq.idf("ฝน"), doc_freq.idf("ข่าว"))
+        self.assertGreater(doc_freq.idf("ไม่มี"), doc_freq.idf("ฝน"))
+
+    def test_extract_keywords_batch(self):
+        keywords = list(
+            extract_keywords_batch(
+                [INPUT_TEXT, ""], engine="frequency", max_keywords=5
+            )
+        )
+        self.assertEqual(
+            keywords[0], extract_keywords(INPUT_TEXT, engine="frequency")
+        )
+        self.assertEqual(keywords[1], [])
+
+        # Words in every document rank below words specific to one
+        texts = ["ฝน ฝน ถนน", "รถ ถนน", "ไฟ ถนน"]
+        doc_freq = DocumentFrequency()
+        keywords = list(
+            extract_keywords_batch(
+                texts,
+                engine="frequency",
+                max_keywords=2,
+                stop_words=[],
+                doc_freq=doc_freq,
+                num_workers=2,
+                chunk_size=1,
+            )
+        )
+        self.assertEqual(keywords[2], ["ไฟ", "ถนน"])
+        self.assertEqual(doc_freq.num_docs, 3)
+        self.assertEqual(doc_freq["ถนน"], 3)
+
+        with self.assertRaises(ValueError):
+            extract_keywords_batch(texts, engine="random engine")
+
     def test_keyword_extraction(self):
         self.assertEqual(extract_keywords(""), [])
         self.assertEqual(extract_keywords("   "), [])
@@ -88,3 +155,57 @@ class SummarizeTestCaseX(unittest.TestCase):
         text_short = "เฮลโหล"
         keywords = keybert.extract_keywords(text_short, max_keywords=max_kws)
         self.assertLessEqual(len(keywords), max_kws)
+
+    def test_keybert_batch(self):
+        from pythainlp.summarize.keybert import KeyBERT
+
+        keybert = KeyBERT(cache_size=100)
+        texts = [INPUT_TEXT, "", "เฮลโหล"]
+        expected = [
+            cast(
+                "list[tuple[str, float]]",
+                keybert.extract_keywords(text, return_similarity=True),
+            )
+            for text in texts
+        ]
+        keywords = [
+            cast("list[tuple[str, float]]", kws)
+            for kws in keybert.extract_keywords_batch(
+                texts, return_similarity=True, batch_size=4, chunk_size=2
+            )
+        ]
+        self.assertEqual(len(keywords), len(texts))
+        # Padded batches change the embeddings a little,
+        # so keywords with almost the same score may swap places
+        for kws, expected_kws in zip(keywords, expected):
+            self.assertEqual(len(kws), len(expected_kws))
+            for (_, score), (_, expected_score) in zip(kws, expected_kws):
+                self.assertAlmostEqual(score, expected_score, places=4)
+            scores = dict(kws)
+            expected_scores = dict(expected_kws)
+            for kw in scores.keys() & expected_scores.keys():
+                self.assertAlmostEqual(
+                    scores[kw], expected_scores[kw], places=4
+                )
+        self.assertLessEqual(len(keybert._cache), 100)
+
+        # padded batches give the embeddings of the feature-extraction
+        # pipeline, up to floating point rounding
+        docs = [INPUT_TEXT, "เฮลโหล", "อาหาร", "ร่างกาย"]
+        np.testing.assert_allclose(
+            keybert.embed_batch(docs, batch_size=2),
+            keybert.embed(docs),
+            rtol=1e-4,
+            atol=1e-5,
+        )
+
+        # cached embeddings give the same keywords
+        self.assertEqual(
+            list(keybert.extract_keywords_batch([INPUT_TEXT])),
+            [[kw for kw, _ in keywords[0]]],
+        )
+
+        with self.assertRaises(ValueError):
+            keybert.extract_keywords_batch(texts, keyphrase_ngram_range=(0, 1))
+        with self.assertRaises(ValueError):
+            keybert.extract_keywords_batch(texts, batch_size=0)
@@ -6,7 +6,7 @@
 
 import unittest
 
-from pythainlp.tag import pos_tag, tltk
+from pythainlp.tag import NER, pos_tag, tltk
 from pythainlp.tag.thainer import ThaiNameTagger
 
 
@@ -115,6 +115,28 @@ class TagTestCaseX(unittest.TestCase):
             )
         )
 
+    def test_thai_name_tagger_batch(self):
+        texts = [
+            "วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.",
+            "",
+            "รหัสไปรษณีย์ 19130",
+            "example@gmail.com",
+            "ยาว 20 เซนติเมตร",
+        ]
+        ner = ThaiNameTagger(version="1.4")
+        for pos, tag in [(True, False), (False, False), (False, True)]:
+            self.assertEqual(
+                ner.get_ner_batch(texts, pos=pos, tag=tag),
+                [ner.get_ner(text, pos=pos, tag=tag) for text in texts],
+            )
+        self.assertEqual(ner.get_ner_batch([]), [])
+
+        ner_ = NER(engine="thainer")
+        self.assertEqual(
+            ner_.tag_batch(texts, tag=True),
+            [ner_.tag(text, tag=True) for text in texts],
+        )
+
 
 class TagTLTKTestCaseX(unittest.TestCase):
     """Tests for tltk engine POS tagging and NER"""
@@ -2,9 +2,19 @@
 # SPDX-FileType: SOURCE
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
-from pythainlp.word_vector import WordVector
+import numpy as np
+
+from pythainlp.word_vector import (
+    WordVector,
+    WordVectorIndex,
+    word_vector_index,
+    word_vector_snapshot,
+)
 
 
 class WordVectorTestCaseX(unittest.TestCase):
@@ -61,3 +71,150 @@ class WordVectorTestCaseX(unittest.TestCase):
         self.assertEqual(
             _wv.doesnt_match(["ญี่ปุ่น", "พม่า", "ไอติม"]), "ไอติม"
         )
+
+    def test_sentence_vectorizer_batch(self):
+        _wv = WordVector("thai2fit_wv")
+        texts = [
+            "เสรีภาพในการชุมนุม",
+            "",
+            "เสรีภาพในการรวมตัว\nสมาคม",
+            "I คิด therefore I am ผ็ฎ์",
+        ]
+        for use_mean in (True, False):
+            vecs = _wv.sentence_vectorizer_batch(texts, use_mean=use_mean)
+            self.assertEqual(vecs.shape, (len(texts), _wv.WV_DIM))
+            for text, vec in zip(texts, vecs):
+                self.assertTrue(
+                    np.array_equal(
+                        vec, _wv.sentence_vectorizer(text, use_mean)[0]
+                    )
+                )
+        vecs = _wv.sentence_vectorizer_batch(
+            iter(texts), num_workers=2, chunk_size=1
+        )
+        self.assertTrue(
+            np.array_equal(vecs, _wv.sentence_vectorizer_batch(texts))
+        )
+        self.assertEqual(
+            _wv.sentence_vectorizer_batch([]).shape, (0, _wv.WV_DIM)
+        )
+        with self.assertRaises(ValueError):
+            _wv.sentence_vectorizer_batch(texts, num_workers=0)
+        with self.assertRaises(ValueError):
+            _wv.sentence_vectorizer_batch(texts, chunk_size=0)
+
+    def test_word_vector_snapshot(self):
+        from gensim.models import KeyedVectors
+
+        words = ["แมว", "หมา", "ปลา"]
+        model = KeyedVectors(4)
+        model.add_vectors(
+            words, np.arange(12, dtype=np.float32).reshape(3, 4)
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, "model.bin")
+            snapshot_dir = os.path.join(temp_dir, "snapshots")
+            model.save_word2vec_format(source, binary=True)
+
+            snapshot = word_vector_snapshot(source, snapshot_dir)
+            self.assertEqual(snapshot.index_to_key, words)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 3)
+            # Second call loads the snapshot
+            snapshot = word_vector_snapshot(source, snapshot_dir)
+            self.assertIsInstance(snapshot.vectors, np.memmap)
+            self.assertTrue(np.array_equal(snapshot.vectors, model.vectors))
+            self.assertEqual(snapshot.key_to_index["ปลา"], 2)
+            parsed = KeyedVectors.load_word2vec_format(source, binary=True)
+            for word in words:
+                self.assertEqual(
+                    snapshot.get_vecattr(word, "count"),
+                    parsed.get_vecattr(word, "count"),
+                )
+            self.assertEqual(
+                snapshot.most_similar("แมว"), model.most_similar("แมว")
+            )
+            del snapshot
+
+            # Replaced model file invalidates and replaces the snapshot
+            old_mtime_ns = os.stat(source).st_mtime_ns
+            model.vectors[0] = 1.0
+            model.save_word2vec_format(source, binary=True)
+            # Same size, so make sure the time changes even where file
+            # times are coarse
+            os.utime(source, ns=(old_mtime_ns, old_mtime_ns + 10**9))
+            snapshot = word_vector_snapshot(source, snapshot_dir)
+            self.assertTrue(np.array_equal(snapshot.vectors, model.vectors))
+            self.assertEqual(len(os.listdir(snapshot_dir)), 3)
+            del snapshot
+
+            # Read-only mode never writes a snapshot
+            read_only_dir = os.path.join(temp_dir, "read_only")
+            with patch.dict(os.environ, {"PYTHAINLP_READ_ONLY": "1"}):
+                snapshot = word_vector_snapshot(source, read_only_dir)
+            self.assertEqual(snapshot.index_to_key, words)
+            self.assertFalse(os.path.exists(read_only_dir))
+
+    def test_word_vector_index(self):
+        from gensim.models import KeyedVectors
+
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(500, 20)).astype(np.float32)
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        exact = np.argsort(-(unit[:50] @ unit.T), axis=1)[:, :5]
+
+        index = WordVectorIndex(vectors, n_lists=10)
+        self.assertEqual(len(index), 500)
+        self.assertEqual(index.n_lists, 10)
+        # Looking in all clusters finds the same vectors as brute force
+        ids, scores = index.search(vectors[:50], topn=5, n_probe=10)
+        self.assertEqual(ids.shape, (50, 5))
+        self.assertTrue(np.array_equal(ids, exact))
+        self.assertTrue(
+            np.allclose(
+                scores,
+                np.take_along_axis(unit[:50] @ unit.T, ids, 1),
+                atol=1e-2,
+            )
+        )
+        # A vector is not in its own results
+        ids, _ = index.search_rows(np.arange(50), topn=4, n_probe=10)
+        self.assertTrue(np.array_equal(ids, exact[:, 1:]))
+        ids, _ = index.search_rows([0, 1], topn=4)
+        self.assertEqual(ids.shape, (2, 4))
+        # Fewer vectors than topn
+        ids, scores = WordVectorIndex(vectors[:3], n_lists=1).search_rows(
+            [0], topn=4
+        )
+        self.assertEqual(ids.tolist()[0][2:], [-1, -1])
+        self.assertTrue(np.isneginf(scores[0, 3]))
+        with self.assertRaises(ValueError):
+            index.search(vectors[:1], topn=0)
+        with self.assertRaises(ValueError):
+            WordVectorIndex(vectors, n_lists=501)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index.save(os.path.join(temp_dir, "index"))
+            loaded = WordVectorIndex.load(os.path.join(temp_dir, "index"))
+            self.assertIsInstance(loaded._vectors, np.memmap)
+            self.assertTrue(
+                np.array_equal(
+                    loaded.search_rows([0, 1])[0], index.search_rows([0, 1])[0]
+                )
+            )
+            del loaded
+
+            # Built once and saved next to the snapshot of the model
+            model = KeyedVectors(20)
+            model.add_vectors([f"w{i}" for i in range(500)], vectors)
+            source = os.path.join(temp_dir, "model.bin")
+            snapshot_dir = os.path.join(temp_dir, "snapshots")
+            model.save_word2vec_format(source, binary=True)
+            model = word_vector_snapshot(source, snapshot_dir)
+            index = word_vector_index(source, model, snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 5)
+            index = word_vector_index(source, model, snapshot_dir)
+            self.assertIsInstance(index._vectors, np.memmap)
+            self.assertEqual(index.n_lists, 22)
+            index = word_vector_index(source, model, snapshot_dir, n_lists=5)
+            self.assertEqual(index.n_lists, 5)
+            del index, model